@@ -1,13 +1,17 @@
+import logging
+
+import orjson
 from fastapi import APIRouter
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional
 
-from ...storage import get_storage
+from ...storage import get_async_storage
 from ...core.exceptions import NotFoundError, ConversationError, StorageError
 from ...utils.logging import get_logger, log_with_context
 from ...utils.case_converter import normalize_dict_to_snake, normalize_dict_to_camel
-from ...schemas.conversation import Conversation
+from ...schemas.conversation import Conversation, ConversationUpdate
 
-storage = get_storage()
+storage = get_async_storage()
 logger = get_logger(__name__)
 
 
@@ -18,13 +22,12 @@ router = APIRouter(prefix="/api/conversations", tags=["conversations"])
 async def save_conversation(conversation: Conversation):
     """Save a conversation to persistent storage."""
     try:
-        # Convert Pydantic model to dict and normalize camelCase keys to snake_case
-        conversation_dict = conversation.model_dump()
-        normalized_conversation = normalize_dict_to_snake(conversation_dict, deep=True)
+        # Field names are the snake_case storage keys, so one dump suffices
+        normalized_conversation = conversation.model_dump(by_alias=False)
         
         conversation_id = normalized_conversation.get('id', 'unknown')
         
-        success = storage.save_conversation(normalized_conversation)
+        success = await storage.save_conversation(normalized_conversation)
         if success:
             log_with_context(
                 logger,
@@ -45,23 +48,28 @@ async def save_conversation(conversation: Conversation):
         log_with_context(
             logger,
             'error',
-            f"Error saving conversation: {str(e)}",
+            "Error saving conversation: %s",
+            e,
             exception_type=type(e).__name__
         )
-        raise ConversationError(f"Error saving conversation: {str(e)}")
+        raise ConversationError("Error saving conversation") from e
 
 
 @router.put("/{conversation_id}")
-async def update_conversation(conversation_id: str, conversation: dict):
+async def update_conversation(conversation_id: str, conversation: ConversationUpdate):
     """Update an existing conversation by ID."""
     try:
-        # Normalize camelCase keys to snake_case
-        normalized_conversation = normalize_dict_to_snake(conversation, deep=True)
+        # Top-level keys are already snake_case; only the loosely typed
+        # agent and message entries still need their keys normalized
+        normalized_conversation = conversation.model_dump(exclude_unset=True)
+        for key in ('agents', 'messages'):
+            if normalized_conversation.get(key):
+                normalized_conversation[key] = normalize_dict_to_snake(normalized_conversation[key], deep=True)
         
         # Ensure the id matches
         normalized_conversation['id'] = conversation_id
         
-        success = storage.update_conversation(conversation_id, normalized_conversation)
+        success = await storage.update_conversation(conversation_id, normalized_conversation)
         if success:
             log_with_context(
                 logger,
@@ -82,87 +90,140 @@ async def update_conversation(conversation_id: str, conversation: dict):
         log_with_context(
             logger,
             'error',
-            f"Error updating conversation: {str(e)}",
+            "Error updating conversation: %s",
+            e,
             conversation_id=conversation_id,
             exception_type=type(e).__name__
         )
         raise ConversationError(
             "Error updating conversation",
             conversation_id=conversation_id
-        )
+        ) from e
 
 
 @router.get("")
 async def list_conversations(source: Optional[str] = None):
     """Get all conversations, optionally filtered by source."""
     try:
-        conversations = storage.get_conversations(source)
-        # Convert to camelCase for frontend compatibility
-        conversations = [normalize_dict_to_camel(conv, deep=True) for conv in conversations]
-        log_with_context(
-            logger,
-            'info',
-            "Retrieved conversations",
-            count=len(conversations),
-            source=source
-        )
+        async def load():
+            # Convert to camelCase for frontend compatibility
+            conversations = await storage.get_conversations(source)
+            return [normalize_dict_to_camel(conv, deep=True) for conv in conversations]
+        
+        conversations = await storage.cached(('conversations', source), load)
+        if logger.isEnabledFor(logging.INFO):
+            log_with_context(
+                logger,
+                'info',
+                "Retrieved conversations",
+                count=len(conversations),
+                source=source
+            )
         return {"conversations": conversations}
     except Exception as e:
         log_with_context(
             logger,
             'error',
-            f"Error retrieving conversations: {str(e)}",
+            "Error retrieving conversations: %s",
+            e,
             exception_type=type(e).__name__
         )
         raise StorageError(
             "Error retrieving conversations",
             operation="read"
-        )
+        ) from e
+
+
+@router.get("/stream")
+async def stream_conversations(source: Optional[str] = None):
+    """
+    Stream conversations as newline-delimited JSON (one camelCase object per line).
+    
+    Unlike the list endpoint, conversations are read and sent incrementally,
+    so memory stays bounded for large stores. They arrive in no particular
+    order; clients should sort by importedAt if needed.
+    """
+    async def lines() -> AsyncIterator[bytes]:
+        count = 0
+        try:
+            async for conversation in storage.iter_conversations(source):
+                count += 1
+                yield orjson.dumps(normalize_dict_to_camel(conversation, deep=True)) + b"\n"
+        except Exception as e:
+            # Headers are already sent; end the stream and record why
+            log_with_context(
+                logger,
+                'error',
+                "Error streaming conversations: %s",
+                e,
+                exception_type=type(e).__name__,
+                streamed=count
+            )
+            return
+        if logger.isEnabledFor(logging.INFO):
+            log_with_context(
+                logger,
+                'info',
+                "Streamed conversations",
+                count=count,
+                source=source
+            )
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get("/experiment/{experiment_id}")
 async def get_experiment_conversations(experiment_id: str):
     """Get all conversations for a specific experiment."""
     try:
-        conversations = storage.get_experiment_conversations(experiment_id)
-        # Convert to camelCase for frontend compatibility
-        conversations = [normalize_dict_to_camel(conv, deep=True) for conv in conversations]
-        log_with_context(
-            logger,
-            'info',
-            "Retrieved experiment conversations",
-            experiment_id=experiment_id,
-            count=len(conversations)
-        )
+        async def load():
+            # Convert to camelCase for frontend compatibility
+            conversations = await storage.get_experiment_conversations(experiment_id)
+            return [normalize_dict_to_camel(conv, deep=True) for conv in conversations]
+        
+        conversations = await storage.cached(('experiment_conversations', experiment_id), load)
+        if logger.isEnabledFor(logging.INFO):
+            log_with_context(
+                logger,
+                'info',
+                "Retrieved experiment conversations",
+                experiment_id=experiment_id,
+                count=len(conversations)
+            )
         return {"conversations": conversations}
     except Exception as e:
         log_with_context(
             logger,
             'error',
-            f"Error retrieving experiment conversations: {str(e)}",
+            "Error retrieving experiment conversations: %s",
+            e,
             experiment_id=experiment_id,
             exception_type=type(e).__name__
         )
         raise ConversationError(
             "Error retrieving experiment conversations",
             experiment_id=experiment_id
-        )
+        ) from e
 
 
 @router.get("/{conversation_id}")
 async def get_conversation(conversation_id: str):
     """Get a specific conversation by ID."""
     try:
-        conversation = storage.get_conversation(conversation_id)
-        if conversation:
+        async def load():
+            conversation = await storage.get_conversation(conversation_id)
             # Convert to camelCase for frontend compatibility
-            conversation = normalize_dict_to_camel(conversation, deep=True)
-            log_with_context(
-                logger,
-                'info',
-                "Retrieved conversation",
-                conversation_id=conversation_id
-            )
+            return normalize_dict_to_camel(conversation, deep=True) if conversation else None
+        
+        conversation = await storage.cached(('conversation', conversation_id), load)
+        if conversation:
+            if logger.isEnabledFor(logging.INFO):
+                log_with_context(
+                    logger,
+                    'info',
+                    "Retrieved conversation",
+                    conversation_id=conversation_id
+                )
             return conversation
         else:
             raise NotFoundError(
@@ -176,21 +237,22 @@ async def get_conversation(conversation_id: str):
         log_with_context(
             logger,
             'error',
-            f"Error retrieving conversation: {str(e)}",
+            "Error retrieving conversation: %s",
+            e,
             conversation_id=conversation_id,
             exception_type=type(e).__name__
         )
         raise ConversationError(
             "Error retrieving conversation",
             conversation_id=conversation_id
-        )
+        ) from e
 
 
 @router.delete("/{conversation_id}")
 async def delete_conversation(conversation_id: str):
     """Delete a conversation."""
     try:
-        success = storage.delete_conversation(conversation_id)
+        success = await storage.delete_conversation(conversation_id)
         if success:
             log_with_context(
                 logger,
@@ -211,32 +273,34 @@ async def delete_conversation(conversation_id: str):
         log_with_context(
             logger,
             'error',
-            f"Error deleting conversation: {str(e)}",
+            "Error deleting conversation: %s",
+            e,
             conversation_id=conversation_id,
             exception_type=type(e).__name__
         )
         raise ConversationError(
             "Error deleting conversation",
             conversation_id=conversation_id
-        )
+        ) from e
 
 
 @router.get("/storage/info")
 async def get_storage_info():
     """Get information about stored data."""
     try:
-        info = storage.get_storage_info()
+        info = await storage.get_storage_info()
         logger.info("Retrieved storage info")
         return info
     except Exception as e:
         log_with_context(
             logger,
             'error',
-            f"Error retrieving storage info: {str(e)}",
+            "Error retrieving storage info: %s",
+            e,
             exception_type=type(e).__name__
         )
         raise StorageError(
             "Error retrieving storage info",
             operation="read"
-        )
+        ) from e
  
\ No newline at end of file
@@ -1,36 +1,99 @@
-from fastapi import APIRouter
-from datetime import datetime
+import logging
 
-from ...schemas.experiment import ExperimentRequest
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional
+
+from ...schemas.experiment import ExperimentRequest, ExperimentUpdate
 from ...core.exceptions import ValidationError, NotFoundError, ExperimentError
 from ...services.experiment_service import ExperimentService
 from ...services.conversation_service import ConversationService
 from ...services.autogen_service import autogen_service
-from ...storage import get_storage
+from ...core.state import state_manager
+from ...storage import get_async_storage
+from ...utils.etag import etag_matches, make_etag
+from ...utils.timestamps import utc_now_iso
 from ...utils.logging import get_logger, log_with_context, set_experiment_context
-from ...utils.case_converter import normalize_dict_to_snake
-from ...utils.experiment_helpers import get_experiment_with_fallback, truncate_title, get_experiment_list_with_storage
+from ...utils.experiment_helpers import (
+    get_experiment_with_fallback,
+    iter_experiment_list,
+    stored_experiment_details,
+    truncate_title
+)
 from ...schemas.task import TaskModel
 from ...schemas.agent import AgentModel
 from ...schemas.chat_rules import ChatRulesModel
 from ...schemas.conversation import Conversation
 
-storage = get_storage()
+storage = get_async_storage()
 logger = get_logger(__name__)
 
 
 router = APIRouter(prefix="/api/experiments", tags=["experiments"])
 
+# The defaults never change at runtime, so the response body is encoded once
+_DEFAULT_CHAT_RULES_JSON = orjson.dumps(ChatRulesModel().model_dump())
+_DEFAULT_CHAT_RULES_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+# Encoded list entries are buffered up to about this size before each send
+_LIST_CHUNK_BYTES = 64 * 1024
+
+# Stored experiments in these states no longer change unless edited, which
+# bumps updated_at, so their details can be revalidated by ETag
+_TERMINAL_STATUSES = frozenset({'completed', 'error', 'failed', 'cancelled'})
+# Experiments in these states get their live conversation attached
+_LIVE_STATUSES = frozenset({'running', 'pending'})
+
+
+def _experiment_etag(experiment: dict) -> str:
+    """Strong ETag for a stored experiment record."""
+    version = experiment.get('updated_at') or experiment.get('completed_at') or experiment.get('created_at')
+    return make_etag(f"{experiment.get('id')}:{experiment.get('status')}:{version}".encode())
+
+
+async def _persist_experiment(experiment_metadata: dict) -> None:
+    """
+    Save the initial experiment metadata after the start response is sent.
+    
+    The run may already have finished (and failed to update the record that
+    did not exist yet) by the time this executes, so a terminal in-memory
+    status is copied onto the stored record once it is written.
+    
+    Args:
+        experiment_metadata: Initial metadata record to persist
+    """
+    experiment_id = experiment_metadata['id']
+    try:
+        await storage.save_experiment(experiment_metadata)
+        state = state_manager.get_experiment(experiment_id)
+        if state is not None and state.status != experiment_metadata['status']:
+            updates = {'status': state.status, 'completed_at': state.completed_at or utc_now_iso()}
+            if state.error:
+                updates['error'] = state.error
+            await storage.update_experiment(experiment_id, updates)
+    except Exception as e:
+        log_with_context(
+            logger,
+            'error',
+            "Failed to persist experiment: %s",
+            e,
+            experiment_id=experiment_id,
+            exception_type=type(e).__name__
+        )
+
 
 @router.post("/start", summary="Start a new experiment", description="Create and start a new multi-agent experiment with the specified task and agents.")
-async def start_experiment(request: ExperimentRequest):
+async def start_experiment(request: ExperimentRequest, background_tasks: BackgroundTasks):
     """
     Start a new multi-agent experiment.
     
     This endpoint creates a new experiment with the provided configuration and starts it in the background.
     The experiment will run until completion, error, or timeout.
     
-    Returns the experiment ID and WebSocket URL for real-time updates.
+    Returns the experiment ID and WebSocket URL for real-time updates. The
+    experiment is registered in memory before the response is sent; its
+    metadata is persisted in a background task right after.
     """
     try:
         # Create experiment using service
@@ -39,21 +102,20 @@ async def start_experiment(request: ExperimentRequest):
         # Set experiment context for logging
         set_experiment_context(experiment_id)
         
-        # Persist initial experiment metadata immediately
         # Generate title from task prompt (truncate only if longer than 100 chars)
         title = truncate_title(request.task.prompt)
         
+        # One dump of the request covers the agents, task and iterations
         experiment_metadata = {
             'id': experiment_id,
             'title': title,
             'status': 'running',
-            'created_at': datetime.now().isoformat(),
-            'agents': [agent.model_dump() for agent in request.agents],
-            'task': request.task.model_dump(),
-            'iterations': request.iterations
+            'created_at': utc_now_iso(),
+            **request.model_dump(include={'agents', 'task', 'iterations'})
         }
         
-        storage.save_experiment(experiment_metadata)
+        # Persist metadata after the response is sent
+        background_tasks.add_task(_persist_experiment, experiment_metadata)
         log_with_context(
             logger, 
             'info',
@@ -83,21 +145,61 @@ async def start_experiment(request: ExperimentRequest):
         log_with_context(
             logger,
             'error',
-            f"Unexpected error starting experiment: {str(e)}",
+            "Unexpected error starting experiment: %s",
+            e,
             exception_type=type(e).__name__
         )
-        raise ExperimentError(f"Failed to start experiment: {str(e)}")
+        raise ExperimentError("Failed to start experiment") from e
+
+
+# Registered before /{experiment_id} so the path is not captured as an ID
+@router.get("/default-chat-rules", response_model=ChatRulesModel)
+async def get_default_chat_rules():
+    """Get the default chat rules for an experiment."""
+    return Response(
+        content=_DEFAULT_CHAT_RULES_JSON,
+        media_type="application/json",
+        headers=_DEFAULT_CHAT_RULES_HEADERS
+    )
 
 
 @router.get("/{experiment_id}")
-async def get_experiment(experiment_id: str):
-    """Get experiment details by ID."""
+async def get_experiment(experiment_id: str, request: Request, response: Response):
+    """
+    Get experiment details by ID.
+    
+    Finished experiments carry an ETag; a matching If-None-Match is answered
+    with 304 before their conversations are loaded.
+    """
     try:
         # Set experiment context for logging
         set_experiment_context(experiment_id)
         
-        # Get experiment with fallback to storage
-        experiment_data = get_experiment_with_fallback(experiment_id)
+        if state_manager.get_experiment(experiment_id) is not None:
+            # Active experiment, served from memory
+            experiment_data = await get_experiment_with_fallback(experiment_id)
+        else:
+            if_none_match = request.headers.get('if-none-match')
+            conversations = None
+            if if_none_match is None:
+                # Nothing to revalidate: read the record and its conversations
+                # in one worker call
+                stored_experiment, conversations = await storage.get_experiment_with_conversations(experiment_id)
+            else:
+                # The record alone decides a 304, so conversations are only
+                # read once the body is actually needed
+                stored_experiment = await storage.get_experiment(experiment_id)
+            experiment_data = None
+            if stored_experiment:
+                if stored_experiment.get('status') in _TERMINAL_STATUSES:
+                    etag = _experiment_etag(stored_experiment)
+                    if if_none_match is not None and etag_matches(if_none_match, etag):
+                        return Response(status_code=304, headers={"ETag": etag})
+                    response.headers["ETag"] = etag
+                if conversations is None:
+                    conversations = await storage.get_experiment_conversations(experiment_id)
+                experiment_data = stored_experiment_details(experiment_id, stored_experiment, conversations)
+        
         if not experiment_data:
             raise NotFoundError(
                 "Experiment not found",
@@ -106,17 +208,18 @@ async def get_experiment(experiment_id: str):
             )
         
         # For active experiments, get live conversation from service
-        if experiment_data.get("status") in ["running", "pending"]:
+        if experiment_data.get("status") in _LIVE_STATUSES:
             live_conversation = ConversationService.get_live_conversation(experiment_id)
             experiment_data["conversation"] = live_conversation
         
-        log_with_context(
-            logger,
-            'info',
-            "Retrieved experiment",
-            experiment_id=experiment_id,
-            conversation_count=len(experiment_data.get("conversations", []))
-        )
+        if logger.isEnabledFor(logging.INFO):
+            log_with_context(
+                logger,
+                'info',
+                "Retrieved experiment",
+                experiment_id=experiment_id,
+                conversation_count=len(experiment_data.get("conversations", []))
+            )
         
         return experiment_data
         
@@ -127,33 +230,73 @@ async def get_experiment(experiment_id: str):
         log_with_context(
             logger,
             'error',
-            f"Unexpected error getting experiment: {str(e)}",
+            "Unexpected error getting experiment: %s",
+            e,
             experiment_id=experiment_id,
             exception_type=type(e).__name__
         )
         raise ExperimentError(
             "Failed to retrieve experiment",
             experiment_id=experiment_id
-        )
+        ) from e
 
 
 @router.get("")
-async def list_experiments():
-    """List all experiments."""
+async def list_experiments(
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of stored experiments to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor value from the previous page")
+):
+    """
+    List experiments, newest first. Without ``limit`` every experiment is returned.
+    
+    The JSON body is streamed: entries are encoded and sent as their stored
+    records are read, so large listings are never held in memory whole.
+    """
     try:
-        experiments = get_experiment_list_with_storage()
-        
-        logger.info(f"Listed {len(experiments)} experiments")
-        return {"experiments": experiments}
-        
+        entries, next_cursor = await iter_experiment_list(limit, cursor)
     except Exception as e:
         log_with_context(
             logger,
             'error',
-            f"Unexpected error listing experiments: {str(e)}",
+            "Unexpected error listing experiments: %s",
+            e,
             exception_type=type(e).__name__
         )
-        raise ExperimentError(f"Failed to list experiments: {str(e)}")
+        raise ExperimentError("Failed to list experiments") from e
+    
+    async def body() -> AsyncIterator[bytes]:
+        count = 0
+        chunk = bytearray(b'{"experiments":[')
+        try:
+            async for entry in entries:
+                if count:
+                    chunk += b','
+                chunk += orjson.dumps(entry)
+                count += 1
+                if len(chunk) >= _LIST_CHUNK_BYTES:
+                    yield bytes(chunk)
+                    chunk.clear()
+        except Exception as e:
+            # Headers are already sent; record why, then re-raise so the
+            # server aborts the response instead of ending a truncated body
+            # as if it were complete
+            log_with_context(
+                logger,
+                'error',
+                "Error streaming experiments: %s",
+                e,
+                exception_type=type(e).__name__,
+                streamed=count
+            )
+            raise
+        if limit is None:
+            chunk += b']}'
+        else:
+            chunk += b'],"next_cursor":' + orjson.dumps(next_cursor) + b'}'
+        yield bytes(chunk)
+        logger.info("Listed %d experiments", count)
+    
+    return StreamingResponse(body(), media_type="application/json")
 
 
 @router.delete("/{experiment_id}")
@@ -162,9 +305,13 @@ async def delete_experiment(experiment_id: str):
     try:
         set_experiment_context(experiment_id)
         
-        # Check if experiment exists first
-        experiment_data = get_experiment_with_fallback(experiment_id)
-        if not experiment_data:
+        # Check if experiment exists first; the record alone is enough, its
+        # conversations are removed by the cascade below
+        exists = (
+            state_manager.get_experiment(experiment_id) is not None
+            or await storage.get_experiment(experiment_id) is not None
+        )
+        if not exists:
             raise NotFoundError(
                 "Experiment not found",
                 resource_type="experiment",
@@ -174,22 +321,15 @@ async def delete_experiment(experiment_id: str):
         # Remove from active experiments if running
         ExperimentService.delete_experiment(experiment_id)
         
-        # Get associated conversations before deleting experiment
-        conversations = storage.get_experiment_conversations(experiment_id)
-        
-        # Delete experiment from persistent storage
-        storage.delete_experiment(experiment_id)
-        
-        # Delete associated conversations from storage
-        for conversation in conversations:
-            storage.delete_conversation(conversation['id'])
+        # Delete the experiment and its conversations in one storage call
+        deleted_conversations = await storage.delete_experiment_cascade(experiment_id)
 
         log_with_context(
             logger,
             'info',
             "Deleted experiment and associated data",
             experiment_id=experiment_id,
-            deleted_conversations=len(conversations)
+            deleted_conversations=deleted_conversations
         )
         
         return {"message": "Experiment deleted"}
@@ -200,14 +340,15 @@ async def delete_experiment(experiment_id: str):
         log_with_context(
             logger,
             'error',
-            f"Error deleting experiment: {str(e)}",
+            "Error deleting experiment: %s",
+            e,
             experiment_id=experiment_id,
             exception_type=type(e).__name__
         )
         raise ExperimentError(
             "Failed to delete experiment",
             experiment_id=experiment_id
-        )
+        ) from e
 
 
 @router.put("/{experiment_id}/status")
@@ -222,9 +363,9 @@ async def update_experiment_status(experiment_id: str, status: str):
         # Update in persistent storage
         updates = {'status': status}
         if status == 'completed':
-            updates['completed_at'] = datetime.now().isoformat()
+            updates['completed_at'] = utc_now_iso()
         
-        storage_success = storage.update_experiment(experiment_id, updates)
+        storage_success = await storage.update_experiment(experiment_id, updates)
         if not storage_success:
             raise NotFoundError(
                 "Experiment not found in persistent storage",
@@ -248,31 +389,29 @@ async def update_experiment_status(experiment_id: str, status: str):
         log_with_context(
             logger,
             'error',
-            f"Error updating experiment status: {str(e)}",
+            "Error updating experiment status: %s",
+            e,
             experiment_id=experiment_id,
             exception_type=type(e).__name__
         )
         raise ExperimentError(
             "Failed to update experiment status",
             experiment_id=experiment_id
-        )
+        ) from e
 
 
 @router.put("/{experiment_id}")
-async def update_experiment(experiment_id: str, experiment: dict):
+async def update_experiment(experiment_id: str, experiment: ExperimentUpdate):
     """Update experiment metadata (title, status, etc.) in persistent storage."""
     try:
         set_experiment_context(experiment_id)
         
-        # Normalize camelCase keys to snake_case
-        normalized_experiment = normalize_dict_to_snake(experiment, deep=True)
-        
-        # Extract only updatable fields to prevent overwriting system fields
-        updatable_fields = ['title', 'status', 'completed_at']
-        updates = {k: v for k, v in normalized_experiment.items() if k in updatable_fields}
+        # Only updatable fields survive validation, so system fields in the
+        # payload can never overwrite stored ones
+        updates = experiment.model_dump(exclude_unset=True)
         
         # Update in persistent storage
-        storage_success = storage.update_experiment(experiment_id, updates)
+        storage_success = await storage.update_experiment(experiment_id, updates)
         if not storage_success:
             raise NotFoundError(
                 "Experiment not found in persistent storage",
@@ -296,16 +435,12 @@ async def update_experiment(experiment_id: str, experiment: dict):
         log_with_context(
             logger,
             'error',
-            f"Error updating experiment: {str(e)}",
+            "Error updating experiment: %s",
+            e,
             experiment_id=experiment_id,
             exception_type=type(e).__name__
         )
         raise ExperimentError(
             "Failed to update experiment",
             experiment_id=experiment_id
-        )
-
-@router.get("/default-chat-rules", response_model=ChatRulesModel)
-async def get_default_chat_rules():
-    """Get the default chat rules for an experiment."""
-    return ChatRulesModel()
+        ) from e
@@ -1,53 +1,32 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional, Callable
-import requests
-import json
+from typing import List, Dict, Any, Optional
+import orjson
 import asyncio
-import functools
-from datetime import datetime, UTC
+import httpx
+import time
 
-from ...core.config import settings
+from ...utils.etag import etag_matches, make_etag
 from ...utils.logging import get_logger
 from ...services.pull_manager import pull_manager
 from ...services.model_catalog_service import model_catalog_service
+from ...services import ollama_client
 
 logger = get_logger(__name__)
 
-
-def handle_ollama_errors(func: Callable) -> Callable:
-    """
-    Decorator specifically for handling Ollama-related errors.
-    """
-
-    @functools.wraps(func)
-    async def wrapper(*args, **kwargs) -> Any:
-        try:
-            return await func(*args, **kwargs)
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Ollama error in {func.__name__}: {str(e)}")
-            # Provide more specific error messages for common Ollama issues
-            error_msg = str(e).lower()
-            if "connection" in error_msg or "timeout" in error_msg:
-                raise HTTPException(
-                    status_code=503, detail="Failed to connect to Ollama service"
-                )
-            elif "not found" in error_msg:
-                raise HTTPException(status_code=404, detail="Model not found")
-            else:
-                raise HTTPException(status_code=500, detail="Internal server error")
-
-    return wrapper
+_ACTIVE_PULL_STATUSES = frozenset({"pending", "running"})
+_FINISHED_PULL_STATUSES = frozenset({"completed", "error", "cancelled"})
+# An active pull with no progress for this long no longer blocks a retry
+_STALE_PROGRESS_SECONDS = 60.0
+# Default and maximum page sizes for /pull/page
+_PULL_TASKS_PAGE_SIZE = 50
+_PULL_TASKS_PAGE_MAX = 500
 
 
 router = APIRouter(prefix="/api/models", tags=["models"])
 
-# Ollama server URL - should be configurable
-OLLAMA_URL = getattr(settings, "ollama_url", "http://localhost:11434")
-
 
 class ModelInfo(BaseModel):
     """Information about an installed Ollama model."""
@@ -134,6 +113,15 @@ class PullTaskStatus(BaseModel):
     )
 
 
+class PullTaskPage(BaseModel):
+    """One page of pull tasks, keyed by task ID."""
+
+    tasks: Dict[str, PullTaskStatus] = Field(..., description="Tasks on this page, keyed by task ID")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, or null on the last page", example="task_abc123"
+    )
+
+
 class DeleteModelRequest(BaseModel):
     """Request to delete a model."""
 
@@ -153,63 +141,71 @@ class ModelOperationResponse(BaseModel):
     )
 
 
-def check_ollama_connection():
-    """Check if Ollama is reachable."""
-    try:
-        response = requests.get(f"{OLLAMA_URL}/api/version", timeout=5)
-        return response.status_code == 200
-    except Exception:
-        return False
-
-
-def _serialize_pull_task(task) -> PullTaskStatus:
-    """Serialize a PullTask to PullTaskStatus response model."""
-    return PullTaskStatus(
-        task_id=task.task_id,
-        model_name=task.model_name,
-        status=task.status,
-        progress=task.progress,
-        error=task.error,
-        created_at=task.created_at.isoformat() if task.created_at else None,
-        started_at=task.started_at.isoformat() if task.started_at else None,
-        completed_at=task.completed_at.isoformat() if task.completed_at else None,
-    )
+async def check_ollama_connection() -> bool:
+    """Check if Ollama is reachable (reuses the last answer for a few seconds)."""
+    return await ollama_client.is_reachable(timeout=5)
+
 
+def _pull_task_dict(task) -> Dict[str, Any]:
+    """Serialize a PullTask to the PullTaskStatus shape as a plain dict.
 
-def _serialize_pull_task_for_websocket(task) -> Dict[str, Any]:
-    """Serialize a PullTask to dictionary format for WebSocket messages."""
+    Shared by the status routes, the listing and the WebSocket frames.
+    Timestamps stay datetimes; orjson writes them in the same ISO format
+    as isoformat(), so no strings are built per call.
+    """
     return {
         "task_id": task.task_id,
         "model_name": task.model_name,
         "status": task.status,
         "progress": task.progress,
         "error": task.error,
-        "created_at": task.created_at.isoformat() if task.created_at else None,
-        "started_at": task.started_at.isoformat() if task.started_at else None,
-        "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+        "created_at": task.created_at,
+        "started_at": task.started_at,
+        "completed_at": task.completed_at,
     }
 
 
-def require_ollama_connection(func):
-    """Decorator to check Ollama connection before executing endpoint."""
+def _json_response(payload: Any) -> Response:
+    """Encode a plain payload with orjson and return it as a JSON response."""
+    return Response(content=orjson.dumps(payload), media_type="application/json")
 
-    @functools.wraps(func)
-    async def wrapper(*args, **kwargs):
-        if not check_ollama_connection():
-            raise HTTPException(
-                status_code=503, detail="Ollama service is not available"
-            )
-        return await func(*args, **kwargs)
 
-    return wrapper
+def _sse_frame(event: str, data: Any) -> bytes:
+    """Encode one server-sent event."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
 
+def _pull_status_frame(task) -> str:
+    """Encode a pull task's status WebSocket message."""
+    return orjson.dumps({"type": "status", "data": _pull_task_dict(task)}).decode()
+
+
+async def require_ollama() -> None:
+    """Dependency that rejects the request with 503 while Ollama is unreachable.
+
+    Network errors raised by the endpoint itself are turned into 503
+    responses by the exception middleware.
+    """
+    if not await check_ollama_connection():
+        raise HTTPException(
+            status_code=503, detail="Ollama service is not available"
+        )
 
-@router.get("/list")
-@require_ollama_connection
-@handle_ollama_errors
-async def list_models():
-    """List all installed models."""
-    response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=30)
+
+@router.get("/list", response_model=ListModelsResponse)
+async def list_models(request: Request):
+    """
+    List all installed models.
+
+    Ollama's ``/api/tags`` body already has the ``{"models": [...]}`` shape,
+    so it is relayed as-is instead of being parsed, validated and encoded
+    again; the response model only documents the shape. An ETag over the
+    body lets clients revalidate and get 304 while nothing changed.
+
+    There is no separate reachability probe: a network error on this call
+    is answered with 503 by the exception middleware.
+    """
+    response = await ollama_client.request("GET", "/api/tags", timeout=30)
     if response.status_code != 200:
         error_detail = response.text or "Failed to fetch models from Ollama"
         # Try to provide more specific error messages
@@ -219,22 +215,22 @@ async def list_models():
             error_detail = "Ollama service not found. Please install and start Ollama."
         raise HTTPException(status_code=response.status_code, detail=error_detail)
 
-    data = response.json()
-    return ListModelsResponse(models=data.get("models", []))
+    etag = make_etag(response.content)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=response.content, media_type="application/json", headers=headers)
 
 
-@router.post("/pull")
-@require_ollama_connection
+@router.post("/pull", dependencies=[Depends(require_ollama)])
 async def pull_model(request: PullModelRequest) -> PullModelResponse:
     """Start pulling a model in the background and return task ID."""
     try:
         # Check if model is already being pulled. Allow retry if the existing task
         # appears inactive (no live thread or stale progress).
-        now = datetime.now(UTC)
-        for task in pull_manager.get_all_pull_tasks().values():
-            if task.model_name != request.name:
-                continue
-            if task.status not in ["pending", "running"]:
+        now = time.monotonic()
+        for task in pull_manager.get_pull_tasks_for_model(request.name):
+            if task.status not in _ACTIVE_PULL_STATUSES:
                 continue
 
             # If there's no thread handle or the thread is not alive, consider stale
@@ -243,15 +239,11 @@ async def pull_model(request: PullModelRequest) -> PullModelResponse:
                 and not task.task_handle.is_alive()
             )
 
-            # If we have a last_progress_update timestamp, consider it stale if older than 60s
-            stale_progress = False
-            try:
-                if task.last_progress_update:
-                    age = (now - task.last_progress_update).total_seconds()
-                    if age > 60:
-                        stale_progress = True
-            except Exception:
-                stale_progress = False
+            # Consider it stale if the last progress update is too old
+            stale_progress = (
+                task.last_progress_monotonic is not None
+                and now - task.last_progress_monotonic > _STALE_PROGRESS_SECONDS
+            )
 
             if thread_dead or stale_progress:
                 # Mark the old task as stale/error so it doesn't block the retry
@@ -259,7 +251,7 @@ async def pull_model(request: PullModelRequest) -> PullModelResponse:
                     task.task_id, "Stale or inactive; allowing retry"
                 )
                 logger.info(
-                    f"Existing pull task {task.task_id} for {request.name} marked stale to allow retry"
+                    "Existing pull task %s for %s marked stale to allow retry", task.task_id, request.name
                 )
                 continue
 
@@ -294,42 +286,112 @@ async def pull_model(request: PullModelRequest) -> PullModelResponse:
     except HTTPException:
         # Re-raise HTTPExceptions (they're already properly formatted)
         raise
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error pulling model {request.name}: {e}")
+    except httpx.HTTPError as e:
+        logger.error("Error pulling model %s: %s", request.name, e)
         raise HTTPException(status_code=503, detail=f"Failed to pull model: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error pulling model {request.name}: {e}")
+        logger.error("Unexpected error pulling model %s: %s", request.name, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/pull/{task_id}")
-async def get_pull_status(task_id: str) -> PullTaskStatus:
+# Registered before /pull/{task_id} so "page" is not captured as a task ID
+@router.get("/pull/page", response_model=PullTaskPage)
+async def list_pull_tasks_page(
+    status: Optional[str] = Query(None, description="Only return tasks with this status"),
+    limit: int = Query(_PULL_TASKS_PAGE_SIZE, ge=1, le=_PULL_TASKS_PAGE_MAX, description="Maximum number of tasks to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor value from the previous page")
+):
+    """
+    List pull tasks in creation order, one page at a time.
+
+    The scan stops once ``limit`` matching tasks are collected, and payloads
+    are only built for the returned page, so the work per request is capped
+    however many tasks the manager holds.
+    """
+    tasks, next_cursor = pull_manager.get_pull_tasks_page(limit, cursor, status)
+    return _json_response({
+        "tasks": {task.task_id: _pull_task_dict(task) for task in tasks},
+        "next_cursor": next_cursor
+    })
+
+
+@router.get("/pull/{task_id}", response_model=PullTaskStatus)
+async def get_pull_status(task_id: str):
     """Get the status of a model pull task."""
     task = pull_manager.get_pull_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Pull task not found")
 
-    return _serialize_pull_task(task)
+    return _json_response(_pull_task_dict(task))
 
 
-@router.get("/pull/by-model/{model_name}")
-async def get_pull_by_model(model_name: str) -> Optional[PullTaskStatus]:
+@router.get("/pull/by-model/{model_name}", response_model=PullTaskStatus)
+async def get_pull_by_model(model_name: str):
     """Get the most recent pull task for a specific model."""
-    all_tasks = pull_manager.get_all_pull_tasks()
+    latest_task = pull_manager.get_latest_pull_task_for_model(model_name)
 
-    # Find the most recent task for this model
-    matching_tasks = [
-        task for task in all_tasks.values() if task.model_name == model_name
-    ]
-
-    if not matching_tasks:
+    if latest_task is None:
         raise HTTPException(
             status_code=404, detail=f"No pull task found for model {model_name}"
         )
 
-    # Return the most recently created task
-    latest_task = max(matching_tasks, key=lambda t: t.created_at)
-    return _serialize_pull_task(latest_task)
+    return _json_response(_pull_task_dict(latest_task))
+
+
+@router.get("/pull/{task_id}/events")
+async def stream_pull_events(task_id: str):
+    """
+    Stream pull progress as server-sent events.
+
+    A one-way alternative to the WebSocket: a ``status`` event on connect,
+    ``progress`` events (newest snapshot only, like the WebSocket), and a
+    final ``done`` event carrying the terminal status.
+    """
+    task = pull_manager.get_pull_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Pull task not found")
+
+    loop = asyncio.get_running_loop()
+    pending: Dict[str, Any] = {}
+    wake = asyncio.Event()
+
+    def offer_progress(progress: Dict[str, Any]) -> None:
+        pending["progress"] = progress
+        wake.set()
+
+    def progress_callback(task_id: str, progress: Dict[str, Any]):
+        # Runs on the pull thread for every update, so it only hands off
+        try:
+            loop.call_soon_threadsafe(offer_progress, progress)
+        except RuntimeError:
+            pass
+
+    async def events():
+        finished = pull_manager.get_completion_event(task_id)
+        watcher = asyncio.create_task(finished.wait())
+        watcher.add_done_callback(lambda _: wake.set())
+        pull_manager.register_progress_callback(task_id, progress_callback)
+        try:
+            yield _sse_frame("status", _pull_task_dict(task))
+            while True:
+                await wake.wait()
+                wake.clear()
+                progress = pending.pop("progress", None)
+                if progress is not None:
+                    yield _sse_frame("progress", progress)
+                if finished.is_set():
+                    yield _sse_frame("done", _pull_task_dict(task))
+                    return
+        finally:
+            pull_manager.unregister_progress_callback(task_id, progress_callback)
+            watcher.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Proxies such as nginx must pass events through as they are written
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/pull/{task_id}/health")
@@ -348,7 +410,7 @@ async def cancel_pull_task(task_id: str) -> ModelOperationResponse:
     if not task:
         raise HTTPException(status_code=404, detail="Pull task not found")
 
-    if task.status not in ["pending", "running"]:
+    if task.status not in _ACTIVE_PULL_STATUSES:
         raise HTTPException(
             status_code=400, detail=f"Cannot cancel task with status '{task.status}'"
         )
@@ -377,20 +439,25 @@ async def dismiss_pull_task(task_id: str) -> ModelOperationResponse:
         else:
             raise HTTPException(status_code=500, detail="Failed to remove pull task")
     except Exception as e:
-        logger.exception(f"Failed to dismiss pull task {task_id}: {e}")
+        logger.exception("Failed to dismiss pull task %s: %s", task_id, e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/pull")
-async def list_pull_tasks() -> Dict[str, PullTaskStatus]:
-    """List all model pull tasks."""
-    tasks = pull_manager.get_all_pull_tasks()
-    result = {}
-
-    for task_id, task in tasks.items():
-        result[task_id] = _serialize_pull_task(task)
+@router.get("/pull", response_model=Dict[str, PullTaskStatus])
+async def list_pull_tasks(
+    status: Optional[str] = Query(None, description="Only return tasks with this status")
+):
+    """
+    List every (matching) model pull task in creation order, keyed by task ID.
 
-    return result
+    The WebUI relies on seeing every task here, so this listing stays
+    unbounded; finished tasks are pruned by the cleanup service. Use
+    ``/pull/page`` for capped, cursor-paginated listings. The response is
+    returned directly, so the plain task dicts go straight to orjson
+    instead of through a validated model per task.
+    """
+    tasks, _ = pull_manager.get_pull_tasks_page(None, None, status)
+    return _json_response({task.task_id: _pull_task_dict(task) for task in tasks})
 
 
 @router.websocket("/ws/pull/{task_id}")
@@ -405,140 +472,124 @@ async def websocket_pull_progress(websocket: WebSocket, task_id: str):
         return
 
     # Send initial status
-    await websocket.send_text(
-        json.dumps({"type": "status", "data": _serialize_pull_task_for_websocket(task)})
-    )
+    await websocket.send_text(_pull_status_frame(task))
 
-    # Get the current event loop for the callback
+    # Progress arrives on the pull thread, often much faster than a client
+    # needs it. Each update only replaces the pending snapshot; a sender
+    # task wakes up and sends the newest one, so a burst becomes one frame.
     loop = asyncio.get_running_loop()
+    pending: Dict[str, Any] = {}
+    progress_ready = asyncio.Event()
+
+    def offer_progress(progress: Dict[str, Any]) -> None:
+        pending["progress"] = progress
+        progress_ready.set()
+
+    async def send_progress() -> None:
+        try:
+            while True:
+                await progress_ready.wait()
+                progress_ready.clear()
+                progress = pending.pop("progress", None)
+                if progress is not None:
+                    await websocket.send_text(
+                        orjson.dumps({"type": "progress", "data": progress}).decode()
+                    )
+        except (WebSocketDisconnect, RuntimeError) as e:
+            # The receive loop notices the disconnect and cleans up
+            logger.debug("Stopped sending progress for task %s: %s", task_id, e)
 
-    # Register progress callback
     def progress_callback(task_id: str, progress: Dict[str, Any]):
-        logger.info(f"Sending progress update for task {task_id}: {progress}")
+        # Runs on the pull thread for every update, so it only hands off
         try:
-            asyncio.run_coroutine_threadsafe(
-                websocket.send_text(json.dumps({"type": "progress", "data": progress})),
-                loop,
-            )
-        except Exception as e:
-            logger.error(f"Error sending progress update for task {task_id}: {e}")
+            loop.call_soon_threadsafe(offer_progress, progress)
+        except RuntimeError:
+            # The loop is gone; the connection is being torn down
+            pass
 
+    sender = asyncio.create_task(send_progress())
     pull_manager.register_progress_callback(task_id, progress_callback)
 
+    # Sleep until the client sends something (a ping) or the task finishes;
+    # nothing wakes this connection up while the pull is just running.
+    receive = asyncio.create_task(websocket.receive_text())
+    finished = asyncio.create_task(pull_manager.get_completion_event(task_id).wait())
     try:
-        # Keep connection alive and listen for status changes
         while True:
-            try:
-                # Wait for any message or timeout
-                await asyncio.wait_for(websocket.receive_text(), timeout=1.0)
+            done, _ = await asyncio.wait(
+                {receive, finished}, return_when=asyncio.FIRST_COMPLETED
+            )
 
-                # Send current status on any message (ping)
-                current_task = pull_manager.get_pull_task(task_id)
-                if current_task:
-                    await websocket.send_text(
-                        json.dumps(
-                            {
-                                "type": "status",
-                                "data": _serialize_pull_task_for_websocket(
-                                    current_task
-                                ),
-                            }
-                        )
-                    )
+            if finished in done:
+                # Send final status and exit
+                await websocket.send_text(_pull_status_frame(task))
+                break
 
-                    # If task is completed, we can close the connection
-                    if current_task.status in ["completed", "error", "cancelled"]:
-                        break
-
-            except asyncio.TimeoutError:
-                # Check if task is completed during timeout
-                current_task = pull_manager.get_pull_task(task_id)
-                if current_task and current_task.status in [
-                    "completed",
-                    "error",
-                    "cancelled",
-                ]:
-                    # Send final status and exit
-                    await websocket.send_text(
-                        json.dumps(
-                            {
-                                "type": "status",
-                                "data": _serialize_pull_task_for_websocket(
-                                    current_task
-                                ),
-                            }
-                        )
-                    )
-                    break
-                # Continue listening if task is still running
+            # Raises WebSocketDisconnect once the client has gone
+            receive.result()
+
+            # Send current status on any message (ping). The manager updates
+            # the task object in place, so the reference taken at connect
+            # time is always current.
+            await websocket.send_text(_pull_status_frame(task))
+
+            # If task is completed, we can close the connection
+            if task.status in _FINISHED_PULL_STATUSES:
+                break
+
+            receive = asyncio.create_task(websocket.receive_text())
 
     except WebSocketDisconnect:
-        logger.debug(f"WebSocket disconnected for pull task {task_id}")
+        logger.debug("WebSocket disconnected for pull task %s", task_id)
     finally:
-        # Unregister callback
-        pull_manager.unregister_progress_callback(task_id)
+        # Unregister this connection's callback (other listeners keep theirs)
+        # and stop the progress sender and waiters
+        pull_manager.unregister_progress_callback(task_id, progress_callback)
+        sender.cancel()
+        receive.cancel()
+        finished.cancel()
 
 
 @router.get("/version")
-@require_ollama_connection
-@handle_ollama_errors
 async def get_version():
-    """Get Ollama version information."""
-    response = requests.get(f"{OLLAMA_URL}/api/version", timeout=10)
-    if response.status_code != 200:
-        raise HTTPException(
-            status_code=response.status_code, detail="Failed to get version"
-        )
+    """Get Ollama version information (served from the client's TTL cache)."""
+    return await ollama_client.get_version(timeout=10)
 
-    return response.json()
 
-
-@router.delete("/delete/{model_name}")
-@require_ollama_connection
+@router.delete("/delete/{model_name}", dependencies=[Depends(require_ollama)])
 async def delete_model(model_name: str) -> ModelOperationResponse:
     """Delete a model from Ollama."""
-    try:
-        # Check if model exists
-        list_response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=30)
-        if list_response.status_code != 200:
-            raise HTTPException(
-                status_code=500, detail="Failed to verify model existence"
-            )
-
-        models_data = list_response.json()
-        model_exists = any(
-            model["name"] == model_name for model in models_data.get("models", [])
-        )
-        if not model_exists:
-            raise HTTPException(status_code=404, detail=f"Model {model_name} not found")
-
-        # Delete the model
-        delete_response = requests.delete(
-            f"{OLLAMA_URL}/api/delete", json={"name": model_name}, timeout=60
-        )
-
-        if delete_response.status_code not in [200, 204]:
-            error_msg = delete_response.text or "Failed to delete model"
-            raise HTTPException(
-                status_code=delete_response.status_code, detail=error_msg
-            )
+    # Ollama answers 404 for unknown models, so no separate existence check
+    delete_response = await ollama_client.request(
+        "DELETE", "/api/delete", json={"name": model_name}, timeout=60
+    )
 
-        return ModelOperationResponse(
-            success=True, message=f"Model {model_name} deleted successfully"
+    if delete_response.status_code == 404:
+        raise HTTPException(status_code=404, detail=f"Model {model_name} not found")
+    if delete_response.status_code not in (200, 204):
+        error_msg = delete_response.text or "Failed to delete model"
+        raise HTTPException(
+            status_code=delete_response.status_code, detail=error_msg
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting model {model_name}: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return ModelOperationResponse(
+        success=True, message=f"Model {model_name} deleted successfully"
+    )
 
 
 @router.get("/catalog")
-async def get_model_catalog():
-    """Get curated model catalog."""
-    catalog = model_catalog_service.get_catalog()
-    return {"models": catalog}
+async def get_model_catalog(request: Request):
+    """
+    Get curated model catalog.
+
+    The body is encoded once per catalog version and carries an ETag;
+    clients revalidate on every request and get 304 while it is unchanged.
+    """
+    body, etag = model_catalog_service.get_catalog_json()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/catalog/update")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import StreamingResponse, JSONResponse
-import httpx
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+import orjson
 
 from ...utils.logging import get_logger
 from ...services import ollama_client
@@ -22,38 +23,34 @@ async def proxy_generate(request: Request):
     except Exception:
         raise HTTPException(status_code=400, detail='Invalid JSON body')
 
-    # Use the ollama_client stream helper which yields byte chunks
+    # Start the upstream request first so an Ollama error can still be
+    # reported as a 502 before any of the streamed response is sent
     try:
-        # Probe upstream quickly to surface obvious errors before we start streaming
-        try:
-            status = await ollama_client.probe('/api/generate', method='POST', json_body=body, timeout=2.0)
-        except Exception as e:
-            logger.error(f'Probe to Ollama failed: {e}')
-            raise HTTPException(status_code=502, detail='Failed to contact Ollama')
-
-        if status >= 400:
-            logger.error(f'Ollama returned status {status} for /api/generate')
-            raise HTTPException(status_code=502, detail='Ollama returned error for generate')
-
-        gen = await ollama_client.stream('/api/generate', method='POST', json_body=body, headers={'Content-Type': 'application/json'})
-
-        async def safe_gen():
-            try:
-                async for chunk in gen:
-                    yield chunk
-            except Exception as e:
-                logger.error(f'Error while streaming from Ollama: {e}')
-                # Stop streaming and surface a 502 to the client
-                # Raising here happens after headers were sent; log and stop iteration
-                return
-
-        return StreamingResponse(safe_gen(), media_type='application/x-ndjson')
-    except HTTPException:
-        raise
+        resp, chunks, close = await ollama_client.open_stream(
+            '/api/generate', method='POST', json_body=body, headers={'Content-Type': 'application/json'}
+        )
     except Exception as e:
-        logger.error(f'Failed to proxy generate to Ollama: {e}')
+        logger.error('Failed to proxy generate to Ollama: %s', e)
         raise HTTPException(status_code=502, detail='Failed to contact Ollama')
 
+    if resp.status_code >= 400:
+        await close()
+        logger.error('Ollama returned status %s for /api/generate', resp.status_code)
+        raise HTTPException(status_code=502, detail='Ollama returned error for generate')
+
+    async def safe_gen():
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            # Headers are already sent, so log and end the stream
+            logger.error('Error while streaming from Ollama: %s', e)
+        finally:
+            await close()
+
+    # The background close also covers a client that leaves before the body starts
+    return StreamingResponse(safe_gen(), media_type='application/x-ndjson', background=BackgroundTask(close))
+
 
 @router.post('/api/ollama/test/list')
 async def proxy_test_list(request: Request):
@@ -74,17 +71,18 @@ async def proxy_test_list(request: Request):
 
     url = endpoint.rstrip('/') + '/api/tags'
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(url)
-            # Propagate upstream error codes as 502 so caller knows it's an upstream problem
-            if resp.status_code >= 400:
-                logger.error(f'Upstream Ollama returned {resp.status_code} for {url}: {resp.text}')
-                raise HTTPException(status_code=502, detail='Failed to fetch models from Ollama')
-            return JSONResponse(content=resp.json())
+        resp = await ollama_client.get_url(url, timeout=10.0)
+        # Propagate upstream error codes as 502 so caller knows it's an upstream problem
+        if resp.status_code >= 400:
+            logger.error('Upstream Ollama returned %s for %s: %s', resp.status_code, url, resp.text)
+            raise HTTPException(status_code=502, detail='Failed to fetch models from Ollama')
+        # Validate the upstream body is JSON, then pass its bytes through as-is
+        orjson.loads(resp.content)
+        return Response(content=resp.content, media_type='application/json')
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Error proxying list to {url}: {e}')
+        logger.error('Error proxying list to %s: %s', url, e)
         raise HTTPException(status_code=502, detail='Failed to contact Ollama')
 
 
@@ -107,14 +105,15 @@ async def test_version_proxy(request: Request):
 
     url = endpoint.rstrip('/') + '/api/version'
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(url)
-            if resp.status_code >= 400:
-                logger.error(f'Upstream Ollama returned {resp.status_code} for {url}: {resp.text}')
-                raise HTTPException(status_code=502, detail='Failed to fetch version from Ollama')
-            return JSONResponse(content=resp.json())
+        resp = await ollama_client.get_url(url, timeout=5.0)
+        if resp.status_code >= 400:
+            logger.error('Upstream Ollama returned %s for %s: %s', resp.status_code, url, resp.text)
+            raise HTTPException(status_code=502, detail='Failed to fetch version from Ollama')
+        # Validate the upstream body is JSON, then pass its bytes through as-is
+        orjson.loads(resp.content)
+        return Response(content=resp.content, media_type='application/json')
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f'Error proxying version to {url}: {e}')
+        logger.error('Error proxying version to %s: %s', url, e)
         raise HTTPException(status_code=502, detail='Failed to contact Ollama')
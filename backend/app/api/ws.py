@@ -1,11 +1,13 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 import asyncio
-import json
+import orjson
 
 from ..core.state import state_manager
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
+
+_FINISHED_STATUSES = frozenset({'completed', 'error'})
 router = APIRouter()
 
 
@@ -21,10 +23,10 @@ async def websocket_endpoint(websocket: WebSocket, experiment_id: str):
 
     try:
         # Send initial status
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(orjson.dumps({
             "type": "status", 
             "data": {"status": experiment.status}
-        }))
+        }).decode())
 
         # Create an async queue for this WebSocket connection
         # We'll bridge messages from the thread-safe queue to this async queue
@@ -43,7 +45,7 @@ async def websocket_endpoint(websocket: WebSocket, experiment_id: str):
                         # Short sleep to avoid busy waiting
                         await asyncio.sleep(0.05)
                 except Exception as e:
-                    logger.error(f"Error bridging messages for {experiment_id}: {e}")
+                    logger.error("Error bridging messages for %s: %s", experiment_id, e)
                     break
         
         # Start the bridge task
@@ -54,16 +56,16 @@ async def websocket_endpoint(websocket: WebSocket, experiment_id: str):
             try:
                 # Use asyncio.wait_for to implement timeout and check experiment status
                 message_data = await asyncio.wait_for(message_queue.get(), timeout=0.5)
-                await websocket.send_text(json.dumps(message_data))
+                await websocket.send_text(orjson.dumps(message_data).decode())
             except asyncio.TimeoutError:
                 # Check if experiment is completed during timeout
                 current_experiment = state_manager.get_experiment(experiment_id)
-                if current_experiment and current_experiment.status in ['completed', 'error']:
+                if current_experiment and current_experiment.status in _FINISHED_STATUSES:
                     # Send final status and exit gracefully
-                    await websocket.send_text(json.dumps({
+                    await websocket.send_text(orjson.dumps({
                         "type": "status",
                         "data": {"status": current_experiment.status}
-                    }))
+                    }).decode())
                     break
                 # Continue listening if experiment is still running
                 continue
@@ -16,7 +16,7 @@ from typing import List, Union
 from .config_validators import (
     validate_port, validate_timeout, validate_temperature, validate_directory_path,
     validate_url, validate_comma_separated_list, validate_positive_int,
-    validate_percentage
+    validate_percentage, validate_compresslevel
 )
 
 
@@ -46,6 +46,10 @@ class Settings(BaseSettings):
         default=8000,
         description="Port to bind the API server"
     )
+    api_reload: bool = Field(
+        default=True,
+        description="Restart the server on code changes (development only; disable in production)"
+    )
     
     # CORS Configuration
     cors_origins: Union[str, List[str]] = Field(
@@ -64,6 +68,20 @@ class Settings(BaseSettings):
         default="*",
         description="Allowed HTTP headers for CORS (comma-separated string or list)"
     )
+    cors_max_age: int = Field(
+        default=86400,
+        description="Seconds browsers may cache CORS preflight responses"
+    )
+    
+    # Response compression
+    gzip_minimum_size: int = Field(
+        default=1024,
+        description="Smallest response body in bytes that is gzip-compressed"
+    )
+    gzip_compresslevel: int = Field(
+        default=5,
+        description="gzip compression level (1 = fastest, 9 = smallest)"
+    )
     
     # Ollama Configuration
     ollama_base_url: str = Field(
@@ -86,6 +104,10 @@ class Settings(BaseSettings):
         default="/app/data/models",
         description="Directory where Ollama stores downloaded models"
     )
+    ollama_reachability_ttl: float = Field(
+        default=3.0,
+        description="Seconds the result of the Ollama reachability check is reused"
+    )
     
     # Storage Configuration
     data_directory: str = Field(
@@ -100,6 +122,22 @@ class Settings(BaseSettings):
         default="conversations",
         description="Subdirectory for conversation data (relative to data_directory)"
     )
+    storage_max_workers: int = Field(
+        default=16,
+        description="Worker threads available for blocking storage I/O"
+    )
+    experiment_read_batch_window: float = Field(
+        default=0.005,
+        description="Seconds concurrent experiment reads are collected into one storage call"
+    )
+    conversation_cache_ttl: float = Field(
+        default=30.0,
+        description="Seconds conversation reads are served from the in-process cache (0 disables it)"
+    )
+    conversation_cache_size: int = Field(
+        default=4096,
+        description="Maximum number of cached conversation read results"
+    )
     
     # Experiment Configuration
     default_max_rounds: int = Field(
@@ -191,7 +229,7 @@ class Settings(BaseSettings):
     def validate_urls(cls, v):
         return validate_url(v)
     
-    @field_validator('default_max_rounds', mode='before')
+    @field_validator('default_max_rounds', 'storage_max_workers', 'conversation_cache_size', mode='before')
     @classmethod
     def validate_max_rounds(cls, v):
         return validate_positive_int(v)
@@ -201,6 +239,16 @@ class Settings(BaseSettings):
     def validate_throttle_ms(cls, v):
         return validate_positive_int(v)
     
+    @field_validator('gzip_minimum_size', mode='before')
+    @classmethod
+    def validate_gzip_minimum_size(cls, v):
+        return validate_positive_int(v)
+    
+    @field_validator('gzip_compresslevel', mode='before')
+    @classmethod
+    def validate_gzip_compresslevel(cls, v):
+        return validate_compresslevel(v)
+    
     @field_validator('pull_progress_percent_delta', mode='before')
     @classmethod
     def validate_percent_delta(cls, v):
@@ -100,6 +100,19 @@ def validate_positive_int(value: Union[int, str]) -> int:
 
 
 
+def validate_compresslevel(value: Union[int, str]) -> int:
+    """Validate a zlib compression level (1-9)."""
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValueError(f"Compression level must be a valid integer, got: {value}")
+    
+    if not (1 <= value <= 9):
+        raise ValueError("Compression level must be between 1 and 9")
+    return value
+
+
 def validate_percentage(value: Union[float, str]) -> float:
     """Validate percentage value (0-100)."""
     if isinstance(value, str):
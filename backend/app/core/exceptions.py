@@ -1,8 +1,11 @@
 """
 Custom application exceptions with structured error details.
 """
+from functools import cached_property
 from typing import Any, Dict, Optional
 
+import orjson
+
 
 class AppException(Exception):
     """Base application exception with structured error details."""
@@ -33,6 +36,11 @@ class AppException(Exception):
             'message': self.message,
             'details': self.details
         }
+    
+    @cached_property
+    def to_bytes(self) -> bytes:
+        """JSON-encoded ``to_dict()`` payload, computed once per instance."""
+        return orjson.dumps(self.to_dict())
 
 
 class ValidationError(AppException):
@@ -2,13 +2,13 @@
 Experiment state management.
 """
 from typing import Dict, Optional, List, Any
-from datetime import datetime
 
 from ..schemas.conversation import ConversationAgent, Message, Conversation
 from ..schemas.task import TaskModel
 from ..schemas.agent import AgentModel
 from ..schemas.chat_rules import ChatRulesModel
 from ..utils.logging import get_logger
+from ..utils.timestamps import utc_now_iso
 
 logger = get_logger(__name__)
 
@@ -27,9 +27,10 @@ class ExperimentState:
         self.iterations: int = 1
         self.current_iteration: int = 0
         self.status: str = 'running'
-        self.created_at: str = datetime.now().isoformat()
+        self.created_at: str = utc_now_iso()
         self.completed_at: Optional[str] = None
         self.error: Optional[str] = None
+        self._agent_dicts: Optional[List[Dict[str, Any]]] = None
         
         # Initialize conversation agents
         for agent in agents:
@@ -40,6 +41,12 @@ class ExperimentState:
                 model=agent.model,
             ))
     
+    def agent_dicts(self) -> List[Dict[str, Any]]:
+        """Agents as plain dicts, dumped once; agents do not change after creation."""
+        if self._agent_dicts is None:
+            self._agent_dicts = [agent.model_dump() for agent in self.agents]
+        return self._agent_dicts
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert state to dictionary."""
         return {
@@ -91,7 +98,7 @@ class ExperimentStateManager:
         if experiment:
             experiment.status = status
             if status == 'completed':
-                experiment.completed_at = datetime.now().isoformat()
+                experiment.completed_at = utc_now_iso()
             for key, value in kwargs.items():
                 if hasattr(experiment, key):
                     setattr(experiment, key, value)
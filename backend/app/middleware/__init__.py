@@ -0,0 +1,11 @@
+"""
+ASGI middleware used by the LLaMa-Herd application.
+
+Every middleware here is a pure ASGI callable that hands non-HTTP scopes
+(WebSocket, lifespan) straight to the wrapped app, so long-lived
+WebSocket connections never pay for HTTP-only processing.
+"""
+from .compression import SelectiveGZipMiddleware
+from .exceptions import ExceptionASGIMiddleware
+
+__all__ = ["ExceptionASGIMiddleware", "SelectiveGZipMiddleware"]
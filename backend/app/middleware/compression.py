@@ -0,0 +1,32 @@
+"""
+Response compression middleware.
+"""
+from typing import Iterable, Tuple
+
+from starlette.middleware.gzip import GZipMiddleware
+
+
+class SelectiveGZipMiddleware:
+    """GZip responses except for paths that stream incremental output.
+
+    Compressing a token stream makes zlib hold small chunks until a deflate
+    block fills, which stalls streamed model output, so those paths bypass
+    compression entirely.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        compresslevel: int = 5,
+        exclude_paths: Iterable[str] = ()
+    ):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.exclude_paths: Tuple[str, ...] = tuple(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        await self.gzip_app(scope, receive, send)
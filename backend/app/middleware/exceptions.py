@@ -0,0 +1,188 @@
+"""
+Pure ASGI middleware that converts application exceptions into JSON responses.
+
+Replaces the per-exception ``@app.exception_handler`` registrations so error
+responses are produced without allocating Request/Response objects.
+"""
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+
+import httpx
+import orjson
+
+from ..core.exceptions import (
+    AppException,
+    ValidationError,
+    NotFoundError,
+    AuthError,
+    ExperimentError,
+    AgentError,
+    StorageError,
+    ConversationError
+)
+from ..utils.logging import get_logger, log_with_context
+
+logger = get_logger(__name__)
+
+# (status, log level, log message prefix) per exception type. Subclasses not
+# listed here resolve to their nearest listed base class. A status of 0 means
+# it is resolved per exception (AuthError maps to 401 or 403 by auth_type).
+_EXC_TABLE: Dict[Type[AppException], Tuple[int, str, str]] = {
+    ValidationError: (400, 'warning', 'Validation error'),
+    NotFoundError: (404, 'info', 'Resource not found'),
+    AuthError: (0, 'warning', 'Auth error'),
+    ExperimentError: (400, 'error', 'Experiment error'),
+    AgentError: (400, 'error', 'Agent error'),
+    StorageError: (500, 'error', 'Storage error'),
+    ConversationError: (400, 'error', 'Conversation error'),
+    AppException: (500, 'error', 'Application error'),
+}
+
+# Body for unexpected errors; encoded once since it never varies
+_GENERIC_500 = orjson.dumps({
+    'error': 'INTERNAL_ERROR',
+    'message': 'An unexpected error occurred',
+    'details': {}
+})
+
+# Body for network errors talking to Ollama, in the HTTPException shape the
+# model routes use for their other errors
+_OLLAMA_UNAVAILABLE = orjson.dumps({'detail': 'Failed to connect to Ollama service'})
+
+# Identical unexpected errors (same type, message and raising line) are
+# logged at most once per window; the next logged occurrence reports how
+# many were suppressed in between. A new signature is always logged.
+_UNEXPECTED_LOG_WINDOW = 1.0
+_UNEXPECTED_SEEN_MAX = 256
+_unexpected_seen: Dict[Tuple, List] = {}
+
+
+class ExceptionASGIMiddleware:
+    """Catch exceptions raised by the wrapped app and emit a JSON error response."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # Once headers are on the wire we can no longer replace the response
+            if response_started:
+                raise
+            status_code, body = self._build_error(exc, scope.get("path", ""))
+            await send({
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def _build_error(exc: Exception, path: str) -> Tuple[int, bytes]:
+        """Map an exception to a status code and encoded JSON body, logging it once."""
+        entry = _resolve(type(exc))
+        if entry is not None:
+            status_code, level, prefix = entry
+            if not status_code:
+                status_code = 401 if exc.details.get('auth_type') == 'authentication' else 403
+            log_with_context(
+                logger,
+                level,
+                "%s: %s",
+                prefix,
+                exc.message,
+                error_code=exc.error_code,
+                details=exc.details,
+                path=path
+            )
+            return status_code, exc.to_bytes
+
+        if isinstance(exc, httpx.TransportError):
+            logger.warning("Ollama request failed on %s: %s", path, exc)
+            return 503, _OLLAMA_UNAVAILABLE
+
+        suppressed = _claim_unexpected_log(_error_signature(exc))
+        if suppressed is not None:
+            extra = {'suppressed': suppressed} if suppressed else {}
+            log_with_context(
+                logger,
+                'critical',
+                "Unexpected error: %s",
+                exc,
+                exc_info=exc,
+                exception_type=type(exc).__name__,
+                path=path,
+                **extra
+            )
+        return 500, _GENERIC_500
+
+
+@lru_cache(maxsize=64)
+def _resolve(exc_type: type) -> Optional[Tuple[int, str, str]]:
+    """Return the table entry for the nearest mapped class in the MRO, if any.
+
+    Cached per exception type, so dispatch after the first raise is a single
+    dict lookup.
+    """
+    for base in exc_type.__mro__:
+        entry = _EXC_TABLE.get(base)
+        if entry is not None:
+            return entry
+    return None
+
+
+def _error_signature(exc: Exception) -> Tuple:
+    """
+    Identify an unexpected error by type, message and the line that raised it.
+    
+    Args:
+        exc: The exception that escaped the application
+        
+    Returns:
+        Hashable signature used to coalesce identical repeats
+    """
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    location = (tb.tb_frame.f_code.co_filename, tb.tb_lineno) if tb is not None else None
+    return type(exc), str(exc), location
+
+
+def _claim_unexpected_log(signature: Tuple) -> Optional[int]:
+    """
+    Decide whether an unexpected error with this signature should be logged now.
+    
+    Returns None to suppress the log, otherwise the number of identical
+    occurrences suppressed since the signature was last logged.
+    """
+    now = time.monotonic()
+    state = _unexpected_seen.get(signature)
+    if state is not None and now - state[0] < _UNEXPECTED_LOG_WINDOW:
+        state[1] += 1
+        return None
+    if state is None and len(_unexpected_seen) >= _UNEXPECTED_SEEN_MAX:
+        # Forget signatures whose window has closed so distinct messages
+        # (ids, paths) cannot grow the table without bound
+        for key in [k for k, v in _unexpected_seen.items() if now - v[0] >= _UNEXPECTED_LOG_WINDOW]:
+            del _unexpected_seen[key]
+        if len(_unexpected_seen) >= _UNEXPECTED_SEEN_MAX:
+            _unexpected_seen.pop(next(iter(_unexpected_seen)))
+    _unexpected_seen[signature] = [now, 0]
+    return state[1] if state is not None else 0
@@ -1,6 +1,9 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 
+# Kept ordered so the validation error lists them the same way every time
+_VALID_TEAM_TYPES = ("round_robin", "selector")
+
 
 class ChatRulesModel(BaseModel):
     """Chat rules configuration for experiments."""
@@ -39,7 +42,6 @@ class ChatRulesModel(BaseModel):
     @classmethod
     def validate_team_type(cls, v: str) -> str:
         """Ensure team_type is valid."""
-        valid_types = ["round_robin", "selector"]
-        if v not in valid_types:
-            raise ValueError(f"team_type must be one of {valid_types}")
+        if v not in _VALID_TEAM_TYPES:
+            raise ValueError(f"team_type must be one of {list(_VALID_TEAM_TYPES)}")
         return v 
\ No newline at end of file
@@ -1,31 +1,79 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.alias_generators import to_camel
+from typing import Any, Dict, List, Optional
+
+# Fields use snake_case names with camelCase aliases. Plain model_dump() emits
+# the camelCase API form (WebSocket payloads, live views); dumping with
+# by_alias=False yields the snake_case storage form in the same single pass.
+_API_ALIASES = ConfigDict(
+    alias_generator=to_camel,
+    validate_by_name=True,
+    validate_by_alias=True,
+    serialize_by_alias=True
+)
 
 
 class Message(BaseModel):
+    model_config = _API_ALIASES
+
     id: str
-    agentId: str
+    agent_id: str
     content: str
     timestamp: str
     model: Optional[str] = None
 
 
 class ConversationAgent(BaseModel):
+    model_config = _API_ALIASES
+
     id: str
     name: str
     color: str
-    originalName: Optional[str] = None
+    original_name: Optional[str] = None
     model: str
 
 
 class Conversation(BaseModel):
+    model_config = _API_ALIASES
+
     id: str
     title: str
     agents: List[ConversationAgent]
     messages: List[Message]
-    createdAt: str
-    experiment_id: Optional[str] = None
+    created_at: str
+    # The API has always exposed this one in snake_case
+    experiment_id: Optional[str] = Field(None, alias='experiment_id')
     iteration: Optional[int] = None
     source: Optional[str] = None  # 'import' or 'experiment'
-    importedAt: Optional[str] = None  # When conversation was imported
+    imported_at: Optional[str] = None  # When conversation was imported
+
+
+class ConversationUpdate(BaseModel):
+    """Fields accepted when updating a stored conversation.
+    
+    Accepts camelCase or snake_case keys and ignores anything else. Agents
+    and messages are kept as loose dicts so partially filled entries from
+    older clients are still accepted.
+    """
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(validation_alias=to_camel),
+        validate_by_name=True,
+        extra='ignore'
+    )
+
+    title: Optional[str] = None
+    agents: Optional[List[Dict[str, Any]]] = None
+    messages: Optional[List[Dict[str, Any]]] = None
+    created_at: Optional[str] = None
+    experiment_id: Optional[str] = None
+    iteration: Optional[int] = None
+    source: Optional[str] = None
+    imported_at: Optional[str] = None
+
 
+# List serializers built once at import. Dumping a whole list through one of
+# these is a single call into pydantic-core instead of one model_dump per
+# item. Pass warnings=False where the list may also hold plain dicts.
+MESSAGE_LIST = TypeAdapter(List[Message])
+CONVERSATION_AGENT_LIST = TypeAdapter(List[ConversationAgent])
+CONVERSATION_LIST = TypeAdapter(List[Conversation])
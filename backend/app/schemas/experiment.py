@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field, field_validator
+from pydantic.alias_generators import to_camel
 from typing import List, Optional
 
 from .agent import AgentModel
@@ -32,6 +33,23 @@ class ExperimentRequest(BaseModel):
         return v
 
 
+class ExperimentUpdate(BaseModel):
+    """Experiment metadata fields that clients may update.
+    
+    Accepts camelCase or snake_case keys; system fields and anything else in
+    the payload are ignored.
+    """
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(validation_alias=to_camel),
+        validate_by_name=True,
+        extra='ignore'
+    )
+    
+    title: Optional[str] = None
+    status: Optional[str] = None
+    completed_at: Optional[str] = None
+
+
 class ExperimentListItem(BaseModel):
     """Experiment summary for list views."""
     experiment_id: str
@@ -1,14 +1,31 @@
 """
 Services module containing business logic for the application.
+
+Service classes are resolved on first attribute access so that importing a
+lightweight submodule (e.g. ``app.services.ollama_client``) does not pull in
+the AutoGen/OpenAI stack.
 """
-from .agent_service import AgentService
-from .experiment_service import ExperimentService
-from .conversation_service import ConversationService
-from .autogen_service import AutogenService
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "AgentService": ".agent_service",
+    "ExperimentService": ".experiment_service",
+    "ConversationService": ".conversation_service",
+    "AutogenService": ".autogen_service",
+}
 
 __all__ = [
     "AgentService",
     "ExperimentService", 
     "ConversationService",
     "AutogenService"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
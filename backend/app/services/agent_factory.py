@@ -37,7 +37,7 @@ class AgentFactory:
             )
             
             autogen_agents.append(agent)
-            logger.info(f"Created AutoGen agent: {agent_config.name}")
+            logger.info("Created AutoGen agent: %s", agent_config.name)
         
         return autogen_agents
     
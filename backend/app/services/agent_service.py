@@ -1,14 +1,15 @@
 """
 Service for managing AI agents.
 """
-from typing import List, Dict, Any
-from autogen_core.models import ChatCompletionClient, ModelInfo
-from autogen_ext.models.openai import OpenAIChatCompletionClient
+from typing import List, Dict, Any, TYPE_CHECKING
 
 from ..schemas.agent import AgentModel
 from ..core.exceptions import AgentError
 from ..core.config import settings
 
+if TYPE_CHECKING:
+    from autogen_core.models import ChatCompletionClient
+
 
 class AgentService:
     """Service for managing AI agents."""
@@ -41,8 +42,12 @@ class AgentService:
         return True
     
     @staticmethod
-    def create_agent_config(agent: AgentModel) -> ChatCompletionClient:
+    def create_agent_config(agent: AgentModel) -> "ChatCompletionClient":
         """Create a model client for the agent using Ollama."""
+        # AutoGen/OpenAI are heavy to import; load them only when a client is built
+        from autogen_core.models import ModelInfo
+        from autogen_ext.models.openai import OpenAIChatCompletionClient
+
         # Create model info for Ollama models (since they're not standard OpenAI models)
         # Provide all required fields for ModelInfo
         model_info = ModelInfo(
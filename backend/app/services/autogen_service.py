@@ -12,6 +12,7 @@ from ..core.state import state_manager
 from ..services.iteration_manager import IterationManager
 from ..storage import get_storage
 from ..utils.logging import get_logger
+from ..utils.timestamps import utc_now_iso
 
 storage = get_storage()
 logger = get_logger(__name__)
@@ -41,38 +42,37 @@ class AutogenService:
     ) -> None:
         """Start an experiment in a background thread."""
         try:
-            logger.info(f"Starting experiment {experiment_id} in background thread")
+            logger.info("Starting experiment %s in background thread", experiment_id)
             thread = threading.Thread(
                 target=self.run_experiment,
                 args=(experiment_id, task, agents),
                 daemon=True,
             )
             thread.start()
-            logger.info(f"Background thread started for experiment {experiment_id}")
+            logger.info("Background thread started for experiment %s", experiment_id)
 
             # Start a watchdog thread to enforce experiment-level timeout
             def _watchdog():
                 try:
                     timeout = settings.experiment_timeout_seconds
                     logger.info(
-                        f"Watchdog for {experiment_id} will monitor for {timeout}s"
+                        "Watchdog for %s will monitor for %ss", experiment_id, timeout
                     )
                     thread.join(timeout=timeout)
                     if thread.is_alive():
                         logger.error(
-                            f"Experiment {experiment_id} exceeded timeout of {timeout}s; marking as error"
+                            "Experiment %s exceeded timeout of %ss; marking as error", experiment_id, timeout
                         )
                         state_manager.update_experiment_status(
                             experiment_id, "error", error="experiment_timeout"
                         )
-                        from datetime import datetime
 
                         storage.update_experiment(
                             experiment_id,
                             {
                                 "status": "error",
                                 "error": "experiment_timeout",
-                                "completed_at": datetime.now().isoformat(),
+                                "completed_at": utc_now_iso(),
                             },
                         )
                         # Emit final terminal status
@@ -81,7 +81,7 @@ class AutogenService:
                                 "status": "error",
                                 "final": True,
                                 "error": "experiment_timeout",
-                                "completed_at": datetime.now().isoformat(),
+                                "completed_at": utc_now_iso(),
                                 "close_connection": True,
                             }
                             state_manager.put_message_threadsafe(
@@ -90,13 +90,13 @@ class AutogenService:
                         except Exception:
                             pass
                 except Exception as e:
-                    logger.error(f"Watchdog for {experiment_id} failed: {str(e)}")
+                    logger.error("Watchdog for %s failed: %s", experiment_id, e)
 
             watchdog_thread = threading.Thread(target=_watchdog, daemon=True)
             watchdog_thread.start()
         except Exception as e:
             logger.error(
-                f"Error starting background thread for experiment {experiment_id}: {str(e)}"
+                "Error starting background thread for experiment %s: %s", experiment_id, e
             )
             raise
 
@@ -14,6 +14,7 @@ from ..core.config import settings
 from ..services.agent_factory import AgentFactory
 from ..services.message_handler import MessageHandler
 from ..utils.logging import get_logger
+from ..utils.timestamps import utc_now_iso
 
 
 logger = get_logger(__name__)
@@ -76,11 +77,11 @@ class ConversationRunner:
                     )
                     sent_messages.add(message_key)
                     logger.debug(
-                        f"Sent real-time message from {agent_name}: {content[:50]}..."
+                        "Sent real-time message from %s: %s...", agent_name, content[:50]
                     )
                 else:
                     logger.debug(
-                        f"Skipped duplicate message from {agent_name}: {content[:50]}..."
+                        "Skipped duplicate message from %s: %s...", agent_name, content[:50]
                     )
 
         # Check if this is the final TaskResult
@@ -143,11 +144,11 @@ class ConversationRunner:
                     )
                     sent_messages.add(message_key)
                     logger.debug(
-                        f"Processed message from TaskResult: {agent_name}: {content[:50]}..."
+                        "Processed message from TaskResult: %s: %s...", agent_name, content[:50]
                     )
                 else:
                     logger.debug(
-                        f"Skipped duplicate message from TaskResult: {agent_name}: {content[:50]}..."
+                        "Skipped duplicate message from TaskResult: %s: %s...", agent_name, content[:50]
                     )
 
     def run_conversation(
@@ -232,7 +233,7 @@ class ConversationRunner:
                 experiment = state_manager.get_experiment(experiment_id)
                 message_count = len(experiment.messages) if experiment else 0
                 logger.info(
-                    f"Single agent conversation completed with {message_count} messages"
+                    "Single agent conversation completed with %s messages", message_count
                 )
             else:
                 # Multiple agents: use group chat
@@ -240,12 +241,12 @@ class ConversationRunner:
                 if chat_rules:
                     max_turns = max(chat_rules.max_rounds, len(agents))
                     logger.info(
-                        f"Multiple agents detected ({len(agents)}), using {chat_rules.team_type} with max_turns={max_turns}"
+                        "Multiple agents detected (%s), using %s with max_turns=%s", len(agents), chat_rules.team_type, max_turns
                     )
                 else:
                     max_turns = max(settings.default_max_rounds, len(agents))
                     logger.info(
-                        f"Multiple agents detected ({len(agents)}), using RoundRobinGroupChat with max_turns={max_turns}"
+                        "Multiple agents detected (%s), using RoundRobinGroupChat with max_turns=%s", len(agents), max_turns
                     )
 
                 # Select team type based on chat_rules
@@ -310,22 +311,21 @@ class ConversationRunner:
                 experiment = state_manager.get_experiment(experiment_id)
                 message_count = len(experiment.messages) if experiment else 0
                 logger.info(
-                    f"Group chat conversation completed with {message_count} messages"
+                    "Group chat conversation completed with %s messages", message_count
                 )
 
         except Exception as e:
-            logger.error(f"Autogen conversation error: {str(e)}")
+            logger.error("Autogen conversation error: %s", e)
             # Emit an error status for this conversation so listeners are aware
             try:
                 from ..core.state import state_manager
-                from datetime import datetime
 
                 data = {
                     "experiment_id": experiment_id,
                     "status": "error",
                     "final": True,
                     "error": str(e),
-                    "completed_at": datetime.now().isoformat(),
+                    "completed_at": utc_now_iso(),
                     "close_connection": False,
                 }
                 # Using close_connection False here because higher-level run_experiment will decide
@@ -340,5 +340,5 @@ class ConversationRunner:
             # If we didn't send a final conversation-level message, do nothing; run_experiment will handle finalization
             if final_sent:
                 logger.info(
-                    f"run_conversation emitted a final status for {experiment_id}"
+                    "run_conversation emitted a final status for %s", experiment_id
                 )
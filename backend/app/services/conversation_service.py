@@ -3,12 +3,18 @@ Service for managing conversations.
 """
 
 import uuid
-from datetime import datetime
 from typing import List, Optional
-from ..schemas.conversation import Message, ConversationAgent, Conversation
+from ..schemas.conversation import (
+    CONVERSATION_AGENT_LIST,
+    MESSAGE_LIST,
+    Conversation,
+    ConversationAgent,
+    Message,
+)
 from ..core.exceptions import ValidationError
 from ..core.state import state_manager
 from ..utils.logging import logger
+from ..utils.timestamps import utc_now_iso
 
 
 class ConversationService:
@@ -36,7 +42,7 @@ class ConversationService:
                 id=str(uuid.uuid4()),
                 agentId=agent_id,
                 content=content,
-                timestamp=datetime.now().isoformat(),
+                timestamp=utc_now_iso(),
                 model=model,
             )
 
@@ -51,7 +57,7 @@ class ConversationService:
                 )
 
         except Exception as e:
-            logger.error(f"Failed to create message: {str(e)}")
+            logger.error("Failed to create message: %s", e)
             raise ValidationError(f"Failed to create message: {str(e)}")
 
     @staticmethod
@@ -85,7 +91,7 @@ class ConversationService:
                 title=title,
                 agents=experiment.conversation_agents,
                 messages=experiment.messages,
-                createdAt=datetime.now().isoformat(),
+                createdAt=utc_now_iso(),
             )
 
             if state_manager.add_conversation(experiment_id, conversation):
@@ -126,11 +132,11 @@ class ConversationService:
                         experiment_title=experiment_title,
                     )
                     logger.info(
-                        f"Saved conversation snapshot {conversation.id} to persistent storage (iteration {current_iteration})"
+                        "Saved conversation snapshot %s to persistent storage (iteration %s)", conversation.id, current_iteration
                     )
                 except Exception as storage_error:
                     logger.warning(
-                        f"Failed to save conversation to persistent storage: {str(storage_error)}"
+                        "Failed to save conversation to persistent storage: %s", storage_error
                     )
 
                 # Notify via message queue
@@ -142,7 +148,7 @@ class ConversationService:
                 )
 
         except Exception as e:
-            logger.error(f"Failed to add conversation snapshot: {str(e)}")
+            logger.error("Failed to add conversation snapshot: %s", e)
             raise ValidationError(f"Failed to add conversation snapshot: {str(e)}")
 
     @staticmethod
@@ -177,7 +183,7 @@ class ConversationService:
                 experiment_id, {"type": "message", "data": message.model_dump()}
             )
         except Exception as e:
-            logger.warning(f"Failed to notify about message: {str(e)}")
+            logger.warning("Failed to notify about message: %s", e)
 
     @staticmethod
     def _notify_conversation(experiment_id: str, conversation: Conversation) -> None:
@@ -188,7 +194,7 @@ class ConversationService:
                 {"type": "conversation", "data": conversation.model_dump()},
             )
         except Exception as e:
-            logger.warning(f"Failed to notify about conversation: {str(e)}")
+            logger.warning("Failed to notify about conversation: %s", e)
 
     @staticmethod
     def notify_conversation_started(experiment_id: str, title: str) -> None:
@@ -210,14 +216,14 @@ class ConversationService:
                 title=title,
                 agents=experiment.conversation_agents,
                 messages=[],
-                createdAt=datetime.now().isoformat(),
+                createdAt=utc_now_iso(),
                 experiment_id=experiment_id,
                 iteration=experiment.current_iteration or None,
             )
             # Notify only (do not append to experiment.conversations yet)
             ConversationService._notify_conversation(experiment_id, conv)
         except Exception as e:
-            logger.warning(f"Failed to emit conversation-start: {str(e)}")
+            logger.warning("Failed to emit conversation-start: %s", e)
 
     @staticmethod
     def get_live_conversation(experiment_id: str) -> Optional[dict]:
@@ -229,12 +235,12 @@ class ConversationService:
         experiment = state_manager.get_experiment(experiment_id)
         if not experiment:
             logger.debug(
-                f"get_live_conversation: No experiment found in state for {experiment_id}"
+                "get_live_conversation: No experiment found in state for %s", experiment_id
             )
             return None
 
         logger.debug(
-            f"get_live_conversation: Building live conversation with {len(experiment.messages)} messages"
+            "get_live_conversation: Building live conversation with %s messages", len(experiment.messages)
         )
 
         # Build conversation object from current state (even if empty messages)
@@ -242,14 +248,8 @@ class ConversationService:
         return {
             "id": experiment_id,
             "title": "Live",
-            "agents": [
-                a.model_dump() if hasattr(a, "model_dump") else a
-                for a in experiment.conversation_agents
-            ],
-            "messages": [
-                m.model_dump() if hasattr(m, "model_dump") else m
-                for m in experiment.messages
-            ],
+            "agents": CONVERSATION_AGENT_LIST.dump_python(experiment.conversation_agents, warnings=False),
+            "messages": MESSAGE_LIST.dump_python(experiment.messages, warnings=False),
             "createdAt": experiment.created_at,
             "experiment_id": experiment_id,
             "iteration": None,
@@ -1,9 +1,9 @@
 """
 Service for notifying about experiment status changes.
 """
-from datetime import datetime
 from ..core.state import state_manager
 from ..utils.logging import get_logger
+from ..utils.timestamps import utc_now_iso
 
 logger = get_logger(__name__)
 
@@ -31,7 +31,7 @@ class ExperimentNotifier:
                 "experiment_id": experiment_id,
                 "status": "completed",
                 "final": True,
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": utc_now_iso(),
                 "close_connection": True
             }
             state_manager.put_message_threadsafe(experiment_id, {"type": "status", "data": data})
@@ -47,7 +47,7 @@ class ExperimentNotifier:
                 "status": "error",
                 "final": True,
                 "error": str(error),
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": utc_now_iso(),
                 "close_connection": True
             }
             # Send as a final status message so clients have a single contract to listen for
@@ -2,12 +2,14 @@
 Service for managing experiments.
 """
 import uuid
-from typing import List
+from operator import itemgetter
+from typing import Any, Dict, List
 from ..schemas.experiment import ExperimentRequest, ExperimentResponse, ExperimentListItem
 from ..core.exceptions import ExperimentError, ValidationError, NotFoundError
 from ..core.state import state_manager
 from ..services.agent_service import AgentService
 from ..utils.logging import get_logger, log_with_context, set_experiment_context
+from ..utils.experiment_helpers import truncate_title
 
 logger = get_logger(__name__)
 
@@ -113,6 +115,31 @@ class ExperimentService:
         experiments.sort(key=lambda x: x.created_at, reverse=True)
         return experiments
     
+    @staticmethod
+    def list_experiment_summaries() -> List[Dict[str, Any]]:
+        """
+        List active experiments as plain dicts for the list endpoint.
+        
+        Same fields as list_experiments plus the agents, built directly
+        instead of constructing and dumping a model per experiment.
+        """
+        summaries = [
+            {
+                'experiment_id': experiment_id,
+                'title': truncate_title(experiment.task.prompt),
+                'status': experiment.status,
+                'created_at': experiment.created_at,
+                'agent_count': len(experiment.agents),
+                'message_count': len(experiment.messages),
+                'iterations': experiment.iterations,
+                'current_iteration': experiment.current_iteration,
+                'agents': experiment.agent_dicts()
+            }
+            for experiment_id, experiment in state_manager.get_all_experiments().items()
+        ]
+        summaries.sort(key=itemgetter('created_at'), reverse=True)
+        return summaries
+    
     @staticmethod
     def delete_experiment(experiment_id: str) -> bool:
         """Delete an experiment."""
@@ -3,16 +3,15 @@ Service for managing experiment iterations.
 """
 import threading
 from typing import List
-from datetime import datetime
 
 from ..schemas.agent import AgentModel
 from ..schemas.task import TaskModel
 from ..core.state import state_manager
-from ..services.conversation_runner import ConversationRunner
 from ..services.conversation_service import ConversationService
 from ..services.experiment_notifier import ExperimentNotifier
 from ..storage import get_storage
 from ..utils.logging import get_logger
+from ..utils.timestamps import utc_now_iso
 
 logger = get_logger(__name__)
 
@@ -21,10 +20,18 @@ class IterationManager:
     """Service for managing experiment iterations."""
     
     def __init__(self):
-        self.conversation_runner = ConversationRunner()
+        self._conversation_runner = None
         self.notifier = ExperimentNotifier()
         self.storage = get_storage()
     
+    @property
+    def conversation_runner(self):
+        """Conversation runner, created on first use to defer importing AutoGen."""
+        if self._conversation_runner is None:
+            from ..services.conversation_runner import ConversationRunner
+            self._conversation_runner = ConversationRunner()
+        return self._conversation_runner
+    
     def run_experiment(
         self,
         experiment_id: str,
@@ -34,28 +41,28 @@ class IterationManager:
         """Run a complete experiment with multiple iterations."""
         final_sent = False
         try:
-            logger.info(f"Starting experiment {experiment_id} with {len(agents)} agents")
+            logger.info("Starting experiment %s with %s agents", experiment_id, len(agents))
             
             experiment = state_manager.get_experiment(experiment_id)
             if not experiment:
                 raise ValueError(f"Experiment {experiment_id} not found")
             
-            logger.info(f"Experiment {experiment_id} found, starting iterations")
+            logger.info("Experiment %s found, starting iterations", experiment_id)
             
             iterations = experiment.iterations
             dataset_items = getattr(task, 'datasetItems', None)
             
-            logger.info(f"Experiment {experiment_id}: {iterations} iterations, dataset items: {len(dataset_items) if dataset_items else 0}")
+            logger.info("Experiment %s: %s iterations, dataset items: %s", experiment_id, iterations, len(dataset_items) if dataset_items else 0)
             
             # Run iterations
             if dataset_items and isinstance(dataset_items, list) and len(dataset_items) > 0:
-                logger.info(f"Running dataset iterations for experiment {experiment_id}")
+                logger.info("Running dataset iterations for experiment %s", experiment_id)
                 self._run_dataset_iterations(experiment_id, dataset_items, agents)
             else:
-                logger.info(f"Running manual iterations for experiment {experiment_id}")
+                logger.info("Running manual iterations for experiment %s", experiment_id)
                 self._run_manual_iterations(experiment_id, task.prompt, agents, iterations)
             
-            logger.info(f"Experiment {experiment_id} iterations completed, marking as completed")
+            logger.info("Experiment %s iterations completed, marking as completed", experiment_id)
             
             # Mark as completed in memory
             state_manager.update_experiment_status(experiment_id, 'completed')
@@ -63,18 +70,15 @@ class IterationManager:
             # Persist status change to storage
             self.storage.update_experiment(experiment_id, {
                 'status': 'completed',
-                'completed_at': datetime.now().isoformat()
+                'completed_at': utc_now_iso()
             })
-            logger.info(f"Persisted completion status for experiment {experiment_id}")
+            logger.info("Persisted completion status for experiment %s", experiment_id)
             
             self.notifier.notify_completion(experiment_id)
             final_sent = True
             
         except Exception as e:
-            logger.error(f"Error in experiment {experiment_id}: {str(e)}")
-            logger.error(f"Exception type: {type(e).__name__}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error in experiment %s (%s): %s", experiment_id, type(e).__name__, e, exc_info=True)
             
             # Mark as error in memory
             state_manager.update_experiment_status(experiment_id, 'error', error=str(e))
@@ -83,9 +87,9 @@ class IterationManager:
             self.storage.update_experiment(experiment_id, {
                 'status': 'error',
                 'error': str(e),
-                'completed_at': datetime.now().isoformat()
+                'completed_at': utc_now_iso()
             })
-            logger.info(f"Persisted error status for experiment {experiment_id}")
+            logger.info("Persisted error status for experiment %s", experiment_id)
             
             self.notifier.notify_error(experiment_id, str(e))
             final_sent = True
@@ -93,16 +97,16 @@ class IterationManager:
             # If for some reason we exited without sending a final notification, ensure we persist and notify
             if not final_sent:
                 try:
-                    logger.warning(f"Final notification not sent for {experiment_id}; sending fallback error status")
+                    logger.warning("Final notification not sent for %s; sending fallback error status", experiment_id)
                     state_manager.update_experiment_status(experiment_id, 'error', error='terminated_without_final')
                     self.storage.update_experiment(experiment_id, {
                         'status': 'error',
                         'error': 'terminated_without_final',
-                        'completed_at': datetime.now().isoformat()
+                        'completed_at': utc_now_iso()
                     })
                     self.notifier.notify_error(experiment_id, 'terminated_without_final')
                 except Exception as e2:
-                    logger.error(f"Failed to send fallback final notification for {experiment_id}: {str(e2)}")
+                    logger.error("Failed to send fallback final notification for %s: %s", experiment_id, e2)
     
     def _run_dataset_iterations(self, experiment_id: str, dataset_items: List, agents: List[AgentModel]):
         """Run experiment over dataset items."""
@@ -132,7 +136,7 @@ class IterationManager:
             title = f"Run {iteration}"
             ConversationService.notify_conversation_started(experiment_id, title)
         except Exception as e:
-            logger.warning(f"Failed to notify conversation start for {experiment_id} iter {iteration}: {str(e)}")
+            logger.warning("Failed to notify conversation start for %s iter %s: %s", experiment_id, iteration, e)
         
         # Create message handler and run conversation
         from ..services.message_handler import MessageHandler
@@ -151,7 +155,7 @@ class IterationManager:
         try:
             conv_thread.join()
         except Exception as e:
-            logger.error(f"Error while waiting for conversation thread: {str(e)}")
+            logger.error("Error while waiting for conversation thread: %s", e)
             raise
     
     def _snapshot_conversation(self, experiment_id: str, title: str):
@@ -8,6 +8,9 @@ from bs4 import BeautifulSoup
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import orjson
+
+from ..utils.etag import make_etag
 from ..utils.logging import get_logger
 from ..core.config import settings
 
@@ -35,6 +38,8 @@ class ModelCatalogService:
         )
         self._base_models_timestamp: Optional[datetime] = None
         self._predefined_catalog = self._load_predefined_catalog()
+        # (source catalog list, encoded response body, ETag) for get_catalog_json
+        self._encoded_catalog: Optional[Tuple[List[Dict[str, Any]], bytes, str]] = None
         self._variant_fetch_executor: Optional[ThreadPoolExecutor] = None
         self._scraping_lock = (
             threading.Lock()
@@ -50,7 +55,7 @@ class ModelCatalogService:
         self._saved_catalog = self._load_saved_catalog()
         if self._saved_catalog:
             self._cached_catalog = self._saved_catalog
-            logger.info(f"Loaded {len(self._saved_catalog)} models from saved catalog")
+            logger.info("Loaded %s models from saved catalog", len(self._saved_catalog))
 
     def get_catalog(self) -> List[Dict[str, Any]]:
         """
@@ -58,12 +63,31 @@ class ModelCatalogService:
         Returns saved catalog by default, or predefined catalog as fallback.
         Does not automatically scrape - use update_catalog() to refresh.
         """
-        # Get catalog (saved or predefined)
-        catalog = (
-            self._cached_catalog if self._cached_catalog else self._predefined_catalog
-        )
+        return self._sorted_catalog(self._current_catalog())
 
-        # Sort by popularity (pull_count descending, then by name)
+    def get_catalog_json(self) -> Tuple[bytes, str]:
+        """
+        Returns the catalog encoded as ``{"models": [...]}`` and its ETag.
+
+        Catalog lists are replaced, never modified, when an update or a
+        background fetch finishes, so the encoding is reused until the
+        current list changes.
+        """
+        catalog = self._current_catalog()
+        encoded = self._encoded_catalog
+        if encoded is None or encoded[0] is not catalog:
+            body = orjson.dumps({"models": self._sorted_catalog(catalog)})
+            encoded = (catalog, body, make_etag(body))
+            self._encoded_catalog = encoded
+        return encoded[1], encoded[2]
+
+    def _current_catalog(self) -> List[Dict[str, Any]]:
+        """The catalog currently served: saved/fetched, or predefined as fallback."""
+        return self._cached_catalog if self._cached_catalog else self._predefined_catalog
+
+    @staticmethod
+    def _sorted_catalog(catalog: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sort by popularity (pull_count descending, then by name)."""
         def sort_key(model: Dict[str, Any]) -> Tuple[int, str]:
             pull_count = model.get("pull_count", 0)
             name = model.get("name", model.get("tag", ""))
@@ -104,7 +128,7 @@ class ModelCatalogService:
                     self._cached_catalog = full_catalog
                     self._cache_timestamp = datetime.now(UTC)
 
-                logger.info(f"Catalog updated successfully: {len(full_catalog)} models")
+                logger.info("Catalog updated successfully: %s models", len(full_catalog))
                 return {
                     "success": True,
                     "message": f"Catalog updated successfully with {len(full_catalog)} models",
@@ -118,7 +142,7 @@ class ModelCatalogService:
                     "model_count": 0,
                 }
         except Exception as e:
-            logger.error(f"Error updating catalog: {e}", exc_info=True)
+            logger.error("Error updating catalog: %s", e, exc_info=True)
             return {
                 "success": False,
                 "message": f"Error updating catalog: {str(e)}",
@@ -183,7 +207,7 @@ class ModelCatalogService:
                     self._base_models_catalog = base_models
                     self._base_models_timestamp = datetime.now(UTC)
                 logger.info(
-                    f"Found {len(base_models)} base models, returning immediately"
+                    "Found %s base models, returning immediately", len(base_models)
                 )
                 # Start fetching variants in background (only once)
                 self._fetch_variants_in_background()
@@ -192,7 +216,7 @@ class ModelCatalogService:
                 logger.warning("No base models found from scraping, using fallback")
         except Exception as e:
             logger.error(
-                f"Failed to scrape base models from ollama.com/library: {e}",
+                "Failed to scrape base models from ollama.com/library: %s", e,
                 exc_info=True,
             )
         finally:
@@ -244,10 +268,10 @@ class ModelCatalogService:
                         self._cached_catalog = full_catalog
                         self._cache_timestamp = datetime.now(UTC)
                     logger.info(
-                        f"Background fetch complete: {len(full_catalog)} models with variants"
+                        "Background fetch complete: %s models with variants", len(full_catalog)
                     )
             except Exception as e:
-                logger.warning(f"Background variant fetch failed: {e}")
+                logger.warning("Background variant fetch failed: %s", e)
             finally:
                 with self._scraping_lock:
                     self._variant_fetch_in_progress = False
@@ -279,7 +303,7 @@ class ModelCatalogService:
 
             # Try to find model links - they typically follow pattern /library/{model_name}
             model_links = soup.find_all("a", href=re.compile(r"/library/[^/]+$"))
-            logger.info(f"Found {len(model_links)} model links on library page")
+            logger.info("Found %s model links on library page", len(model_links))
             seen_base_models = set()
             cloud_count = 0
 
@@ -323,7 +347,7 @@ class ModelCatalogService:
                         # Skip cloud-only models
                         if is_cloud:
                             cloud_count += 1
-                            logger.debug(f"Skipping cloud-only model: {base_model}")
+                            logger.debug("Skipping cloud-only model: %s", base_model)
                             continue
 
                         # Get description from the library page
@@ -380,20 +404,20 @@ class ModelCatalogService:
                         )
 
             logger.info(
-                f"Scraped {len(models)} base models (filtered out {cloud_count} cloud models)"
+                "Scraped %s base models (filtered out %s cloud models)", len(models), cloud_count
             )
             if len(models) == 0 and len(model_links) > 0:
                 logger.warning(
-                    f"Found {len(model_links)} links but no models after filtering. This might indicate a parsing issue."
+                    "Found %s links but no models after filtering. This might indicate a parsing issue.", len(model_links)
                 )
             return models if models else None
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Network error while scraping base models: {e}")
+            logger.error("Network error while scraping base models: %s", e)
             return None
         except Exception as e:
             logger.error(
-                f"Unexpected error while scraping base models: {e}",
+                "Unexpected error while scraping base models: %s", e,
                 exc_info=True,
             )
             return None
@@ -465,7 +489,7 @@ class ModelCatalogService:
 
                         # Skip cloud-only models
                         if is_cloud:
-                            logger.debug(f"Skipping cloud-only model: {base_model}")
+                            logger.debug("Skipping cloud-only model: %s", base_model)
                             continue
 
                         # Get description from the library page
@@ -508,7 +532,7 @@ class ModelCatalogService:
 
             # Second pass: visit each model's page to get all variants (in parallel)
             logger.info(
-                f"Found {len(base_models)} base models, fetching variants in parallel..."
+                "Found %s base models, fetching variants in parallel...", len(base_models)
             )
 
             # Use thread pool for parallel requests (limit to 10 concurrent to be respectful)
@@ -543,11 +567,11 @@ class ModelCatalogService:
                                 models.append(variant)
                         if completed % 10 == 0:
                             logger.debug(
-                                f"Processed {completed}/{len(base_models)} models..."
+                                "Processed %s/%s models...", completed, len(base_models)
                             )
                     except Exception as e:
                         logger.warning(
-                            f"Failed to fetch variants for {base_model}: {e}"
+                            "Failed to fetch variants for %s: %s", base_model, e
                         )
                         # Still add base model if we couldn't get variants
                         family, quant = self._parse_model_tag(base_model)
@@ -593,11 +617,11 @@ class ModelCatalogService:
             return models if models else None
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Network error while scraping ollama.com/library: {e}")
+            logger.error("Network error while scraping ollama.com/library: %s", e)
             return None
         except Exception as e:
             logger.error(
-                f"Unexpected error while scraping ollama.com/library: {e}",
+                "Unexpected error while scraping ollama.com/library: %s", e,
                 exc_info=True,
             )
             return None
@@ -723,7 +747,7 @@ class ModelCatalogService:
                             base_description = desc_text[:200]
 
         except Exception as e:
-            logger.debug(f"Error fetching model page for {base_model}: {e}")
+            logger.debug("Error fetching model page for %s: %s", base_model, e)
 
         # Try the tags page for more complete variant list (only if we didn't find many variants)
         # Skip tags page if we already found variants to speed things up
@@ -745,7 +769,7 @@ class ModelCatalogService:
                         if ":" in tag and tag not in variant_tags:
                             variant_tags.add(tag)
             except Exception as e:
-                logger.debug(f"Error fetching tags page for {base_model}: {e}")
+                logger.debug("Error fetching tags page for %s: %s", base_model, e)
 
         # If no variants found, at least include the base model
         if not variant_tags:
@@ -932,14 +956,14 @@ class ModelCatalogService:
                         return data
                     else:
                         logger.warning(
-                            f"Invalid catalog file format: {self._catalog_file}"
+                            "Invalid catalog file format: %s", self._catalog_file
                         )
                         return None
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse catalog file {self._catalog_file}: {e}")
+            logger.warning("Failed to parse catalog file %s: %s", self._catalog_file, e)
             return None
         except Exception as e:
-            logger.warning(f"Failed to load catalog file {self._catalog_file}: {e}")
+            logger.warning("Failed to load catalog file %s: %s", self._catalog_file, e)
             return None
         return None
 
@@ -963,11 +987,11 @@ class ModelCatalogService:
 
             # Atomic rename
             temp_file.replace(self._catalog_file)
-            logger.info(f"Saved catalog to {self._catalog_file}")
+            logger.info("Saved catalog to %s", self._catalog_file)
             return True
         except Exception as e:
             logger.error(
-                f"Failed to save catalog to {self._catalog_file}: {e}", exc_info=True
+                "Failed to save catalog to %s: %s", self._catalog_file, e, exc_info=True
             )
             return False
 
@@ -1,112 +1,136 @@
 """Async client wrapper for Ollama with concurrency limiting and simple caching.
 
 This keeps FastAPI endpoints responsive when Ollama is slow by using
-httpx AsyncClient and a small semaphore to bound concurrent upstream requests.
-Simple in-memory caching is used for tags/version to allow fast responses
-when upstream is busy.
+httpx AsyncClient and small semaphores to bound concurrent upstream requests:
+one for short control calls (tags, version, show, delete, probes) and a
+separate one for long-lived streams, so open streams never starve the rest.
+Tags/version are served from a TTL cache that is refreshed on demand, with
+at most one upstream refresh in flight per key.
 """
 import asyncio
+import contextlib
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import httpx
-import json
+import orjson
 
 from ..core.config import settings
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# Concurrency limit for upstream Ollama requests
+# Concurrency limit for short upstream Ollama requests
 _SEMAPHORE = asyncio.Semaphore(getattr(settings, 'ollama_client_max_concurrency', 4))
+# Separate limit for streams, which hold their slot for the whole response
+_STREAM_SEMAPHORE = asyncio.Semaphore(getattr(settings, 'ollama_stream_max_concurrency', 4))
 
 # Singleton AsyncClient
 _client: Optional[httpx.AsyncClient] = None
 
-# Simple caches
-_tags_cache: Optional[List[Dict[str, Any]]] = None
-_tags_cache_ts: float = 0
+# TTL caches for tags/version: key -> (monotonic timestamp, value). Each key
+# has its own lock so concurrent misses share a single upstream refresh.
+_cache: Dict[str, Tuple[float, Any]] = {'tags': (0.0, None), 'version': (0.0, None)}
+_cache_locks: Dict[str, asyncio.Lock] = {'tags': asyncio.Lock(), 'version': asyncio.Lock()}
 _tags_cache_ttl: float = float(getattr(settings, 'ollama_tags_cache_ttl', 30))
-
-_version_cache: Optional[Dict[str, Any]] = None
-_version_cache_ts: float = 0
 _version_cache_ttl: float = float(getattr(settings, 'ollama_version_cache_ttl', 10))
-
-
-def _get_base_url() -> str:
-    return getattr(settings, 'ollama_url', 'http://localhost:11434')
+# Last reachability check as (monotonic expiry, reachable); any transport
+# error or 5xx on a request expires it so the next check probes again
+_reachability: Tuple[float, bool] = (0.0, False)
+# Held while probing, so concurrent checks after expiry share one probe
+_reachability_lock = asyncio.Lock()
+_reachability_ttl: float = float(getattr(settings, 'ollama_reachability_ttl', 3))
+# Upper bound on a refresh, including the wait for a semaphore slot, so a
+# wedged upstream cannot hold the refresh lock and stall every waiter
+_cache_refresh_timeout: float = float(getattr(settings, 'ollama_cache_refresh_timeout', 5))
 
 
 def _get_client() -> httpx.AsyncClient:
     global _client
     if _client is None:
         timeout = httpx.Timeout(getattr(settings, 'ollama_client_timeout', 10.0))
-        _client = httpx.AsyncClient(base_url=_get_base_url(), timeout=timeout)
+        _client = httpx.AsyncClient(base_url=settings.ollama_url, timeout=timeout)
     return _client
 
 
+async def aclose() -> None:
+    """Close the shared AsyncClient and release its pooled connections."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
 async def _with_semaphore(coro):
     async with _SEMAPHORE:
         return await coro
 
 
-async def get_tags(timeout: Optional[float] = None) -> List[Dict[str, Any]]:
-    """Return tags (models) from Ollama. Uses cache for quick responses.
+def _timeout_arg(timeout: Optional[float]):
+    """Translate an optional per-call timeout into an httpx timeout argument."""
+    return httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
 
-    timeout: optional override for per-call timeout in seconds.
-    """
-    global _tags_cache, _tags_cache_ts
-    now = time.time()
-    if _tags_cache and (now - _tags_cache_ts) < _tags_cache_ttl:
-        return _tags_cache
 
-    client = _get_client()
+async def _cached_fetch(
+    key: str,
+    ttl: float,
+    fetch: Callable[[], Awaitable[Any]],
+    timeout: Optional[float] = None
+) -> Any:
+    """Return a cached value, refreshing it at most once at a time when expired.
 
-    async def _call():
+    The refresh is bounded by the caller's timeout or the refresh timeout,
+    whichever is longer. On upstream errors or timeouts the stale value is
+    returned if one exists; a timeout with nothing cached is raised as
+    httpx.TimeoutException, like any other upstream timeout.
+    """
+    ts, value = _cache[key]
+    if value is not None and (time.monotonic() - ts) < ttl:
+        return value
+
+    async with _cache_locks[key]:
+        # Another caller may have refreshed the entry while we waited
+        ts, value = _cache[key]
+        if value is not None and (time.monotonic() - ts) < ttl:
+            return value
+        limit = _cache_refresh_timeout if timeout is None else max(timeout, _cache_refresh_timeout)
         try:
-            # Respect caller timeout if provided
-            resp = await client.get('/api/tags')
-            resp.raise_for_status()
-            data = resp.json()
-            models = data.get('models', [])
-            # Update cache
-            _tags_cache = models
-            _tags_cache_ts = time.time()
-            return models
+            try:
+                async with asyncio.timeout(limit):
+                    value = await _with_semaphore(fetch())
+            except TimeoutError as e:
+                raise httpx.TimeoutException(f"Refreshing {key} timed out after {limit:g}s") from e
         except Exception as e:
-            logger.warning(f"Failed to fetch tags from Ollama: {e}")
-            # On error, return stale cache if available
-            if _tags_cache:
-                return _tags_cache
+            logger.warning("Failed to fetch %s from Ollama: %s", key, e)
+            stale = _cache[key][1]
+            if stale is not None:
+                return stale
             raise
+        _cache[key] = (time.monotonic(), value)
+        return value
 
-    return await _with_semaphore(_call())
 
+async def get_tags(timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Return tags (models) from Ollama. Uses cache for quick responses.
 
-async def get_version(timeout: Optional[float] = None) -> Dict[str, Any]:
-    """Return Ollama version info. Cached briefly."""
-    global _version_cache, _version_cache_ts
-    now = time.time()
-    if _version_cache and (now - _version_cache_ts) < _version_cache_ttl:
-        return _version_cache
+    timeout: optional override for per-call timeout in seconds.
+    """
+    async def _call():
+        resp = await _get_client().get('/api/tags', timeout=_timeout_arg(timeout))
+        resp.raise_for_status()
+        return orjson.loads(resp.content).get('models', [])
+
+    return await _cached_fetch('tags', _tags_cache_ttl, _call, timeout)
 
-    client = _get_client()
 
+async def get_version(timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Return Ollama version info. Cached briefly."""
     async def _call():
-        try:
-            resp = await client.get('/api/version')
-            resp.raise_for_status()
-            data = resp.json()
-            _version_cache = data
-            _version_cache_ts = time.time()
-            return data
-        except Exception as e:
-            logger.warning(f"Failed to fetch Ollama version: {e}")
-            if _version_cache:
-                return _version_cache
-            raise
+        resp = await _get_client().get('/api/version', timeout=_timeout_arg(timeout))
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
-    return await _with_semaphore(_call())
+    return await _cached_fetch('version', _version_cache_ttl, _call, timeout)
 
 
 async def delete_model(name: str) -> None:
@@ -114,20 +138,77 @@ async def delete_model(name: str) -> None:
 
     async def _call():
         # Use explicit JSON body with data/header to be compatible across different client implementations
-        resp = await client.request('DELETE', '/api/delete', data=json.dumps({'name': name}), headers={'Content-Type': 'application/json'})
+        resp = await client.request('DELETE', '/api/delete', content=orjson.dumps({'name': name}), headers={'Content-Type': 'application/json'})
         resp.raise_for_status()
         return None
 
     return await _with_semaphore(_call())
 
 
+async def request(method: str, path: str, timeout: Optional[float] = None, **kwargs: Any) -> httpx.Response:
+    """Send one request to Ollama on the shared client and return the response.
+
+    The status code is not checked, so callers can relay Ollama's own error
+    responses. Network errors are raised as httpx exceptions. Either a
+    network error or a 5xx answer expires the cached reachability check.
+
+    Args:
+        method: HTTP method
+        path: Ollama API path, e.g. ``/api/tags``
+        timeout: Optional per-call timeout in seconds
+        **kwargs: Passed through to ``httpx.AsyncClient.request``
+    """
+    async def _call():
+        return await _get_client().request(method, path, timeout=_timeout_arg(timeout), **kwargs)
+
+    try:
+        resp = await _with_semaphore(_call())
+    except httpx.TransportError:
+        forget_reachability()
+        raise
+    if resp.status_code >= 500:
+        forget_reachability()
+    return resp
+
+
+async def is_reachable(timeout: Optional[float] = 2.0) -> bool:
+    """Return whether Ollama answers /api/version, reusing a recent answer.
+
+    The result (either way) is kept for ``ollama_reachability_ttl`` seconds,
+    so endpoints guarded by this check do not pay an extra round trip on
+    every call.
+    """
+    global _reachability
+    expires, reachable = _reachability
+    if time.monotonic() < expires:
+        return reachable
+    async with _reachability_lock:
+        # Another caller may have probed while we waited
+        expires, reachable = _reachability
+        if time.monotonic() < expires:
+            return reachable
+        try:
+            resp = await request('GET', '/api/version', timeout=timeout)
+            reachable = resp.status_code == 200
+        except Exception:
+            reachable = False
+        _reachability = (time.monotonic() + _reachability_ttl, reachable)
+        return reachable
+
+
+def forget_reachability() -> None:
+    """Make the next is_reachable() call probe Ollama again."""
+    global _reachability
+    _reachability = (0.0, False)
+
+
 async def get_show(name: str) -> Dict[str, Any]:
     client = _get_client()
 
     async def _call():
         resp = await client.get('/api/show', params={'name': name})
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     return await _with_semaphore(_call())
 
@@ -141,39 +222,50 @@ async def ping(timeout: Optional[float] = 2.0) -> bool:
         return False
 
 
-async def stream(path: str, method: str = 'POST', json_body: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None):
-    """Stream a request to Ollama and yield byte chunks.
+async def open_stream(
+    path: str,
+    method: str = 'POST',
+    json_body: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> Tuple[httpx.Response, AsyncIterator[bytes], Callable[[], Awaitable[None]]]:
+    """Start a streaming request to Ollama and return once its headers arrive.
 
-    Usage:
-      return StreamingResponse(stream(path, 'POST', json_body), media_type='application/x-ndjson')
-    """
-    client = _get_client()
+    The caller can check the status before committing to a streamed
+    response. A stream slot (not shared with short requests) is held until
+    the body has been read or the request is closed.
 
-    async def _gen():
-        async with _SEMAPHORE:
-            async with client.stream(method, path, json=json_body, headers=headers) as resp:
-                resp.raise_for_status()
-                async for chunk in resp.aiter_bytes():
-                    yield chunk
+    Args:
+        path: Ollama API path, e.g. ``/api/generate``
+        method: HTTP method
+        json_body: JSON request body
+        headers: Extra request headers
 
-    return _gen()
+    Returns:
+        Tuple of (response, iterator over body chunks that closes the request
+        when exhausted, coroutine function that closes it early)
+    """
+    stack = contextlib.AsyncExitStack()
+    await stack.enter_async_context(_STREAM_SEMAPHORE)
+    try:
+        resp = await stack.enter_async_context(
+            _get_client().stream(method, path, json=json_body, headers=headers)
+        )
+    except BaseException:
+        await stack.aclose()
+        raise
 
+    async def _chunks():
+        async with stack:
+            async for chunk in resp.aiter_bytes():
+                yield chunk
 
-async def probe(path: str, method: str = 'POST', json_body: Optional[Dict[str, Any]] = None, timeout: float = 2.0) -> int:
-    """Perform a quick non-streaming probe to get the status code from Ollama.
+    return resp, _chunks(), stack.aclose
 
-    Returns the HTTP status code (int). Raises exceptions on network errors.
-    """
-    client = _get_client()
 
-    async def _call():
-        resp = await client.request(method, path, json=json_body, timeout=timeout)
-        status = resp.status_code
-        # consume or close response to free connection
-        try:
-            await resp.aread()
-        except Exception:
-            pass
-        return status
+async def get_url(url: str, timeout: Optional[float] = None) -> httpx.Response:
+    """GET an absolute URL, e.g. on a user-supplied Ollama endpoint.
 
-    return await _with_semaphore(_call())
+    Uses the shared client's connection pool but not the concurrency limit
+    or reachability state, which belong to the configured Ollama.
+    """
+    return await _get_client().get(url, timeout=_timeout_arg(timeout))
@@ -2,7 +2,8 @@
 Ollama pull executor for handling streaming model pulls.
 """
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
 import time
 from typing import Callable, Optional, Dict, Any
 from ..core.config import settings
@@ -11,11 +12,28 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """Create the pooled session shared by every pull and retry."""
+    session = requests.Session()
+    # One connection per concurrent pull is enough; retries are handled by the manager
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(settings.pull_max_concurrency, 1), max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class OllamaPullExecutor:
     """Executes model pulls using Ollama's streaming API."""
     
     def __init__(self):
-        self.ollama_url = getattr(settings, 'ollama_url', 'http://localhost:11434')
+        self.ollama_url = settings.ollama_url
+        self._pull_url = f"{self.ollama_url}/api/pull"
+        # Keeps connections to Ollama open between pulls and retries
+        self._session = _build_session()
+    
+    def close(self):
+        """Close pooled connections to Ollama."""
+        self._session.close()
     
     def pull_model(
         self,
@@ -37,56 +55,56 @@ class OllamaPullExecutor:
         Raises:
             Exception: On network errors or pull failures
         """
-        url = f"{self.ollama_url}/api/pull"
         payload = {"name": model_name}
         
-        logger.info(f"Starting pull for model {model_name}")
+        logger.info("Starting pull for model %s", model_name)
         
         try:
-            response = requests.post(url, json=payload, stream=True, timeout=None)
-            response.raise_for_status()
-            
-            # Parse streaming response
-            for line in response.iter_lines():
-                # Check for cancellation
-                if stop_event and stop_event.is_set():
-                    logger.info(f"Pull cancelled for model {model_name}")
-                    raise InterruptedError("Pull cancelled by user")
+            # Closing the response returns its connection to the pool, also on early exit
+            with self._session.post(self._pull_url, json=payload, stream=True, timeout=None) as response:
+                response.raise_for_status()
                 
-                if not line:
-                    continue
+                # Parse streaming response
+                for line in response.iter_lines():
+                    # Check for cancellation
+                    if stop_event and stop_event.is_set():
+                        logger.info("Pull cancelled for model %s", model_name)
+                        raise InterruptedError("Pull cancelled by user")
+                    
+                    if not line:
+                        continue
+                    
+                    try:
+                        data = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        logger.warning("Failed to parse JSON from Ollama: %s", line)
+                        continue
+                    
+                    # Call progress callback
+                    progress_callback(data)
+                    
+                    # Check for completion
+                    if data.get('status') == 'success':
+                        logger.info("Pull completed for model %s", model_name)
+                        return {"status": "success"}
+                    
+                    # Check for errors
+                    if data.get('status') == 'error':
+                        error_msg = data.get('error', 'Unknown error')
+                        logger.error("Pull failed for model %s: %s", model_name, error_msg)
+                        raise Exception(f"Ollama pull failed: {error_msg}")
                 
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to parse JSON from Ollama: {line}")
-                    continue
-                
-                # Call progress callback
-                progress_callback(data)
-                
-                # Check for completion
-                if data.get('status') == 'success':
-                    logger.info(f"Pull completed for model {model_name}")
-                    return {"status": "success"}
-                
-                # Check for errors
-                if data.get('status') == 'error':
-                    error_msg = data.get('error', 'Unknown error')
-                    logger.error(f"Pull failed for model {model_name}: {error_msg}")
-                    raise Exception(f"Ollama pull failed: {error_msg}")
-            
-            # If we exit the loop without success, consider it incomplete
-            logger.warning(f"Pull stream ended unexpectedly for model {model_name}")
-            raise Exception("Pull stream ended unexpectedly")
+                # If we exit the loop without success, consider it incomplete
+                logger.warning("Pull stream ended unexpectedly for model %s", model_name)
+                raise Exception("Pull stream ended unexpectedly")
             
         except InterruptedError:
             # Re-raise cancellation
             raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error during pull of {model_name}: {e}")
+            logger.error("Request error during pull of %s: %s", model_name, e)
             raise Exception(f"Network error during pull: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error during pull of {model_name}: {e}")
+            logger.error("Unexpected error during pull of %s: %s", model_name, e)
             raise
 
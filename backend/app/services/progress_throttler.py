@@ -8,6 +8,9 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Floor between percent-driven emissions, so a fast pull caps at about 10 Hz
+_MIN_EMIT_INTERVAL_MS = 100.0
+
 
 class ProgressThrottler:
     """Handles throttling of progress updates to prevent overwhelming clients."""
@@ -25,15 +28,21 @@ class ProgressThrottler:
         self, 
         progress: Dict[str, Any], 
         last_emit_time: Optional[float], 
-        last_emitted_percent: Optional[float]
+        last_emitted_percent: Optional[float],
+        last_emitted_status: Optional[str] = None
     ) -> bool:
         """
         Determine if progress should be emitted based on throttling rules.
         
+        Status transitions (e.g. "pulling manifest" to a layer download) and
+        the update that finishes a layer are always emitted, so clients never
+        miss a phase change; everything else is rate limited.
+        
         Args:
             progress: Current progress data
             last_emit_time: Timestamp of last emission (epoch seconds)
             last_emitted_percent: Last emitted percentage (0-100)
+            last_emitted_status: Ollama status string of the last emission
             
         Returns:
             True if progress should be emitted
@@ -44,9 +53,16 @@ class ProgressThrottler:
         if last_emit_time is None:
             return True
         
+        if progress.get('status') != last_emitted_status or self._is_layer_complete(progress):
+            return True
+        
+        elapsed_ms = (now_ts - last_emit_time) * 1000.0
+        
         # Time-based emission
-        if (now_ts - last_emit_time) * 1000.0 >= self.throttle_ms:
+        if elapsed_ms >= self.throttle_ms:
             return True
+        if elapsed_ms < _MIN_EMIT_INTERVAL_MS:
+            return False
         
         # Percent-delta emission (if percent available)
         progress_pct = self._extract_percent(progress)
@@ -59,6 +75,12 @@ class ProgressThrottler:
         
         return False
     
+    @staticmethod
+    def _is_layer_complete(progress: Dict[str, Any]) -> bool:
+        """Check whether an Ollama update reports a fully downloaded layer."""
+        total = progress.get('total')
+        return bool(total) and progress.get('completed') == total
+    
     def _extract_percent(self, progress: Dict[str, Any]) -> Optional[float]:
         """Extract a percent value (0-100) from progress data when available."""
         # Prefer explicit fields
@@ -2,9 +2,10 @@
 Cleanup service for pull tasks.
 """
 import threading
-from datetime import datetime
+import time
 from typing import Dict, Any
 from ..utils.logging import get_logger
+from ..utils.timestamps import utc_now
 
 logger = get_logger(__name__)
 
@@ -48,19 +49,20 @@ class PullCleanupService:
     
     def cleanup_stale_tasks(self, tasks: Dict[str, Any]):
         """Clean up tasks that haven't had progress updates for a while (likely interrupted)."""
-        current_time = datetime.now()
+        current_time = utc_now()
+        now_mono = time.monotonic()
         to_remove = []
         
         for task_id, task in tasks.items():
-            if task.status == 'running' and task.last_progress_update:
-                time_since_update = (current_time - task.last_progress_update).total_seconds()
+            if task.status == 'running' and task.last_progress_monotonic is not None:
+                time_since_update = now_mono - task.last_progress_monotonic
                 if time_since_update > self.stale_threshold:
                     # Mark as error and schedule cleanup
                     task.status = 'error'
                     task.error = 'Download interrupted - no progress updates received'
                     task.completed_at = current_time
                     to_remove.append(task_id)
-                    logger.warning(f"Cleaning up stale pull task {task_id} (no progress for {time_since_update:.0f}s)")
+                    logger.warning("Cleaning up stale pull task %s (no progress for %.0fs)", task_id, time_since_update)
         
         # Clean up the tasks after marking them as error
         for task_id in to_remove:
@@ -68,7 +70,7 @@ class PullCleanupService:
     
     def cleanup_completed_tasks(self, tasks: Dict[str, Any]):
         """Clean up old completed tasks and failed tasks."""
-        current_time = datetime.now()
+        current_time = utc_now()
         to_remove = []
         
         for task_id, task in tasks.items():
@@ -90,7 +92,7 @@ class PullCleanupService:
         
         for task_id in to_remove:
             tasks.pop(task_id, None)
-            logger.debug(f"Cleaned up old pull task {task_id}")
+            logger.debug("Cleaned up old pull task %s", task_id)
     
     def _cleanup_worker(self):
         """Background worker that periodically cleans up stale and old tasks."""
@@ -102,6 +104,6 @@ class PullCleanupService:
                 # Clean up old completed tasks every 10 minutes
                 self.cleanup_completed_tasks(tasks)
             except Exception as e:
-                logger.error(f"Error in cleanup worker: {e}")
+                logger.error("Error in cleanup worker: %s", e)
             # Wait in a wakeable manner so stop_cleanup() can interrupt quickly
             self._stop_event.wait(timeout=60)
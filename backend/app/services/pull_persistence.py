@@ -10,6 +10,7 @@ from filelock import FileLock
 
 from ..core.config import settings
 from ..utils.logging import get_logger
+from ..utils.timestamps import as_utc
 
 logger = get_logger(__name__)
 
@@ -47,7 +48,8 @@ class PullPersistence:
     def deserialize_task(self, data: Dict[str, Any], task_class):
         """Deserialize dictionary data to PullTask object."""
         def parse_dt(v):
-            return datetime.fromisoformat(v) if v else None
+            # Tasks persisted before the move to UTC hold naive local times
+            return as_utc(datetime.fromisoformat(v)) if v else None
         
         return task_class(
             task_id=data.get('task_id'),
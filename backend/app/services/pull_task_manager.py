@@ -1,12 +1,13 @@
 """
 Simplified pull task manager using extracted services.
 """
+import asyncio
 import threading
 import uuid
 import shutil
 import os
 import time
-from typing import Dict, Optional, Callable, Any, List
+from typing import Dict, Optional, Callable, Any, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -15,9 +16,12 @@ from ..services.pull_persistence import PullPersistence
 from ..services.pull_cleanup_service import PullCleanupService
 from ..services.ollama_pull_executor import OllamaPullExecutor
 from ..utils.logging import get_logger
+from ..utils.timestamps import utc_now
 
 logger = get_logger(__name__)
 
+_ACTIVE_STATUSES = frozenset({'pending', 'running'})
+
 
 @dataclass
 class PullTask:
@@ -32,10 +36,15 @@ class PullTask:
     completed_at: Optional[datetime] = None
     task_handle: Optional[threading.Thread] = None
     last_progress_update: Optional[datetime] = None
+    # time.monotonic() of the same update, for cheap and clock-safe age checks.
+    # Not persisted: it means nothing in another process.
+    last_progress_monotonic: Optional[float] = None
     # Timestamp (epoch seconds) when we last emitted a progress callback to listeners
     last_emit_time: Optional[float] = None
     # Last emitted percent (0-100) used to decide large-enough deltas
     last_emitted_percent: Optional[float] = None
+    # Ollama status string of the last emitted update
+    last_emitted_status: Optional[str] = None
     stop_event: Optional[threading.Event] = None
     # Retry bookkeeping
     retry_count: int = 0
@@ -43,7 +52,7 @@ class PullTask:
 
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.now()
+            self.created_at = utc_now()
 
 
 class PullTaskManager:
@@ -69,6 +78,11 @@ class PullTaskManager:
         
         # Model deduplication
         self._active_models: Dict[str, str] = {}  # model_name -> task_id
+        # model_name -> IDs of every known task for it in creation order, kept in
+        # step with self.tasks (dict keys: ordered like a list, O(1) removal)
+        self._task_ids_by_model: Dict[str, Dict[str, None]] = {}
+        # task_id -> (loop, event) set once the task stops being active
+        self._completion_events: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
         
         # Load persisted tasks if any
         try:
@@ -88,8 +102,8 @@ class PullTaskManager:
             status='pending'
         )
         with self._lock:
-            self.tasks[task_id] = task
-        logger.info(f"Created pull task {task_id} for model {model_name}")
+            self._add_task(task)
+        logger.info("Created pull task %s for model %s", task_id, model_name)
         return task_id
 
     def start_pull_task(self, task_id: str, pull_function: Callable) -> bool:
@@ -104,15 +118,16 @@ class PullTaskManager:
             # Check for duplicate active pull for same model
             if task.model_name in self._active_models:
                 existing_task_id = self._active_models[task.model_name]
-                logger.warning(f"Model {task.model_name} already being pulled in task {existing_task_id}")
+                logger.warning("Model %s already being pulled in task %s", task.model_name, existing_task_id)
                 return False
             
             # Mark model as active
             self._active_models[task.model_name] = task_id
             
             task.status = 'running'
-            task.started_at = datetime.now()
-            task.last_progress_update = datetime.now()
+            task.started_at = utc_now()
+            task.last_progress_update = utc_now()
+            task.last_progress_monotonic = time.monotonic()
             # Create a stop event for cooperative cancellation
             task.stop_event = threading.Event()
             # Create background thread
@@ -122,7 +137,7 @@ class PullTaskManager:
                 daemon=True
             )
             task.task_handle.start()
-        logger.info(f"Started pull task {task_id} for model {task.model_name}")
+        logger.info("Started pull task %s for model %s", task_id, task.model_name)
         return True
 
     def _run_pull_task(self, task_id: str, pull_function: Callable):
@@ -152,10 +167,11 @@ class PullTaskManager:
                     # Only mark as completed if not already cancelled
                     if task.status != 'cancelled':
                         task.status = 'completed'
-                        task.completed_at = datetime.now()
-                        logger.info(f"Pull task {task_id} completed successfully")
+                        task.completed_at = utc_now()
+                        logger.info("Pull task %s completed successfully", task_id)
                     # Release active model slot
                     self._active_models.pop(task.model_name, None)
+                    self._signal_completion(task_id)
         except Exception as e:
             # Task failed - mark as error and clean up immediately
             with self._lock:
@@ -165,14 +181,15 @@ class PullTaskManager:
                     if task.status != 'cancelled':
                         task.status = 'error'
                         task.error = str(e)
-                        task.completed_at = datetime.now()
-                        logger.error(f"Pull task {task_id} failed: {e}")
+                        task.completed_at = utc_now()
+                        logger.error("Pull task %s failed: %s", task_id, e)
 
                         # Clean up failed task immediately
                         # schedule cleanup to run outside the lock
                         threading.Timer(0.1, self._cleanup_failed_task, args=(task_id,)).start()
                     # Release active model slot
                     self._active_models.pop(task.model_name, None)
+                    self._signal_completion(task_id)
         finally:
             # Always release concurrency slot
             self._concurrency_semaphore.release()
@@ -182,6 +199,109 @@ class PullTaskManager:
         with self._lock:
             return self.tasks.get(task_id)
 
+    def get_pull_tasks_for_model(self, model_name: str) -> List[PullTask]:
+        """Get every known pull task for a model, without scanning all tasks."""
+        with self._lock:
+            task_ids = self._task_ids_by_model.get(model_name, ())
+            return [self.tasks[task_id] for task_id in task_ids if task_id in self.tasks]
+
+    def get_latest_pull_task_for_model(self, model_name: str) -> Optional[PullTask]:
+        """Get the most recently created pull task for a model, if any."""
+        with self._lock:
+            task_ids = self._task_ids_by_model.get(model_name)
+            if not task_ids:
+                return None
+            return self.tasks.get(next(reversed(task_ids)))
+    
+    def _add_task(self, task: PullTask):
+        """Register a task and index it by model. Caller holds the lock."""
+        self.tasks[task.task_id] = task
+        self._task_ids_by_model.setdefault(task.model_name, {})[task.task_id] = None
+    
+    def _pop_task(self, task_id: str) -> Optional[PullTask]:
+        """Remove a task and its index entry. Caller holds the lock."""
+        task = self.tasks.pop(task_id, None)
+        if task is not None:
+            task_ids = self._task_ids_by_model.get(task.model_name)
+            if task_ids is not None:
+                task_ids.pop(task_id, None)
+                if not task_ids:
+                    del self._task_ids_by_model[task.model_name]
+            self._signal_completion(task_id)
+        return task
+
+    def get_completion_event(self, task_id: str) -> asyncio.Event:
+        """
+        Get an event that is set once a task finishes, fails, is cancelled or is removed.
+
+        Must be called from the event loop that will wait on the event. The
+        pull thread sets it through that loop, so waiters sleep until the
+        task actually changes state instead of polling.
+
+        Args:
+            task_id: The pull task ID
+
+        Returns:
+            The task's completion event, already set if the task is not active
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self.tasks.get(task_id)
+            if task is None or task.status not in _ACTIVE_STATUSES:
+                event = asyncio.Event()
+                event.set()
+                return event
+            entry = self._completion_events.get(task_id)
+            if entry is None or entry[0] is not loop:
+                entry = (loop, asyncio.Event())
+                self._completion_events[task_id] = entry
+            return entry[1]
+
+    def _signal_completion(self, task_id: str):
+        """Set a task's completion event, if anyone asked for it. Caller holds the lock."""
+        entry = self._completion_events.pop(task_id, None)
+        if entry is None:
+            return
+        loop, event = entry
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # The loop has been closed; nobody is waiting any more
+            pass
+    
+    def get_pull_tasks_page(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Tuple[List[PullTask], Optional[str]]:
+        """
+        Get pull tasks in creation order, optionally filtered and paginated.
+
+        Args:
+            limit: Maximum number of tasks to return; None returns all of them
+            cursor: ID of the last task on the previous page
+            status: Only return tasks with this status
+
+        Returns:
+            Tuple of (tasks, cursor for the next page or None)
+        """
+        page: List[PullTask] = []
+        with self._lock:
+            tasks = iter(self.tasks.values())
+            if cursor is not None:
+                # Skip past the cursor; an unknown cursor yields an empty page
+                for task in tasks:
+                    if task.task_id == cursor:
+                        break
+            for task in tasks:
+                if status is not None and task.status != status:
+                    continue
+                if limit is not None and len(page) == limit:
+                    return page, page[-1].task_id
+                page.append(task)
+        return page, None
+
     def get_all_pull_tasks(self) -> Dict[str, PullTask]:
         """Get all pull tasks."""
         with self._lock:
@@ -196,11 +316,28 @@ class PullTaskManager:
                 self.progress_callbacks[task_id] = lst
             lst.append(callback)
 
-    def unregister_progress_callback(self, task_id: str):
-        """Unregister a progress callback."""
+    def unregister_progress_callback(
+        self, task_id: str, callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ):
+        """Unregister a progress callback.
+
+        Args:
+            task_id: The pull task ID
+            callback: The callback to remove; None removes every callback for the task
+        """
         with self._lock:
-            # Remove all callbacks for this task (caller expects to unregister by task_id)
-            self.progress_callbacks.pop(task_id, None)
+            if callback is None:
+                self.progress_callbacks.pop(task_id, None)
+                return
+            callbacks = self.progress_callbacks.get(task_id)
+            if callbacks is None:
+                return
+            try:
+                callbacks.remove(callback)
+            except ValueError:
+                pass
+            if not callbacks:
+                del self.progress_callbacks[task_id]
 
     def update_progress(self, task_id: str, progress: Dict[str, Any]):
         """Update progress for a running task."""
@@ -214,20 +351,22 @@ class PullTaskManager:
 
                 # Always update internal progress record and last_progress_update timestamp
                 task.progress = progress
-                task.last_progress_update = datetime.now()
+                task.last_progress_update = utc_now()
+                task.last_progress_monotonic = time.monotonic()
 
                 # Prepare for potential emission
                 callbacks = list(self.progress_callbacks.get(task_id, []))
 
                 # Check if we should emit based on throttling rules
                 should_emit = self.progress_throttler.should_emit_progress(
-                    progress, task.last_emit_time, task.last_emitted_percent
+                    progress, task.last_emit_time, task.last_emitted_percent,
+                    task.last_emitted_status
                 )
 
                 # If we decided to emit, record emit metadata now while still under lock
                 if should_emit:
-                    import time
                     task.last_emit_time = time.time()
+                    task.last_emitted_status = progress.get('status')
                     progress_pct = self.progress_throttler._extract_percent(progress)
                     if progress_pct is not None:
                         task.last_emitted_percent = progress_pct
@@ -239,7 +378,7 @@ class PullTaskManager:
                 try:
                     cb(task_id, safe_progress)
                 except Exception as e:
-                    logger.error(f"Error in progress callback for task {task_id}: {e}")
+                    logger.error("Error in progress callback for task %s: %s", task_id, e)
 
             # Persist progress emission
             try:
@@ -263,7 +402,7 @@ class PullTaskManager:
             elif available_gb < 5.0:  # Less than 5GB available
                 progress['disk_space_warning'] = f"Disk space running low: {available_gb:.2f}GB available"
         except Exception as e:
-            logger.debug(f"Failed to check disk space for progress update: {e}")
+            logger.debug("Failed to check disk space for progress update: %s", e)
 
     def _cleanup_failed_task(self, task_id: str):
         """Clean up a failed task from the active downloads."""
@@ -271,9 +410,9 @@ class PullTaskManager:
             if task_id in self.tasks:
                 task = self.tasks[task_id]
                 if task.status == 'error':
-                    self.tasks.pop(task_id, None)
+                    self._pop_task(task_id)
                     self.progress_callbacks.pop(task_id, None)
-                    logger.info(f"Cleaned up failed pull task {task_id}")
+                    logger.info("Cleaned up failed pull task %s", task_id)
         # Persist change
         try:
             self._persist_tasks()
@@ -290,7 +429,9 @@ class PullTaskManager:
         """Load persisted tasks from disk."""
         persisted_tasks = self.persistence.load_persisted_tasks(PullTask)
         with self._lock:
-            self.tasks.update(persisted_tasks)
+            # In creation order, so the per-model index ends with the newest task
+            for task in sorted(persisted_tasks.values(), key=lambda t: t.created_at):
+                self._add_task(task)
 
     def cancel_pull_task(self, task_id: str) -> bool:
         """Cancel a running pull task."""
@@ -298,20 +439,22 @@ class PullTaskManager:
             return False
 
         task = self.tasks[task_id]
-        if task.status not in ['pending', 'running'] or not task.task_handle:
+        if task.status not in _ACTIVE_STATUSES or not task.task_handle:
             return False
 
         # For threading, we can't directly cancel like with asyncio
         # Instead, we'll mark it as cancelled and let the pull function handle it
         task.status = 'cancelled'
-        task.completed_at = datetime.now()
+        task.completed_at = utc_now()
+        with self._lock:
+            self._signal_completion(task_id)
         # Signal stop event so cooperative pull function can abort
         try:
             if task.stop_event:
                 task.stop_event.set()
         except Exception:
             pass
-        logger.info(f"Requested cancellation of pull task {task_id}")
+        logger.info("Requested cancellation of pull task %s", task_id)
         try:
             self._persist_tasks()
         except Exception:
@@ -326,7 +469,8 @@ class PullTaskManager:
                 return False
             task.status = 'error'
             task.error = message
-            task.completed_at = datetime.now()
+            task.completed_at = utc_now()
+            self._signal_completion(task_id)
         try:
             self._persist_tasks()
         except Exception:
@@ -349,8 +493,8 @@ class PullTaskManager:
 
             # Remove callbacks and task record immediately
             self.progress_callbacks.pop(task_id, None)
-            self.tasks.pop(task_id, None)
-            logger.info(f"Permanently removed pull task {task_id}")
+            self._pop_task(task_id)
+            logger.info("Permanently removed pull task %s", task_id)
 
         # Persist change
         try:
@@ -367,8 +511,8 @@ class PullTaskManager:
                 return None
             thread_alive = bool(t.task_handle and hasattr(t.task_handle, 'is_alive') and t.task_handle.is_alive())
             last_update_age = None
-            if t.last_progress_update:
-                last_update_age = (datetime.now() - t.last_progress_update).total_seconds()
+            if t.last_progress_monotonic is not None:
+                last_update_age = time.monotonic() - t.last_progress_monotonic
             
             # Calculate available concurrency slots
             available_slots = self._concurrency_semaphore._value
@@ -405,7 +549,7 @@ class PullTaskManager:
     def _resume_incomplete_tasks(self):
         """When the manager starts, resume pulls that were recorded as pending/running but have no active worker."""
         with self._lock:
-            tasks_to_resume = [tid for tid, t in self.tasks.items() if t.status in ('pending', 'running')]
+            tasks_to_resume = [tid for tid, t in self.tasks.items() if t.status in _ACTIVE_STATUSES]
 
         for tid in tasks_to_resume:
             with self._lock:
@@ -426,13 +570,14 @@ class PullTaskManager:
             try:
                 # Use start_pull_task so bookkeeping is consistent
                 self.start_pull_task(tid, lambda task_id, stop_event=None: self._perform_pull_model(task_id, t.model_name, stop_event))
-                logger.info(f"Resumed pull task {tid} for model {t.model_name}")
+                logger.info("Resumed pull task %s for model %s", tid, t.model_name)
             except Exception:
-                logger.exception(f"Failed to resume pull task {tid}")
+                logger.exception("Failed to resume pull task %s", tid)
 
     def shutdown(self):
         """Publicly stop the cleanup worker and perform any shutdown tasks."""
         self.cleanup_service.stop_cleanup()
+        self.pull_executor.close()
 
     def _perform_pull_model(self, task_id: str, model_name: str, stop_event: Optional[threading.Event] = None):
         """Internal method to perform the model pull using Ollama API with retry logic."""
@@ -480,9 +625,9 @@ class PullTaskManager:
                         task = self.tasks.get(task_id)
                         if task:
                             task.retry_count = attempt
-                            task.last_retry_at = datetime.now()
+                            task.last_retry_at = utc_now()
                     
-                    logger.warning(f"Pull attempt {attempt} failed for {model_name}: {e}. Retrying in {backoff_seconds}s")
+                    logger.warning("Pull attempt %s failed for %s: %s. Retrying in %ss", attempt, model_name, e, backoff_seconds)
                     time.sleep(backoff_seconds)
                 else:
                     # No more retries or non-retryable error
@@ -519,6 +664,6 @@ class PullTaskManager:
             
             return stat.free >= required_with_margin
         except Exception as e:
-            logger.warning(f"Failed to check disk space: {e}")
+            logger.warning("Failed to check disk space: %s", e)
             # On error, assume there's space (fail later during pull)
             return True
@@ -1,12 +1,48 @@
 """
 Storage module for persistent data management.
 """
+import weakref
+from typing import Dict
+
+from ..core.config import settings
 from .unified_storage import UnifiedStorage
-from .base import BaseStorage
+from .base import BaseStorage, ListOptions
+from .async_storage import AsyncStorage, close_write_batchers
+
+# One backend per data directory, shared by every caller in the process
+_storage_instances: Dict[str, BaseStorage] = {}
+# Async facades keyed by id() of the backend they wrap. Entries are weak, so
+# a backend that is no longer used (e.g. a test's temporary one) can be
+# collected; a live facade holds its backend, so the id cannot be reused
+_async_storage_instances: "weakref.WeakValueDictionary[int, AsyncStorage]" = weakref.WeakValueDictionary()
+
 
 def get_storage() -> BaseStorage:
-    """Factory function to get the current storage backend."""
-    # Use the unified storage
-    return UnifiedStorage()
+    """Factory function to get the current storage backend.
+    
+    The backend is created once per configured data directory and reused,
+    so request handlers do not rebuild it (and re-check its directories and
+    index) on every call.
+    """
+    data_dir = settings.data_directory
+    storage = _storage_instances.get(data_dir)
+    if storage is None:
+        storage = _storage_instances.setdefault(data_dir, UnifiedStorage(data_dir))
+    return storage
+
+
+def get_async_storage() -> AsyncStorage:
+    """Factory function to get the current storage backend behind an async facade.
+    
+    Route modules importing storage separately end up on one facade, and so
+    on one write batcher, for as long as the facade is in use.
+    """
+    storage = get_storage()
+    facade = _async_storage_instances.get(id(storage))
+    if facade is None or facade.storage is not storage:
+        facade = AsyncStorage(storage)
+        _async_storage_instances[id(storage)] = facade
+    return facade
+
 
-__all__ = ["UnifiedStorage", "BaseStorage"]
\ No newline at end of file
+__all__ = ["UnifiedStorage", "BaseStorage", "ListOptions", "AsyncStorage", "close_write_batchers"]
@@ -0,0 +1,251 @@
+"""
+Async facade over the synchronous storage backends.
+"""
+import asyncio
+import contextvars
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..core.config import settings
+from .base import BaseStorage, ListOptions
+from .read_batcher import ExperimentReadBatcher
+from .read_cache import MISS
+from .write_batcher import ExperimentWriteBatcher
+
+# Dedicated worker pool for blocking storage I/O, sized independently of the
+# loop's default executor so storage bursts cannot starve other offloaded work
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.storage_max_workers,
+            thread_name_prefix='storage'
+        )
+    return _executor
+
+
+# One write batcher per backend, shared by every AsyncStorage wrapping it
+_batchers: "weakref.WeakKeyDictionary[BaseStorage, ExperimentWriteBatcher]" = weakref.WeakKeyDictionary()
+
+
+def _batch_writer(storage: BaseStorage) -> Callable[[List[Tuple]], Awaitable[List[Any]]]:
+    """Build the write callable for a backend's batcher.
+    
+    The backend is only weakly referenced, so the batcher stored as its
+    value in _batchers does not keep the weak key alive. Callers submitting
+    writes go through a facade that holds the backend for them.
+    """
+    storage_ref = weakref.ref(storage)
+    
+    async def write(operations: List[Tuple]) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        func = functools.partial(ctx.run, storage_ref().write_experiments, operations)
+        return await loop.run_in_executor(_get_executor(), func)
+    
+    return write
+
+
+async def close_write_batchers() -> None:
+    """Flush queued experiment writes and stop the batch workers."""
+    for batcher in list(_batchers.values()):
+        await batcher.aclose()
+
+
+class AsyncStorage:
+    """Awaitable wrapper around a BaseStorage implementation.
+    
+    The storage backends do blocking file I/O. Each call here runs the
+    underlying method on the storage worker pool so request handlers can
+    await storage without stalling the event loop. Context variables (such
+    as the logging experiment_id) are propagated to the worker thread.
+    """
+    
+    def __init__(self, storage: BaseStorage):
+        self.storage = storage
+        self._batcher: Optional[ExperimentWriteBatcher] = None
+        if hasattr(storage, 'write_experiments'):
+            self._batcher = _batchers.get(storage)
+            if self._batcher is None:
+                self._batcher = _batchers.setdefault(storage, ExperimentWriteBatcher(_batch_writer(storage)))
+        self._reader: Optional[ExperimentReadBatcher] = None
+        if hasattr(storage, 'get_experiments_by_ids'):
+            self._reader = ExperimentReadBatcher(self.get_experiments_by_ids, settings.experiment_read_batch_window)
+        # Reads currently running on the worker pool, shared by concurrent callers
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Task] = {}
+    
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking storage call on the worker pool."""
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(_get_executor(), functools.partial(ctx.run, func, *args))
+    
+    async def _single_flight(self, key: Tuple[str, Hashable], load: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a read once for all concurrent callers asking for the same key.
+        
+        The first caller starts load() as a task; callers arriving while it
+        is running await the same task. Waiters are shielded, so a cancelled
+        request does not cancel the read for the others.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(load())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._read_done, key))
+        return await asyncio.shield(task)
+    
+    def _read_done(self, key: Tuple[str, Hashable], task: asyncio.Task) -> None:
+        """Forget a finished read and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+    
+    def _forget_experiment_reads(self, experiment_id: Optional[str]) -> None:
+        """Stop sharing in-flight reads of an experiment that is being written.
+        
+        Reads issued after a write starts then hit storage again instead of
+        joining one that began before it, preserving read-after-write.
+        """
+        self._inflight.pop(('experiment', experiment_id), None)
+        self._inflight.pop(('experiment_with_conversations', experiment_id), None)
+    
+    async def cached(self, key: Tuple[str, Hashable], load: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached result for key, or await load() and cache it.
+        
+        Args:
+            key: ``(kind, key)`` tuple; storage writes invalidate by kind and key
+            load: Coroutine function producing the value on a miss
+            
+        Returns:
+            The cached or freshly loaded value. None results are not cached.
+        """
+        cache = getattr(self.storage, 'read_cache', None)
+        if cache is None:
+            return await load()
+        value = cache.get(key)
+        if value is not MISS:
+            return value
+        generation = cache.generation
+        value = await load()
+        if value is not None:
+            cache.set(key, value, generation)
+        return value
+    
+    # Experiment storage methods
+    async def save_experiment(self, experiment: Dict[str, Any]) -> bool:
+        """Save an experiment to storage.
+        
+        Concurrent saves and updates are coalesced so a burst of them
+        rewrites the experiments index once.
+        """
+        self._forget_experiment_reads(experiment.get('id'))
+        if self._batcher is not None:
+            return await self._batcher.submit(('save', experiment))
+        return await self._run(self.storage.save_experiment, experiment)
+    
+    async def get_experiment(self, experiment_id: str) -> Optional[Dict[str, Any]]:
+        """Get an experiment by ID.
+        
+        Concurrent reads of one ID share a single load, and reads of
+        different IDs arriving within the batch window are loaded together.
+        """
+        if self._reader is not None:
+            load = functools.partial(self._reader.load, experiment_id)
+        else:
+            load = functools.partial(self._run, self.storage.get_experiment, experiment_id)
+        return await self._single_flight(('experiment', experiment_id), load)
+    
+    async def get_experiments_by_ids(self, experiment_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get several experiments by ID in a single worker call (None for missing IDs)."""
+        return await self._run(self.storage.get_experiments_by_ids, experiment_ids)
+    
+    async def get_experiments(self, list_opts: Optional[ListOptions] = None) -> List[Dict[str, Any]]:
+        """Get experiments from storage, newest first, filtered and paged by list_opts."""
+        return await self._run(self.storage.get_experiments, list_opts)
+    
+    async def get_experiment_with_conversations(
+        self,
+        experiment_id: str
+    ) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Get an experiment and its conversations in a single worker call, shared
+        by concurrent callers like get_experiment."""
+        return await self._single_flight(
+            ('experiment_with_conversations', experiment_id),
+            functools.partial(self._run, self.storage.get_experiment_with_conversations, experiment_id)
+        )
+    
+    async def update_experiment(self, experiment_id: str, updates: Dict[str, Any]) -> bool:
+        """Update an existing experiment with new data (coalesced like save_experiment)."""
+        self._forget_experiment_reads(experiment_id)
+        if self._batcher is not None:
+            return await self._batcher.submit(('update', experiment_id, updates))
+        return await self._run(self.storage.update_experiment, experiment_id, updates)
+    
+    async def delete_experiment(self, experiment_id: str) -> bool:
+        """Delete an experiment and its associated data."""
+        self._forget_experiment_reads(experiment_id)
+        return await self._run(self.storage.delete_experiment, experiment_id)
+    
+    async def delete_experiment_cascade(self, experiment_id: str) -> int:
+        """Delete an experiment with its conversations in a single worker call."""
+        self._forget_experiment_reads(experiment_id)
+        return await self._run(self.storage.delete_experiment_cascade, experiment_id)
+    
+    # Conversation storage methods
+    async def save_conversation(self, conversation: Dict[str, Any]) -> bool:
+        """Save an imported conversation to storage."""
+        return await self._run(self.storage.save_conversation, conversation)
+    
+    async def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single conversation by its ID."""
+        return await self._run(self.storage.get_conversation, conversation_id)
+    
+    async def get_conversations(self, source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get conversations, optionally filtered by source."""
+        return await self._run(self.storage.get_conversations, source)
+    
+    async def iter_conversations(self, source: Optional[str] = None, chunk_size: int = 32) -> AsyncIterator[Dict[str, Any]]:
+        """Yield conversations without loading them all at once.
+        
+        Files are read ``chunk_size`` at a time on the worker pool, so memory
+        is bounded by one chunk. Conversations are yielded in directory order
+        rather than sorted by import time.
+        
+        Args:
+            source: Optional source filter
+            chunk_size: Number of files read per worker call
+        """
+        paths = await self._run(self.storage.get_conversation_paths, source)
+        for start in range(0, len(paths), chunk_size):
+            chunk = await self._run(self.storage.read_conversations, paths[start:start + chunk_size], source)
+            for conversation in chunk:
+                yield conversation
+    
+    async def update_conversation(self, conversation_id: str, updates: Dict[str, Any]) -> bool:
+        """Update an existing conversation with new data."""
+        return await self._run(self.storage.update_conversation, conversation_id, updates)
+    
+    async def delete_conversation(self, conversation_id: str) -> bool:
+        """Delete a conversation."""
+        return await self._run(self.storage.delete_conversation, conversation_id)
+    
+    async def delete_conversations(self, conversation_ids: List[str]) -> int:
+        """Delete several conversations, returning how many were removed."""
+        return await self._run(self.storage.delete_conversations, conversation_ids)
+    
+    # Experiment conversation methods
+    async def get_experiment_conversations(self, experiment_id: str) -> List[Dict[str, Any]]:
+        """Get all conversations for a specific experiment."""
+        return await self._run(self.storage.get_experiment_conversations, experiment_id)
+    
+    # Utility methods
+    async def get_storage_info(self) -> Dict[str, Any]:
+        """Get information about stored data."""
+        return await self._run(self.storage.get_storage_info)
@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Any, FrozenSet, Optional
 import os
 import json
 import tempfile
 from pathlib import Path
 
 
+@dataclass(frozen=True)
+class ListOptions:
+    """Filtering and paging applied by the backend when listing experiments.
+    
+    Results are always ordered newest first by ``created_at``.
+    """
+    exclude_ids: FrozenSet[str] = frozenset()
+    limit: Optional[int] = None
+    # ID of the last experiment on the previous page
+    cursor: Optional[str] = None
+
+
 class BaseStorage(ABC):
     """Abstract base class for storage implementations."""
 
@@ -31,7 +44,7 @@ class BaseStorage(ABC):
             try:
                 validate_model(**data)
             except Exception as e:
-                raise ValueError(f"Data validation failed: {e}")
+                raise ValueError(f"Data validation failed: {e}") from e
         
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -61,7 +74,7 @@ class BaseStorage(ABC):
                 os.unlink(temp_path)
             except (OSError, FileNotFoundError):
                 pass
-            raise IOError(f"Error writing {file_path}: {e}")
+            raise IOError(f"Error writing {file_path}: {e}") from e
 
     @abstractmethod
     def save_experiment(self, experiment: Dict[str, Any]) -> bool:
@@ -74,8 +87,8 @@ class BaseStorage(ABC):
         pass
 
     @abstractmethod
-    def get_experiments(self) -> List[Dict[str, Any]]:
-        """Get all experiments."""
+    def get_experiments(self, list_opts: Optional[ListOptions] = None) -> List[Dict[str, Any]]:
+        """Get experiments, newest first, filtered and paged by list_opts."""
         pass
 
     @abstractmethod
@@ -123,6 +136,11 @@ class BaseStorage(ABC):
         """Delete an imported conversation."""
         pass
 
+    @abstractmethod
+    def delete_conversations(self, conversation_ids: List[str]) -> int:
+        """Delete several imported conversations, returning how many were removed."""
+        pass
+
     @abstractmethod
     def clear_all(self) -> bool:
         """Clear all stored data."""
@@ -2,7 +2,6 @@
 Conversation-specific storage operations.
 """
 import uuid
-from datetime import datetime, UTC
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
@@ -10,6 +9,7 @@ from ..core.config import settings
 from ..core.exceptions import StorageError
 from ..utils.file_utilities import FileLockManager, AtomicFileWriter
 from ..utils.logging import get_logger
+from ..utils.timestamps import timestamp_sort_key, utc_now_iso
 
 logger = get_logger(__name__)
 
@@ -59,7 +59,7 @@ class ConversationStorage:
         conversation['experiment_id'] = experiment_id
         conversation['iteration'] = iteration
         conversation['title'] = title
-        conversation['created_at'] = datetime.now(UTC).isoformat()
+        conversation['created_at'] = utc_now_iso()
         
         # Use per-experiment lock for conversation writes too
         lock_path = self._get_experiment_lock_path(experiment_id)
@@ -69,7 +69,7 @@ class ConversationStorage:
             with lock:
                 return self.file_writer.write_json_atomic(file_path, conversation)
         except Exception as e:
-            raise StorageError(f"Error saving conversation: {e}")
+            raise StorageError(f"Error saving conversation: {e}") from e
     
     def get_experiment_conversations(self, experiment_id: str) -> List[Dict[str, Any]]:
         """Get all conversations for a specific experiment from the new folder structure."""
@@ -95,7 +95,7 @@ class ConversationStorage:
             file_path.unlink()
             return True
         except Exception as e:
-            raise StorageError(f"Error deleting conversation {file_path}: {e}")
+            raise StorageError(f"Error deleting conversation {file_path}: {e}") from e
     
     def save_conversation(self, conversation: Dict[str, Any]) -> bool:
         """Save an imported conversation (legacy method) with validation.
@@ -115,7 +115,7 @@ class ConversationStorage:
         
         # Ensure imported_at is set
         if 'imported_at' not in conversation:
-            conversation['imported_at'] = datetime.now(UTC).isoformat()
+            conversation['imported_at'] = utc_now_iso()
         
         # Use deterministic filename based on id for atomic updates
         filename = f"{conversation_id}.json"
@@ -125,21 +125,38 @@ class ConversationStorage:
     
     def get_conversations(self, source: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get imported conversations only (legacy method)."""
+        conversations = self.read_conversations(self.get_conversation_paths(source), source)
+        
+        # Sort by imported_at (newest first)
+        conversations.sort(key=lambda x: timestamp_sort_key(x.get('imported_at')), reverse=True)
+        return conversations
+    
+    def get_conversation_paths(self, source: Optional[str] = None) -> List[Path]:
+        """List the files that may hold conversations for source, without reading them."""
         if source == 'experiment':
             return []  # Experiment conversations are now stored differently
         
         if not self.imported_dir.exists():
             return []
         
+        return list(self.imported_dir.glob("*.json"))
+    
+    def read_conversations(self, paths: List[Path], source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Read conversation files, keeping those that match source.
+        
+        Args:
+            paths: Files returned by get_conversation_paths
+            source: Optional source filter
+            
+        Returns:
+            Conversations in the order of paths; unreadable files are skipped
+        """
         conversations = []
-        for file_path in self.imported_dir.glob("*.json"):
+        for file_path in paths:
             conversation = self.file_writer.read_json_safe(file_path)
             if conversation:
                 if source is None or conversation.get('source') == source:
                     conversations.append(conversation)
-        
-        # Sort by imported_at (newest first)
-        conversations.sort(key=lambda x: x.get('imported_at', ''), reverse=True)
         return conversations
     
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
@@ -224,7 +241,7 @@ class ConversationStorage:
                 deterministic_path.unlink()
                 return True
             except Exception as e:
-                raise StorageError(f"Error deleting conversation {deterministic_path}: {e}")
+                raise StorageError(f"Error deleting conversation {deterministic_path}: {e}") from e
         
         # Fallback: Search through all files to find conversation with matching ID
         for file_path in self.imported_dir.glob("*.json"):
@@ -234,10 +251,54 @@ class ConversationStorage:
                     file_path.unlink()
                     return True
                 except Exception as e:
-                    raise StorageError(f"Error deleting conversation {file_path}: {e}")
+                    raise StorageError(f"Error deleting conversation {file_path}: {e}") from e
         
         return False
     
+    def delete_conversations(self, conversation_ids: List[str]) -> int:
+        """Delete several imported conversations in one pass.
+        
+        Deterministic {id}.json files are unlinked directly; any ids left over
+        are resolved with a single scan of legacy files rather than one scan
+        per id.
+        
+        Args:
+            conversation_ids: IDs of the conversations to delete
+            
+        Returns:
+            Number of conversations deleted
+        """
+        if not conversation_ids or not self.imported_dir.exists():
+            return 0
+        
+        deleted = 0
+        remaining = set()
+        for conversation_id in conversation_ids:
+            deterministic_path = self.imported_dir / f"{conversation_id}.json"
+            if not deterministic_path.exists():
+                remaining.add(conversation_id)
+                continue
+            try:
+                deterministic_path.unlink()
+                deleted += 1
+            except Exception as e:
+                raise StorageError(f"Error deleting conversation {deterministic_path}: {e}") from e
+        
+        if not remaining:
+            return deleted
+        
+        # Fallback for legacy timestamped filenames: one scan for all leftover ids
+        for file_path in self.imported_dir.glob("*.json"):
+            conversation = self.file_writer.read_json_safe(file_path)
+            if conversation and conversation.get('id') in remaining:
+                try:
+                    file_path.unlink()
+                    deleted += 1
+                except Exception as e:
+                    raise StorageError(f"Error deleting conversation {file_path}: {e}") from e
+        
+        return deleted
+    
     def clear_all(self) -> bool:
         """Clear all conversation data (for testing/debugging)."""
         try:
@@ -249,7 +310,7 @@ class ConversationStorage:
             
             return True
         except Exception as e:
-            raise StorageError(f"Error clearing conversation data: {e}")
+            raise StorageError(f"Error clearing conversation data: {e}") from e
     
     def get_storage_info(self) -> Dict[str, Any]:
         """Get information about stored conversation data."""
@@ -2,14 +2,15 @@
 Experiment-specific storage operations.
 """
 import uuid
-from datetime import datetime, UTC
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from ..core.config import settings
 from ..core.exceptions import StorageError
 from ..utils.file_utilities import FileLockManager, AtomicFileWriter, StorageIndex
 from ..utils.logging import get_logger
+from ..utils.timestamps import timestamp_sort_key, utc_now_iso
+from .base import ListOptions
 
 logger = get_logger(__name__)
 
@@ -45,13 +46,17 @@ class ExperimentStorage:
     
     def save_experiment(self, experiment: Dict[str, Any]) -> bool:
         """Save an experiment to a JSON file with validation and locking."""
+        return self._save_experiment(experiment, update_index=True)
+    
+    def _save_experiment(self, experiment: Dict[str, Any], update_index: bool) -> bool:
+        """Save an experiment file under its lock, optionally updating the index."""
         experiment_id = experiment.get('id')
         if not experiment_id:
             experiment_id = str(uuid.uuid4())
             experiment['id'] = experiment_id
 
         if 'created_at' not in experiment:
-            experiment['created_at'] = datetime.now(UTC).isoformat()
+            experiment['created_at'] = utc_now_iso()
 
         file_path = self._get_experiment_path(experiment_id)
         file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -62,59 +67,62 @@ class ExperimentStorage:
         
         try:
             with lock:
-                return self._save_experiment_internal(experiment_id, experiment, file_path)
+                return self._save_experiment_internal(experiment_id, experiment, file_path, update_index)
         except Exception as e:
-            raise StorageError(f"Error saving experiment: {e}")
+            raise StorageError(f"Error saving experiment: {e}") from e
     
-    def _save_experiment_internal(self, experiment_id: str, experiment: Dict[str, Any], file_path: Path) -> bool:
+    def _save_experiment_internal(
+        self,
+        experiment_id: str,
+        experiment: Dict[str, Any],
+        file_path: Path,
+        update_index: bool = True
+    ) -> bool:
         """Internal method to save experiment without locking (called from within locked context)."""
         # Write experiment file
         if self.file_writer.write_json_atomic(file_path, experiment):
-            # Update index
-            self._update_index(experiment_id, experiment)
+            if update_index:
+                self._update_index(experiment_id, experiment)
             return True
         return False
     
     def _update_index(self, experiment_id: str, experiment: Dict[str, Any]):
         """Update the experiment index."""
+        self._update_index_many([experiment])
+    
+    def _update_index_many(self, experiments: List[Dict[str, Any]]):
+        """Update the experiment index for several experiments with one read and one write."""
         index = self.index.read_index()
+        positions = {exp['id']: i for i, exp in enumerate(index)}
         
-        # Try to find existing entry to preserve created_at if updating
-        existing_entry = None
-        for exp in index:
-            if exp['id'] == experiment_id:
-                existing_entry = exp
-                break
-        
-        # Use existing created_at if available, otherwise from experiment, otherwise generate new
-        created_at = None
-        if existing_entry and existing_entry.get('created_at'):
-            created_at = existing_entry['created_at']
-        elif experiment.get('created_at'):
-            created_at = experiment['created_at']
-        else:
-            created_at = datetime.now(UTC).isoformat()
-        
-        # Create a slim version of the experiment for the index
-        experiment_metadata = {
-            'id': experiment.get('id'),
-            'title': experiment.get('title'),
-            'created_at': created_at,
-            'status': experiment.get('status'),
-        }
-
-        # Find if experiment already exists in index
-        found = False
-        for i, exp in enumerate(index):
-            if exp['id'] == experiment_id:
-                index[i] = experiment_metadata
-                found = True
-                break
-        
-        if not found:
-            index.append(experiment_metadata)
-        
-        index.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        for experiment in experiments:
+            experiment_id = experiment.get('id')
+            position = positions.get(experiment_id)
+            existing_entry = index[position] if position is not None else None
+            
+            # Use existing created_at if available, otherwise from experiment, otherwise generate new
+            if existing_entry and existing_entry.get('created_at'):
+                created_at = existing_entry['created_at']
+            elif experiment.get('created_at'):
+                created_at = experiment['created_at']
+            else:
+                created_at = utc_now_iso()
+            
+            # Create a slim version of the experiment for the index
+            experiment_metadata = {
+                'id': experiment_id,
+                'title': experiment.get('title'),
+                'created_at': created_at,
+                'status': experiment.get('status'),
+            }
+            
+            if position is None:
+                positions[experiment_id] = len(index)
+                index.append(experiment_metadata)
+            else:
+                index[position] = experiment_metadata
+        
+        index.sort(key=lambda x: timestamp_sort_key(x.get('created_at')), reverse=True)
         self.index.write_index(index)
     
     def get_experiment(self, experiment_id: str) -> Optional[Dict[str, Any]]:
@@ -122,17 +130,62 @@ class ExperimentStorage:
         file_path = self._get_experiment_path(experiment_id)
         return self.file_writer.read_json_safe(file_path)
     
-    def get_experiments(self) -> list:
-        """Get all experiments from the index."""
+    def get_experiments_by_ids(self, experiment_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get several experiments by ID in one call.
+        
+        Returns:
+            Mapping of each requested ID to its experiment, or None if missing
+        """
+        return {experiment_id: self.get_experiment(experiment_id) for experiment_id in experiment_ids}
+    
+    def get_experiments(self, list_opts: Optional[ListOptions] = None) -> list:
+        """
+        Get experiments from the index, newest first.
+        
+        Args:
+            list_opts: Optional IDs to exclude, page size and cursor (the ID
+                of the last experiment on the previous page). A cursor that
+                is no longer in the index (e.g. deleted) yields an empty
+                page rather than restarting from the first one.
+        """
         if not self.index_file.exists():
             self.index.rebuild_index(self.experiments_dir)
         
         experiments = self.index.read_index()
-        experiments.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-        return experiments
+        experiments.sort(key=lambda x: timestamp_sort_key(x.get('created_at')), reverse=True)
+        if list_opts is None:
+            return experiments
+        
+        if list_opts.cursor is not None:
+            # Resolve the cursor before exclusions so an excluded cursor
+            # still marks its position
+            for position, exp in enumerate(experiments):
+                if exp.get('id') == list_opts.cursor:
+                    experiments = experiments[position + 1:]
+                    break
+            else:
+                return []
+        if list_opts.exclude_ids:
+            experiments = [exp for exp in experiments if exp.get('id') not in list_opts.exclude_ids]
+        return experiments if list_opts.limit is None else experiments[:list_opts.limit]
     
     def update_experiment(self, experiment_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing experiment with new data, using locking."""
+        return self._update_experiment(experiment_id, updates, update_index=True) is not None
+    
+    def _update_experiment(
+        self,
+        experiment_id: str,
+        updates: Dict[str, Any],
+        update_index: bool
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update an experiment file under its lock, optionally updating the index.
+        
+        Returns:
+            The updated experiment, or None if it was not found or not written
+        """
         # Use per-experiment lock
         lock_path = self._get_experiment_lock_path(experiment_id)
         lock = self.lock_manager.get_lock(lock_path)
@@ -141,29 +194,81 @@ class ExperimentStorage:
             with lock:
                 experiment = self.get_experiment(experiment_id)
                 if not experiment:
-                    return False
+                    return None
                 
                 # Preserve created_at from existing experiment - never overwrite it
                 existing_created_at = experiment.get('created_at')
                 if not existing_created_at:
-                    existing_created_at = datetime.now(UTC).isoformat()
+                    existing_created_at = utc_now_iso()
                 
                 experiment.update(updates)
                 # Always preserve the original created_at
                 experiment['created_at'] = existing_created_at
+                # Changes whenever the record does; GET responses derive their ETag from it
+                experiment['updated_at'] = utc_now_iso()
                 
                 # Ensure created_at is set in the experiment itself
                 if 'created_at' not in experiment or not experiment['created_at']:
-                    experiment['created_at'] = datetime.now(UTC).isoformat()
+                    experiment['created_at'] = utc_now_iso()
                 
                 file_path = self._get_experiment_path(experiment_id)
                 # Call internal method that doesn't try to acquire lock again
-                return self._save_experiment_internal(experiment_id, experiment, file_path)
+                if self._save_experiment_internal(experiment_id, experiment, file_path, update_index):
+                    return experiment
+                return None
         except Exception as e:
-            raise StorageError(f"Error updating experiment: {e}")
+            raise StorageError(f"Error updating experiment: {e}") from e
+    
+    def write_experiments(self, operations: List[Tuple]) -> List[Union[bool, Exception]]:
+        """
+        Apply a batch of experiment saves and updates with a single index rewrite.
+        
+        Each experiment file is still written under its own lock; only the
+        shared index, which every write would otherwise read and rewrite in
+        full, is updated once for the whole batch.
+        
+        Args:
+            operations: ``('save', experiment)`` or ``('update', experiment_id, updates)`` tuples
+            
+        Returns:
+            One entry per operation, in order: the write's boolean result, or
+            the exception it raised
+        """
+        results: List[Union[bool, Exception]] = []
+        written: Dict[str, Dict[str, Any]] = {}
+        for operation in operations:
+            try:
+                if operation[0] == 'save':
+                    experiment = operation[1]
+                    result = self._save_experiment(experiment, update_index=False)
+                else:
+                    experiment = self._update_experiment(operation[1], operation[2], update_index=False)
+                    result = experiment is not None
+                if result:
+                    written[experiment['id']] = experiment
+                results.append(result)
+            except Exception as e:
+                results.append(e)
+        
+        if written:
+            try:
+                self._update_index_many(list(written.values()))
+            except Exception as e:
+                error = StorageError(f"Error updating experiment index: {e}")
+                results = [error if result is True else result for result in results]
+        return results
+    
+    def experiment_lock(self, experiment_id: str):
+        """Return the per-experiment lock guarding its record and conversation files."""
+        return self.lock_manager.get_lock(self._get_experiment_lock_path(experiment_id))
     
     def delete_experiment(self, experiment_id: str) -> bool:
-        """Delete an experiment and its conversations folder."""
+        """Delete an experiment and its conversations folder, using locking."""
+        with self.experiment_lock(experiment_id):
+            return self.delete_experiment_unlocked(experiment_id)
+    
+    def delete_experiment_unlocked(self, experiment_id: str) -> bool:
+        """Delete an experiment without locking (caller holds experiment_lock)."""
         try:
             experiment_dir = self.experiments_dir / experiment_id
             if experiment_dir.exists() and experiment_dir.is_dir():
@@ -178,7 +283,7 @@ class ExperimentStorage:
                 return True
             return False
         except Exception as e:
-            raise StorageError(f"Error deleting experiment {experiment_id}: {e}")
+            raise StorageError(f"Error deleting experiment {experiment_id}: {e}") from e
     
     def clear_all(self) -> bool:
         """Clear all experiment data (for testing/debugging)."""
@@ -196,7 +301,7 @@ class ExperimentStorage:
             
             return True
         except Exception as e:
-            raise StorageError(f"Error clearing experiment data: {e}")
+            raise StorageError(f"Error clearing experiment data: {e}") from e
     
     def get_storage_info(self) -> Dict[str, Any]:
         """Get information about stored experiment data."""
@@ -0,0 +1,99 @@
+"""
+Coalesces concurrent experiment reads into batched storage calls.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bound on IDs loaded in one storage call
+MAX_BATCH_SIZE = 64
+
+
+class ExperimentReadBatcher:
+    """Collect experiment reads for a short window and load them together.
+
+    Polling clients send many ``GET /api/experiments/{id}`` requests within
+    a few milliseconds of each other. The first ``load`` arms a timer for
+    ``window`` seconds; every ID requested before it fires (or until
+    ``max_batch`` IDs are pending) is handed to ``read`` in one call, so a
+    burst costs one trip to the storage worker pool instead of one each.
+    Requests for an ID that is already pending share its result.
+
+    A non-positive ``window`` flushes on the next loop iteration, which
+    still groups reads issued in the same iteration.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        window: float,
+        max_batch: int = MAX_BATCH_SIZE
+    ):
+        self._read = read
+        self.window = window
+        self.max_batch = max_batch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Running batch tasks, referenced so they are not garbage collected
+        self._batches: Set[asyncio.Task] = set()
+
+    async def load(self, experiment_id: str) -> Optional[Dict[str, Any]]:
+        """Queue one ID for the next batch and wait for its experiment.
+
+        Args:
+            experiment_id: The experiment ID to load
+
+        Returns:
+            The stored experiment, or None if it does not exist
+
+        Raises:
+            Exception: Whatever the storage raised for the batch
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pending reads from a previous loop can never complete
+            self._loop = loop
+            self._pending = {}
+            self._timer = None
+        future = self._pending.get(experiment_id)
+        if future is None:
+            future = loop.create_future()
+            self._pending[experiment_id] = future
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(max(self.window, 0), self._flush)
+        # Shielded so one cancelled caller does not fail the others sharing the ID
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Start loading every pending ID as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = self._loop.create_task(self._apply(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _apply(self, batch: Dict[str, asyncio.Future]) -> None:
+        """Load one batch and resolve each caller's future."""
+        try:
+            results = await self._read(list(batch))
+        except Exception as e:
+            logger.error("Batched experiment read failed: %s", e)
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Retrieved here in case every waiter was cancelled
+                    future.exception()
+            return
+        for experiment_id, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(experiment_id))
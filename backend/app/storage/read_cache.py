@@ -0,0 +1,71 @@
+"""
+In-process read-through cache for storage reads.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# Returned by ReadCache.get when a key is absent or expired
+MISS = object()
+
+
+class ReadCache:
+    """Small TTL + LRU cache for read results, invalidated by storage writes.
+
+    Keys are ``(kind, key)`` tuples, e.g. ``('conversation', conversation_id)``,
+    so writers can drop a single entry or every entry of one kind. Values may
+    be set from the event loop and invalidated from storage worker threads, so
+    every operation takes a lock.
+
+    Each invalidation bumps a generation counter. Readers capture it before
+    loading and pass it to ``set``; a value loaded while a write was in
+    flight is discarded instead of being cached stale.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.generation = 0
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, Hashable]) -> Any:
+        """Return the cached value for key, or MISS."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return MISS
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Tuple[str, Hashable], value: Any, generation: int) -> None:
+        """Cache value for key unless an invalidation happened since generation."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry of ``kind`` when key is None."""
+        with self._lock:
+            self.generation += 1
+            if key is not None:
+                self._entries.pop((kind, key), None)
+                return
+            for cached_key in [k for k in self._entries if k[0] == kind]:
+                del self._entries[cached_key]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
@@ -2,13 +2,14 @@
 Unified storage implementation using specialized storage services.
 """
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from ..core.config import settings
 from ..core.exceptions import StorageError
-from .base import BaseStorage
+from .base import BaseStorage, ListOptions
 from .experiment_storage import ExperimentStorage
 from .conversation_storage import ConversationStorage
+from .read_cache import ReadCache
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +24,12 @@ class UnifiedStorage(BaseStorage):
         # Initialize specialized storage services
         self.experiment_storage = ExperimentStorage(self.data_dir)
         self.conversation_storage = ConversationStorage(self.data_dir)
+        
+        # Cached conversation reads; every write below invalidates what it touches
+        self.read_cache = ReadCache(
+            ttl=settings.conversation_cache_ttl,
+            maxsize=settings.conversation_cache_size
+        )
     
     # Experiment storage methods - delegate to ExperimentStorage
     def save_experiment(self, experiment: Dict[str, Any]) -> bool:
@@ -33,22 +40,54 @@ class UnifiedStorage(BaseStorage):
         """Get an experiment by ID."""
         return self.experiment_storage.get_experiment(experiment_id)
     
-    def get_experiments(self) -> List[Dict[str, Any]]:
-        """Get all experiments from storage."""
-        return self.experiment_storage.get_experiments()
+    def get_experiments_by_ids(self, experiment_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get several experiments by ID in one call (None for missing IDs)."""
+        return self.experiment_storage.get_experiments_by_ids(experiment_ids)
+    
+    def get_experiments(self, list_opts: Optional[ListOptions] = None) -> List[Dict[str, Any]]:
+        """Get experiments from storage, newest first, filtered and paged by list_opts."""
+        return self.experiment_storage.get_experiments(list_opts)
+    
+    def get_experiment_with_conversations(
+        self,
+        experiment_id: str
+    ) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Get an experiment and its conversations in one call.
+        
+        Conversations are only read when the experiment exists.
+        
+        Returns:
+            Tuple of (experiment or None, its conversations)
+        """
+        experiment = self.experiment_storage.get_experiment(experiment_id)
+        if experiment is None:
+            return None, []
+        return experiment, self.get_experiment_conversations(experiment_id)
     
     def update_experiment(self, experiment_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing experiment with new data."""
         return self.experiment_storage.update_experiment(experiment_id, updates)
     
+    def write_experiments(self, operations: List[Tuple]) -> List[Union[bool, Exception]]:
+        """Apply a batch of experiment saves and updates with a single index rewrite."""
+        return self.experiment_storage.write_experiments(operations)
+    
     def delete_experiment(self, experiment_id: str) -> bool:
         """Delete an experiment and its associated data."""
-        return self.experiment_storage.delete_experiment(experiment_id)
+        try:
+            return self.experiment_storage.delete_experiment(experiment_id)
+        finally:
+            self.read_cache.invalidate('experiment_conversations', experiment_id)
+            # Conversation ids are not always derived from the experiment id
+            self.read_cache.invalidate('conversation')
     
     # Conversation storage methods - delegate to ConversationStorage
     def save_conversation(self, conversation: Dict[str, Any]) -> bool:
         """Save an imported conversation to storage."""
-        return self.conversation_storage.save_conversation(conversation)
+        try:
+            return self.conversation_storage.save_conversation(conversation)
+        finally:
+            self._invalidate_conversation(conversation.get('id'))
     
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get a single conversation by its ID."""
@@ -58,13 +97,66 @@ class UnifiedStorage(BaseStorage):
         """Get conversations, optionally filtered by source."""
         return self.conversation_storage.get_conversations(source)
     
+    def get_conversation_paths(self, source: Optional[str] = None) -> List[Path]:
+        """List conversation files for source without reading them."""
+        return self.conversation_storage.get_conversation_paths(source)
+    
+    def read_conversations(self, paths: List[Path], source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Read a slice of conversation files, keeping those that match source."""
+        return self.conversation_storage.read_conversations(paths, source)
+    
     def update_conversation(self, conversation_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing conversation with new data."""
-        return self.conversation_storage.update_conversation(conversation_id, updates)
+        try:
+            return self.conversation_storage.update_conversation(conversation_id, updates)
+        finally:
+            self._invalidate_conversation(conversation_id)
     
     def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation."""
-        return self.conversation_storage.delete_conversation(conversation_id)
+        try:
+            return self.conversation_storage.delete_conversation(conversation_id)
+        finally:
+            self._invalidate_conversation(conversation_id)
+    
+    def delete_conversations(self, conversation_ids: List[str]) -> int:
+        """Delete several conversations, returning how many were removed."""
+        try:
+            return self.conversation_storage.delete_conversations(conversation_ids)
+        finally:
+            self.read_cache.invalidate('conversation')
+            self.read_cache.invalidate('conversations')
+    
+    def delete_experiment_cascade(self, experiment_id: str) -> int:
+        """Delete an experiment, its conversations and any imported copies of them.
+        
+        Args:
+            experiment_id: ID of the experiment to delete
+            
+        Returns:
+            Number of experiment conversations that were deleted
+        """
+        # Held across the whole cascade so no conversation of this experiment
+        # can be written between listing and removing them
+        with self.experiment_storage.experiment_lock(experiment_id):
+            try:
+                conversation_ids = [
+                    conversation['id']
+                    for conversation in self.conversation_storage.get_experiment_conversations(experiment_id)
+                    if conversation.get('id')
+                ]
+                # Removes the experiment folder, including its conversations
+                self.experiment_storage.delete_experiment_unlocked(experiment_id)
+            finally:
+                self.read_cache.invalidate('experiment_conversations', experiment_id)
+            self.delete_conversations(conversation_ids)
+        return len(conversation_ids)
+    
+    def _invalidate_conversation(self, conversation_id: Optional[str]) -> None:
+        """Drop cached reads affected by a write to an imported conversation."""
+        if conversation_id:
+            self.read_cache.invalidate('conversation', conversation_id)
+        self.read_cache.invalidate('conversations')
     
     # Experiment conversation methods - delegate to ConversationStorage
     def save_experiment_conversation(
@@ -76,9 +168,12 @@ class UnifiedStorage(BaseStorage):
         experiment_title: str = None
     ) -> bool:
         """Save an experiment conversation."""
-        return self.conversation_storage.save_experiment_conversation(
-            experiment_id, iteration, title, conversation, experiment_title
-        )
+        try:
+            return self.conversation_storage.save_experiment_conversation(
+                experiment_id, iteration, title, conversation, experiment_title
+            )
+        finally:
+            self._invalidate_experiment_conversation(experiment_id, iteration)
     
     def get_experiment_conversations(self, experiment_id: str) -> List[Dict[str, Any]]:
         """Get all conversations for a specific experiment."""
@@ -86,7 +181,15 @@ class UnifiedStorage(BaseStorage):
     
     def delete_experiment_conversation(self, experiment_id: str, iteration: int, title: str) -> bool:
         """Delete a specific experiment conversation."""
-        return self.conversation_storage.delete_experiment_conversation(experiment_id, iteration, title)
+        try:
+            return self.conversation_storage.delete_experiment_conversation(experiment_id, iteration, title)
+        finally:
+            self._invalidate_experiment_conversation(experiment_id, iteration)
+    
+    def _invalidate_experiment_conversation(self, experiment_id: str, iteration: int) -> None:
+        """Drop cached reads affected by a write to an experiment conversation."""
+        self.read_cache.invalidate('conversation', f"{experiment_id}_{iteration}")
+        self.read_cache.invalidate('experiment_conversations', experiment_id)
     
     # Utility methods
     def clear_all(self) -> bool:
@@ -96,7 +199,9 @@ class UnifiedStorage(BaseStorage):
             conversation_success = self.conversation_storage.clear_all()
             return experiment_success and conversation_success
         except Exception as e:
-            raise StorageError(f"Error clearing data: {e}")
+            raise StorageError(f"Error clearing data: {e}") from e
+        finally:
+            self.read_cache.clear()
     
     def get_storage_info(self) -> Dict[str, Any]:
         """Get information about stored data."""
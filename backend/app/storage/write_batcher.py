@@ -0,0 +1,110 @@
+"""
+Coalesces concurrent experiment writes into batched storage calls.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bound on operations applied in one storage call
+MAX_BATCH_SIZE = 64
+# How long the worker keeps collecting operations after the first one arrives
+BATCH_WINDOW_SECONDS = 0.01
+
+
+class ExperimentWriteBatcher:
+    """Queue experiment saves/updates and apply bursts of them in one call.
+
+    Every experiment write rereads and rewrites the whole experiments index.
+    A single worker task picks up the first queued operation, keeps
+    collecting for ``window`` seconds (or until ``max_batch`` operations),
+    and hands the batch to ``write_experiments`` so the index is rewritten
+    once per burst. Callers await a future resolved with their own
+    operation's result, so they still see request/response semantics.
+
+    The worker is started lazily on the running loop, so the batcher works
+    whether or not the application lifespan has run.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Tuple]], Awaitable[List[Any]]],
+        max_batch: int = MAX_BATCH_SIZE,
+        window: float = BATCH_WINDOW_SECONDS
+    ):
+        self._write = write
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, operation: Tuple) -> bool:
+        """Queue one operation and wait for its result.
+
+        Args:
+            operation: ``('save', experiment)`` or ``('update', experiment_id, updates)``
+
+        Returns:
+            The storage result for this operation
+
+        Raises:
+            Exception: Whatever the storage raised for this operation
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        future = loop.create_future()
+        self._queue.put_nowait((operation, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect queued operations into batches and apply them until closed."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            item = await queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            await self._apply(batch)
+
+    async def _apply(self, batch: List[Tuple[Tuple, asyncio.Future]]) -> None:
+        """Apply one batch and resolve each caller's future."""
+        try:
+            results = await self._write([operation for operation, _ in batch])
+        except Exception as e:
+            logger.error("Batched experiment write failed: %s", e)
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Apply anything already queued, then stop the worker."""
+        worker = self._worker
+        self._worker = None
+        if worker is None or worker.done() or worker.get_loop() is not asyncio.get_running_loop():
+            return
+        self._queue.put_nowait(None)
+        await worker
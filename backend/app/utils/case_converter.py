@@ -4,28 +4,38 @@ This module provides bidirectional conversion to handle the mismatch between
 frontend (camelCase) and backend (snake_case) naming conventions.
 """
 import re
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Union
 
+_CAMEL_WORD = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY = re.compile('([a-z0-9])([A-Z])')
 
+
+@lru_cache(maxsize=4096)
 def camel_to_snake(name: str) -> str:
     """
     Convert camelCase to snake_case.
     
+    Results are cached per key; payload keys come from a small, fixed set.
+    
     Examples:
         experimentId -> experiment_id
         createdAt -> created_at
         currentIteration -> current_iteration
     """
     # Insert underscore before uppercase letters (except at start)
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    s1 = _CAMEL_WORD.sub(r'\1_\2', name)
     # Insert underscore before uppercase letters preceded by lowercase
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    return _CAMEL_BOUNDARY.sub(r'\1_\2', s1).lower()
 
 
+@lru_cache(maxsize=4096)
 def snake_to_camel(name: str) -> str:
     """
     Convert snake_case to camelCase.
     
+    Results are cached per key; payload keys come from a small, fixed set.
+    
     Examples:
         experiment_id -> experimentId
         created_at -> createdAt
@@ -36,11 +46,73 @@ def snake_to_camel(name: str) -> str:
     return components[0] + ''.join(x.title() for x in components[1:])
 
 
+def _convert_keys(data: Any, convert_key: Callable[[str], str], deep: bool) -> Any:
+    """
+    Convert dictionary keys with ``convert_key``, walking nested data iteratively.
+    
+    Containers whose keys are already in the target case and whose nested
+    values are unchanged are returned as-is instead of being rebuilt.
+    
+    Args:
+        data: Dictionary, list, or primitive value to normalize
+        convert_key: Scalar key converter
+        deep: If True, process nested dicts and lists as well
+        
+    Returns:
+        Data structure with converted keys
+    """
+    if not deep:
+        if isinstance(data, dict):
+            return {convert_key(key): value for key, value in data.items()}
+        return data
+    if not isinstance(data, (dict, list)):
+        return data
+
+    # Each frame is [node, child values, next child index, converted values, changed]
+    stack = [[data, list(data.values()) if isinstance(data, dict) else data, 0, [], False]]
+    result = data
+    while stack:
+        frame = stack[-1]
+        children = frame[1]
+        index = frame[2]
+        if index < len(children):
+            child = children[index]
+            if isinstance(child, (dict, list)):
+                values = list(child.values()) if isinstance(child, dict) else child
+                stack.append([child, values, 0, [], False])
+                continue
+            frame[3].append(child)
+            frame[2] = index + 1
+            continue
+
+        node, _, _, converted, changed = frame
+        stack.pop()
+        if isinstance(node, dict):
+            keys = [convert_key(key) for key in node]
+            if changed or keys != list(node):
+                node = dict(zip(keys, converted))
+        elif changed:
+            node = converted
+
+        if stack:
+            parent = stack[-1]
+            parent[3].append(node)
+            parent[2] += 1
+            if node is not parent[1][parent[2] - 1]:
+                parent[4] = True
+        else:
+            result = node
+    return result
+
+
 def normalize_dict_to_snake(data: Union[Dict[str, Any], List, Any], deep: bool = True) -> Union[Dict[str, Any], List, Any]:
     """
     Recursively convert all dictionary keys from camelCase to snake_case.
     Also accepts both forms, preferring the snake_case version if both exist.
     
+    Nested containers that are already in snake_case are reused rather than
+    copied, so callers must not assume the result is a fresh object.
+    
     Args:
         data: Dictionary, list, or primitive value to normalize
         deep: If True, recursively process nested structures
@@ -48,34 +120,16 @@ def normalize_dict_to_snake(data: Union[Dict[str, Any], List, Any], deep: bool =
     Returns:
         Data structure with all keys converted to snake_case
     """
-    if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            # Convert key to snake_case
-            snake_key = camel_to_snake(key)
-            
-            # Recursively process value if deep=True
-            if deep and isinstance(value, (dict, list)):
-                result[snake_key] = normalize_dict_to_snake(value, deep=True)
-            else:
-                result[snake_key] = value
-        
-        return result
-    
-    elif isinstance(data, list):
-        if deep:
-            return [normalize_dict_to_snake(item, deep=True) for item in data]
-        return data
-    
-    else:
-        # Primitive type, return as-is
-        return data
+    return _convert_keys(data, camel_to_snake, deep)
 
 
 def normalize_dict_to_camel(data: Union[Dict[str, Any], List, Any], deep: bool = True) -> Union[Dict[str, Any], List, Any]:
     """
     Recursively convert all dictionary keys from snake_case to camelCase.
     
+    Nested containers that are already in camelCase are reused rather than
+    copied, so callers must not assume the result is a fresh object.
+    
     Args:
         data: Dictionary, list, or primitive value to normalize
         deep: If True, recursively process nested structures
@@ -83,28 +137,7 @@ def normalize_dict_to_camel(data: Union[Dict[str, Any], List, Any], deep: bool =
     Returns:
         Data structure with all keys converted to camelCase
     """
-    if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            # Convert key to camelCase
-            camel_key = snake_to_camel(key)
-            
-            # Recursively process value if deep=True
-            if deep and isinstance(value, (dict, list)):
-                result[camel_key] = normalize_dict_to_camel(value, deep=True)
-            else:
-                result[camel_key] = value
-        
-        return result
-    
-    elif isinstance(data, list):
-        if deep:
-            return [normalize_dict_to_camel(item, deep=True) for item in data]
-        return data
-    
-    else:
-        # Primitive type, return as-is
-        return data
+    return _convert_keys(data, snake_to_camel, deep)
 
 
 def accept_both_forms(data: Dict[str, Any], keys_to_check: List[str]) -> Dict[str, Any]:
@@ -0,0 +1,28 @@
+"""
+ETag helpers for conditional GET responses.
+"""
+import hashlib
+from typing import Optional
+
+
+def make_etag(data: bytes) -> str:
+    """
+    Strong ETag derived from a response body or version string.
+
+    Args:
+        data: Bytes that change whenever the representation changes
+
+    Returns:
+        Quoted ETag value, ready for the ETag header
+    """
+    return f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    return any(
+        candidate.strip().removeprefix('W/') in (etag, '*')
+        for candidate in if_none_match.split(',')
+    )
@@ -1,18 +1,26 @@
 """
 Helper functions for experiment-related operations.
 """
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from ..core.state import state_manager
-from ..storage import get_storage
+from ..schemas.conversation import CONVERSATION_LIST
+from ..storage import ListOptions, get_async_storage
 from ..utils.logging import get_logger
+from ..utils.timestamps import timestamp_sort_key
 
 logger = get_logger(__name__)
 
+# Stored experiment records read per storage call while building the list
+_LIST_LOAD_CHUNK = 32
 
-def get_experiment_with_fallback(experiment_id: str) -> Optional[Dict[str, Any]]:
+
+async def get_experiment_with_fallback(experiment_id: str) -> Optional[Dict[str, Any]]:
     """
     Get experiment from active state or persistent storage with fallback.
     
+    Storage reads are awaited on the storage worker pool, so the event loop
+    keeps serving other requests during disk I/O.
+    
     Args:
         experiment_id: The experiment ID to retrieve
         
@@ -25,43 +33,59 @@ def get_experiment_with_fallback(experiment_id: str) -> Optional[Dict[str, Any]]
         if experiment:
             return {
                 "experiment_id": experiment.experiment_id,
-                "title": experiment.task.prompt[:100] + ("..." if len(experiment.task.prompt) > 100 else ""),
+                "title": truncate_title(experiment.task.prompt),
                 "status": experiment.status,
                 "conversation": None,  # Will be set by caller if needed
-                "conversations": [c.model_dump() if hasattr(c, 'model_dump') else c for c in experiment.conversations],
+                "conversations": CONVERSATION_LIST.dump_python(experiment.conversations, warnings=False),
                 "iterations": experiment.iterations,
                 "current_iteration": experiment.current_iteration,
-                "agents": [a.model_dump() if hasattr(a, 'model_dump') else a for a in experiment.agents],
+                "agents": experiment.agent_dicts(),
                 "created_at": experiment.created_at,
                 "error": experiment.error
             }
     except Exception as e:
-        logger.warning(f"Failed to get active experiment {experiment_id}: {e}")
+        logger.warning("Failed to get active experiment %s: %s", experiment_id, e)
     
-    # If not in active experiments, check persistent storage
-    storage = get_storage()
-    stored_experiment = storage.get_experiment(experiment_id)
+    # If not in active experiments, read the record and its conversations together
+    storage = get_async_storage()
+    stored_experiment, conversations = await storage.get_experiment_with_conversations(experiment_id)
     if stored_experiment:
-                    # Get conversations for this experiment
-        conversations = storage.get_experiment_conversations(experiment_id)
-        
-        return {
-            "experiment_id": experiment_id,
-            "title": stored_experiment.get('title', f'Experiment {experiment_id}'),
-            "task": stored_experiment.get('task'),
-            "status": stored_experiment.get('status', 'unknown'),
-            "conversation": None,  # No live conversation for stored experiments
-            "conversations": conversations,
-            "iterations": stored_experiment.get('iterations', 1),
-            "current_iteration": stored_experiment.get('current_iteration', 0),
-            "agents": stored_experiment.get('agents', []),
-            "created_at": stored_experiment.get('created_at'),
-            "error": None
-        }
+        return stored_experiment_details(experiment_id, stored_experiment, conversations)
     
     return None
 
 
+def stored_experiment_details(
+    experiment_id: str,
+    stored_experiment: Dict[str, Any],
+    conversations: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Shape a persisted experiment and its conversations into the details response.
+    
+    Args:
+        experiment_id: The experiment ID
+        stored_experiment: The experiment record as read from storage
+        conversations: The experiment's stored conversations
+        
+    Returns:
+        Experiment data dictionary
+    """
+    return {
+        "experiment_id": experiment_id,
+        "title": stored_experiment.get('title', f'Experiment {experiment_id}'),
+        "task": stored_experiment.get('task'),
+        "status": stored_experiment.get('status', 'unknown'),
+        "conversation": None,  # No live conversation for stored experiments
+        "conversations": conversations,
+        "iterations": stored_experiment.get('iterations', 1),
+        "current_iteration": stored_experiment.get('current_iteration', 0),
+        "agents": stored_experiment.get('agents', []),
+        "created_at": stored_experiment.get('created_at'),
+        "error": None
+    }
+
+
 def serialize_experiment(experiment) -> Dict[str, Any]:
     """
     Serialize an experiment object to dictionary format.
@@ -105,59 +129,81 @@ def truncate_title(title: str, max_length: int = 100) -> str:
     return title
 
 
-def get_experiment_list_with_storage() -> list:
+async def iter_experiment_list(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Tuple[AsyncIterator[Dict[str, Any]], Optional[str]]:
     """
-    Get combined list of active and stored experiments.
+    Get combined list of active and stored experiments, yielded lazily.
+    
+    Active experiments are listed on the first page only; ``limit`` and
+    ``cursor`` page through the stored ones, which storage returns already
+    filtered and sorted.
+    
+    Only the index rows are read up front; stored experiment records (for
+    their agents) are loaded a chunk at a time as entries are reached, so
+    callers can send entries while the rest are still being read.
     
+    Args:
+        limit: Maximum number of stored experiments to return
+        cursor: ID of the last stored experiment on the previous page
+        
     Returns:
-        List of experiment dictionaries
+        Tuple of (async iterator over entries, newest first, cursor for the
+        next page or None)
     """
     from ..services.experiment_service import ExperimentService
     
-    # Get active experiments
-    experiments_list = ExperimentService.list_experiments()
-    experiments = []
-    
-    for exp in experiments_list:
-        exp_dict = serialize_experiment(exp)
-        # Get the full experiment state to include agents
-        experiment_state = state_manager.get_experiment(exp.experiment_id)
-        if experiment_state:
-            exp_dict['agents'] = [agent.model_dump() for agent in experiment_state.agents]
-        else:
-            exp_dict['agents'] = []
-        experiments.append(exp_dict)
-    
-    # Get stored experiments (excluding active ones)
-    storage = get_storage()
-    stored_experiments = storage.get_experiments()
-    for stored_exp in stored_experiments:
-        # Skip if already in active experiments
-        if not any(exp['experiment_id'] == stored_exp['id'] for exp in experiments):
-            # Load full experiment data to get agents
-            full_experiment = storage.get_experiment(stored_exp['id'])
-            if full_experiment:
-                experiments.append({
-                    "experiment_id": stored_exp['id'],
-                    "title": stored_exp['title'],
-                    "status": stored_exp.get('status', 'unknown'),
-                    "created_at": stored_exp.get('created_at'),
-                    "agents": full_experiment.get('agents', []),
-                    "agent_count": len(full_experiment.get('agents', [])),
-                    "message_count": 0  # We don't store message count in persistent storage
-                })
-            else:
-                # Fallback to index data if full experiment can't be loaded
-                experiments.append({
-                    "experiment_id": stored_exp['id'],
-                    "title": stored_exp['title'],
-                    "status": stored_exp.get('status', 'unknown'),
-                    "created_at": stored_exp.get('created_at'),
-                    "agents": [],
-                    "agent_count": 0,
-                    "message_count": 0
-                })
-    
-    # Sort by created_at (newest first)
-    experiments.sort(key=lambda x: x['created_at'], reverse=True)
-    return experiments
+    # Get active experiments (already plain dicts, newest first)
+    active_experiments = ExperimentService.list_experiment_summaries()
+    
+    # Get stored experiments (excluding active ones), already sorted and paged
+    storage = get_async_storage()
+    stored_experiments = await storage.get_experiments(ListOptions(
+        exclude_ids=frozenset(exp['experiment_id'] for exp in active_experiments),
+        limit=limit,
+        cursor=cursor
+    ))
+    
+    next_cursor = None
+    if limit is not None and len(stored_experiments) == limit:
+        next_cursor = stored_experiments[-1]['id']
+    
+    # Active experiments only appear on the first page
+    if cursor is not None:
+        active_experiments = []
+    
+    async def entries() -> AsyncIterator[Dict[str, Any]]:
+        # Both sequences are newest first; merge them, active first on ties
+        position = 0
+        for start in range(0, len(stored_experiments), _LIST_LOAD_CHUNK):
+            chunk = stored_experiments[start:start + _LIST_LOAD_CHUNK]
+            # Load full experiment data to get agents, one worker call per chunk
+            full_experiments = await storage.get_experiments_by_ids([exp['id'] for exp in chunk])
+            for stored_exp in chunk:
+                # Compare instants, not strings: older stored records may
+                # hold naive local timestamps
+                created_at = timestamp_sort_key(stored_exp.get('created_at'))
+                while position < len(active_experiments) and timestamp_sort_key(active_experiments[position]['created_at']) >= created_at:
+                    yield active_experiments[position]
+                    position += 1
+                yield _stored_list_entry(stored_exp, full_experiments.get(stored_exp['id']))
+        for active_exp in active_experiments[position:]:
+            yield active_exp
+    
+    return entries(), next_cursor
+
+
+def _stored_list_entry(stored_exp: Dict[str, Any], full_experiment: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a list entry from an index row and its full record, if it loaded."""
+    # Fall back to index data if the full experiment can't be loaded
+    agents = full_experiment.get('agents', []) if full_experiment else []
+    return {
+        "experiment_id": stored_exp['id'],
+        "title": stored_exp['title'],
+        "status": stored_exp.get('status', 'unknown'),
+        "created_at": stored_exp.get('created_at'),
+        "agents": agents,
+        "agent_count": len(agents),
+        "message_count": 0  # We don't store message count in persistent storage
+    }
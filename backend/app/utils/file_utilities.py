@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, Type
 from filelock import FileLock
 
 from ..utils.logging import get_logger
+from ..utils.timestamps import timestamp_sort_key
 
 logger = get_logger(__name__)
 
@@ -63,7 +64,7 @@ class AtomicFileWriter:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to write {file_path}: {e}")
+            logger.error("Failed to write %s: %s", file_path, e)
             # Clean up temp file if it exists
             tmp_path = str(file_path) + '.tmp'
             if os.path.exists(tmp_path):
@@ -89,7 +90,7 @@ class AtomicFileWriter:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     return json.load(f)
         except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to read {file_path}: {e}")
+            logger.warning("Failed to read %s: %s", file_path, e)
         return None
 
 
@@ -121,13 +122,13 @@ class StorageIndex:
                             continue
                         validated_entries.append(exp)
                     except Exception as e:
-                        logger.warning(f"Skipping invalid index entry: {e}")
+                        logger.warning("Skipping invalid index entry: %s", e)
                         continue
                 
                 # Use atomic write
                 self.file_writer.write_json_atomic(self.index_file, validated_entries)
             except Exception as e:
-                logger.error(f"Error writing index file: {e}")
+                logger.error("Error writing index file: %s", e)
                 raise
     
     def rebuild_index(self, experiments_dir: Path):
@@ -147,5 +148,5 @@ class StorageIndex:
                                 'status': experiment_data.get('status'),
                             })
         
-        experiments.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+        experiments.sort(key=lambda x: timestamp_sort_key(x.get('created_at')), reverse=True)
         self.write_index(experiments)
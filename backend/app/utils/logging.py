@@ -1,17 +1,51 @@
 """
 Structured logging utilities for LLaMa-Herd.
 """
+import atexit
+import copy
 import logging
-import json
 import os
+import queue
 import sys
 from datetime import datetime, UTC
-from typing import Any, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
 from contextvars import ContextVar
 
+import orjson
+
 # Context variable to store experiment_id across async contexts
 experiment_id_ctx: ContextVar[Optional[str]] = ContextVar('experiment_id', default=None)
 
+# Maximum number of records buffered for the listener thread before new
+# records are dropped instead of blocking the caller
+LOG_QUEUE_SIZE = 10000
+
+# Level names accepted by log_with_context, resolved once instead of per call
+_LEVELS: Dict[str, int] = {
+    name.lower(): getattr(logging, name)
+    for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+}
+
+
+def _format_timestamp(record: logging.LogRecord) -> str:
+    """Return the record creation time as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(record.created, UTC).isoformat().replace('+00:00', 'Z')
+
+
+def _record_experiment_id(record: logging.LogRecord) -> Optional[str]:
+    """Return the experiment_id captured on the record, or from the current context."""
+    if hasattr(record, 'experiment_id'):
+        return record.experiment_id
+    return experiment_id_ctx.get()
+
+
+def _exception_text(formatter: logging.Formatter, record: logging.LogRecord) -> Optional[str]:
+    """Return the formatted traceback for a record, if it carries one."""
+    if record.exc_info:
+        return formatter.formatException(record.exc_info)
+    return record.exc_text
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON structured log formatter."""
@@ -19,26 +53,28 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data: Dict[str, Any] = {
-            'timestamp': datetime.now(UTC).isoformat().replace('+00:00', 'Z'),
+            'timestamp': _format_timestamp(record),
             'level': record.levelname,
             'module': record.module,
             'message': record.getMessage(),
         }
         
         # Add experiment_id if available in context
-        experiment_id = experiment_id_ctx.get()
+        experiment_id = _record_experiment_id(record)
         if experiment_id:
             log_data['experiment_id'] = experiment_id
         
         # Add exception info if present
-        if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
+        exc_text = _exception_text(self, record)
+        if exc_text:
+            log_data['exception'] = exc_text
         
         # Add any extra fields passed to the logger
         if hasattr(record, 'extra_fields'):
             log_data.update(record.extra_fields)
         
-        return json.dumps(log_data)
+        # default=str keeps a record with an odd extra field loggable
+        return orjson.dumps(log_data, default=str).decode()
 
 
 class KeyValueFormatter(logging.Formatter):
@@ -47,13 +83,13 @@ class KeyValueFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as key=value pairs."""
         parts = [
-            f"timestamp={datetime.now(UTC).isoformat().replace('+00:00', 'Z')}",
+            f"timestamp={_format_timestamp(record)}",
             f"level={record.levelname}",
             f"module={record.module}",
         ]
         
         # Add experiment_id if available in context
-        experiment_id = experiment_id_ctx.get()
+        experiment_id = _record_experiment_id(record)
         if experiment_id:
             parts.append(f"experiment_id={experiment_id}")
         
@@ -63,20 +99,58 @@ class KeyValueFormatter(logging.Formatter):
         # Add any extra fields
         if hasattr(record, 'extra_fields'):
             for key, value in record.extra_fields.items():
-                parts.append(f"{key}={json.dumps(value)}")
+                parts.append(f"{key}={orjson.dumps(value, default=str).decode()}")
         
         # Add exception info if present
-        if record.exc_info:
-            exc_text = self.formatException(record.exc_info).replace('\n', '\\n')
+        exc_text = _exception_text(self, record)
+        if exc_text:
+            exc_text = exc_text.replace('\n', '\\n')
             parts.append(f"exception=\"{exc_text}\"")
         
         return ' '.join(parts)
 
 
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller and keeps structured fields.
+
+    Records are dropped when the queue is full so a burst of logging cannot
+    stall the event loop. Unlike the stdlib handler, the record is not
+    pre-formatted: the message is merged and the traceback rendered, but
+    extra fields and the experiment context are preserved for the
+    listener-side formatter.
+    """
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot everything that depends on the caller's context."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.experiment_id = experiment_id_ctx.get()
+        return record
+
+
+_handlers: List[logging.Handler] = []
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
 def setup_logging(log_format: str = "json", level: str = "INFO") -> logging.Logger:
     """
     Set up structured logging.
     
+    Records are handed to a background listener thread through a queue, so
+    the calling thread (usually the event loop) never blocks on I/O.
+    
     Args:
         log_format: Format type - 'json' or 'keyvalue'
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -84,6 +158,8 @@ def setup_logging(log_format: str = "json", level: str = "INFO") -> logging.Logg
     Returns:
         Configured logger instance
     """
+    stop_log_listener()
+    
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
@@ -102,11 +178,50 @@ def setup_logging(log_format: str = "json", level: str = "INFO") -> logging.Logg
         formatter = KeyValueFormatter()
     
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    _handlers[:] = [console_handler]
+    
+    start_log_listener()
     
     return root_logger
 
 
+def start_log_listener() -> None:
+    """Route root logger output through the queue listener thread (idempotent)."""
+    global _queue_handler, _listener
+    if _listener is not None:
+        return
+    
+    root_logger = logging.getLogger()
+    for handler in _handlers:
+        root_logger.removeHandler(handler)
+    
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    _queue_handler = _DroppingQueueHandler(log_queue)
+    _listener = QueueListener(log_queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    root_logger.addHandler(_queue_handler)
+
+
+def stop_log_listener() -> None:
+    """
+    Drain the log queue and stop the listener thread (idempotent).
+    
+    The real handlers are reattached to the root logger so anything logged
+    afterwards is still written, synchronously.
+    """
+    global _queue_handler, _listener
+    if _listener is None:
+        return
+    
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _handlers:
+        root_logger.addHandler(handler)
+    _queue_handler = None
+    _listener = None
+
+
 def get_logger(name: str = __name__) -> logging.Logger:
     """
     Get a logger instance.
@@ -130,21 +245,36 @@ def set_experiment_context(experiment_id: Optional[str]) -> None:
     experiment_id_ctx.set(experiment_id)
 
 
-def log_with_context(logger_instance: logging.Logger, level: str, message: str, **extra_fields: Any) -> None:
+def log_with_context(
+    logger_instance: logging.Logger,
+    level: str,
+    message: str,
+    *args: Any,
+    exc_info: Any = None,
+    **extra_fields: Any
+) -> None:
     """
     Log with additional context fields.
     
+    The message is %-formatted with ``args`` only if the record is emitted,
+    so disabled levels cost a single level check.
+    
     Args:
         logger_instance: Logger to use
         level: Log level (debug, info, warning, error, critical)
-        message: Log message
+        message: Log message, optionally a %-style template
+        *args: Arguments merged into the message template
+        exc_info: Exception (or exc_info tuple) whose traceback is logged
         **extra_fields: Additional fields to include in the log
     """
-    log_method = getattr(logger_instance, level.lower())
+    levelno = _LEVELS.get(level) or getattr(logging, level.upper())
+    if not logger_instance.isEnabledFor(levelno):
+        return
     
-    # Create a log record with extra fields
+    # Create a log record with extra fields; stacklevel attributes the
+    # record to the caller rather than this helper
     extra = {'extra_fields': extra_fields} if extra_fields else {}
-    log_method(message, extra=extra)
+    logger_instance.log(levelno, message, *args, exc_info=exc_info, extra=extra, stacklevel=2)
 
 
 # Initialize default logger
@@ -154,4 +284,5 @@ log_format = os.getenv('LOG_FORMAT', 'keyvalue')
 log_level = os.getenv('LOG_LEVEL', 'INFO')
 
 setup_logging(log_format=log_format, level=log_level)
+atexit.register(stop_log_listener)
 logger = get_logger(__name__)
@@ -0,0 +1,71 @@
+"""
+Timestamp helpers shared by request handlers, state and storage.
+"""
+from datetime import datetime, UTC
+from functools import lru_cache
+from typing import Optional
+
+
+def utc_now_iso() -> str:
+    """
+    Current time as an ISO 8601 UTC string with millisecond precision.
+    
+    Every record timestamp goes through here so stored values share one
+    format and sort correctly as strings.
+    
+    Returns:
+        Timestamp such as ``2024-01-01T12:00:00.000+00:00``
+    """
+    return datetime.now(UTC).isoformat(timespec='milliseconds')
+
+
+def utc_now() -> datetime:
+    """
+    Current time as a timezone-aware UTC datetime.
+    
+    Used for in-memory timestamps (such as pull tasks) so they serialize
+    with the same ``+00:00`` offset as utc_now_iso strings.
+    
+    Returns:
+        Aware datetime in UTC
+    """
+    return datetime.now(UTC)
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Convert a datetime to aware UTC, reading naive values as server-local time.
+    
+    Records written before timestamps moved to UTC hold naive local times;
+    this lets them be compared with current ones.
+    
+    Args:
+        value: Aware or naive datetime
+        
+    Returns:
+        The same instant as an aware UTC datetime
+    """
+    return value.astimezone(UTC)
+
+
+@lru_cache(maxsize=4096)
+def timestamp_sort_key(value: Optional[str]) -> float:
+    """
+    Sort key for an ISO 8601 timestamp string, ordering by the instant it names.
+    
+    New records use utc_now_iso, but older ones on disk hold naive local
+    ``isoformat()`` strings, which do not sort correctly against UTC strings
+    as plain text. Naive values are read as server-local time.
+    
+    Args:
+        value: ISO 8601 timestamp, possibly naive, empty or None
+        
+    Returns:
+        POSIX timestamp; missing or unparseable values sort as oldest
+    """
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
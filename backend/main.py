@@ -3,10 +3,17 @@
 Main entry point for the LLaMa-Herd Backend FastAPI application.
 """
 
+import importlib.util
+
 import uvicorn
 from app.core.config import settings
 
 
+def _optional_impl(module: str, name: str, fallback: str) -> str:
+    """Return the uvicorn implementation name if its module is installed."""
+    return name if importlib.util.find_spec(module) is not None else fallback
+
+
 def main():
     """Main function to start the FastAPI server."""
     print("🚀 Starting LLaMa-Herd Backend...")
@@ -23,7 +30,14 @@ def main():
         host=settings.api_host,
         port=settings.api_port,
         log_level="info",
-        reload=True,
+        # The reloader runs the app in a watched subprocess; production images
+        # turn it off. A single worker is required: experiment state and
+        # WebSocket subscribers live in process memory.
+        reload=settings.api_reload,
+        # uvloop/httptools are C-accelerated; fall back to asyncio/h11 where
+        # they are unavailable (e.g. uvloop on Windows)
+        loop=_optional_impl("uvloop", "uvloop", "asyncio"),
+        http=_optional_impl("httptools", "httptools", "h11"),
     )
 
 
@@ -1,6 +1,8 @@
 """
 Integration tests for conversations API endpoints.
 """
+import json
+
 import pytest
 from httpx import AsyncClient
 
@@ -260,3 +262,38 @@ class TestConversationsAPI:
         assert data["message"] == "Conversation saved"
         assert data["id"] == "multi-agent-conv"
 
+    
+    async def test_large_conversation_is_gzip_compressed(self, test_client: AsyncClient, sample_conversation):
+        """Test large conversation payloads are compressed for gzip-capable clients."""
+        # Arrange
+        sample_conversation["messages"][0]["content"] = "x" * 4096
+        await test_client.post("/api/conversations", json=sample_conversation)
+        
+        # Act
+        response = await test_client.get(
+            f"/api/conversations/{sample_conversation['id']}",
+            headers={"Accept-Encoding": "gzip"}
+        )
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["messages"][0]["content"] == "x" * 4096
+    
+    async def test_stream_conversations_ndjson(self, test_client: AsyncClient, sample_conversation):
+        """Test conversations are streamed one camelCase JSON object per line."""
+        # Arrange
+        for conversation_id in ("stream-1", "stream-2"):
+            await test_client.post("/api/conversations", json=dict(sample_conversation, id=conversation_id))
+        
+        # Act
+        response = await test_client.get("/api/conversations/stream")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        items = [json.loads(line) for line in response.text.splitlines()]
+        streamed = {item["id"]: item for item in items}
+        assert {"stream-1", "stream-2"} <= set(streamed)
+        assert "importedAt" in streamed["stream-1"]
+        assert "agentId" in streamed["stream-1"]["messages"][0]
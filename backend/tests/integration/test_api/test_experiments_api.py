@@ -24,6 +24,40 @@ class TestExperimentsAPI:
         assert data["status"] == "started"
         assert data["websocket_url"] == f"/ws/experiments/{data['experiment_id']}"
     
+    async def test_start_experiment_persists_metadata(self, test_client: AsyncClient, sample_experiment_request):
+        """Test the background task saves the experiment metadata."""
+        from app.api.routes import experiments as experiments_routes
+        
+        with patch.object(experiments_routes, 'autogen_service'):
+            # Act
+            response = await test_client.post("/api/experiments/start", json=sample_experiment_request.model_dump())
+        
+        # Assert
+        assert response.status_code == 200
+        experiment_id = response.json()["experiment_id"]
+        stored = await experiments_routes.storage.get_experiment(experiment_id)
+        assert stored["status"] == "running"
+    
+    async def test_start_experiment_persists_status_of_finished_run(self, test_client: AsyncClient, sample_experiment_request):
+        """Test a run that ends before the metadata is saved still leaves its final status."""
+        from app.api.routes import experiments as experiments_routes
+        from app.core.state import state_manager
+        
+        def fail_immediately(experiment_id, task, agents):
+            state_manager.update_experiment_status(experiment_id, 'error', error='boom')
+        
+        with patch.object(experiments_routes, 'autogen_service') as mock_service:
+            mock_service.start_experiment_background.side_effect = fail_immediately
+            
+            # Act
+            response = await test_client.post("/api/experiments/start", json=sample_experiment_request.model_dump())
+        
+        # Assert
+        experiment_id = response.json()["experiment_id"]
+        stored = await experiments_routes.storage.get_experiment(experiment_id)
+        assert stored["status"] == "error"
+        assert stored["error"] == "boom"
+    
     async def test_start_experiment_invalid_request(self, test_client: AsyncClient):
         """Test experiment start with invalid request data."""
         # Arrange
@@ -90,6 +124,51 @@ class TestExperimentsAPI:
         assert "agents" in data
         assert "status" in data
     
+    async def test_get_finished_experiment_revalidates_with_etag(self, test_client: AsyncClient, sample_experiment):
+        """Test finished experiments return an ETag and honor If-None-Match."""
+        from app.api.routes import experiments as experiments_routes
+        
+        # Arrange
+        experiment = {**sample_experiment, 'status': 'completed'}
+        await experiments_routes.storage.save_experiment(experiment)
+        url = f"/api/experiments/{experiment['id']}"
+        first = await test_client.get(url)
+        etag = first.headers["etag"]
+        
+        # Act
+        cached = await test_client.get(url, headers={"If-None-Match": etag})
+        await experiments_routes.storage.update_experiment(experiment['id'], {'title': 'Renamed'})
+        changed = await test_client.get(url, headers={"If-None-Match": etag})
+        
+        # Assert
+        assert first.status_code == 200
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["title"] == 'Renamed'
+    
+    async def test_get_stored_experiment_without_etag_uses_one_storage_read(self, test_client: AsyncClient, sample_experiment, monkeypatch):
+        """Test a plain GET reads the record and conversations in one fused call."""
+        from app.api.routes import experiments as experiments_routes
+        
+        # Arrange
+        experiment = {**sample_experiment, 'status': 'completed'}
+        await experiments_routes.storage.save_experiment(experiment)
+        
+        async def unexpected_read(experiment_id):
+            raise AssertionError("record read separately from its conversations")
+        
+        monkeypatch.setattr(experiments_routes.storage, 'get_experiment', unexpected_read)
+        
+        # Act
+        response = await test_client.get(f"/api/experiments/{experiment['id']}")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        assert response.json()["experiment_id"] == experiment['id']
+    
     async def test_get_experiment_not_found(self, test_client: AsyncClient):
         """Test getting non-existent experiment via API."""
         # Arrange
@@ -104,6 +183,18 @@ class TestExperimentsAPI:
         assert "error" in data
         assert "message" in data
     
+    async def test_get_default_chat_rules(self, test_client: AsyncClient):
+        """Test default chat rules are served with a cacheable response."""
+        # Act
+        response = await test_client.get("/api/experiments/default-chat-rules")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["max_rounds"] == 8
+        assert data["team_type"] == "round_robin"
+        assert response.headers["cache-control"] == "public, max-age=3600"
+    
     async def test_get_experiments_list(self, test_client: AsyncClient, sample_experiment_request, mock_autogen_service_patch):
         """Test getting list of experiments via API."""
         # Arrange - start multiple experiments
@@ -131,6 +222,79 @@ class TestExperimentsAPI:
         assert start_response1.json()["experiment_id"] in experiment_ids
         assert start_response2.json()["experiment_id"] in experiment_ids
     
+    async def test_get_experiments_list_skips_stored_copy_of_active_experiment(self, test_client: AsyncClient, sample_experiment_request):
+        """Test an active experiment that is also persisted is listed once."""
+        from app.api.routes import experiments as experiments_routes
+        
+        # Arrange
+        with patch.object(experiments_routes, 'autogen_service'):
+            start_response = await test_client.post("/api/experiments/start", json=sample_experiment_request.model_dump())
+        experiment_id = start_response.json()["experiment_id"]
+        
+        # Act
+        response = await test_client.get("/api/experiments")
+        
+        # Assert
+        assert response.status_code == 200
+        ids = [exp["experiment_id"] for exp in response.json()["experiments"]]
+        assert ids.count(experiment_id) == 1
+    
+    async def test_get_experiments_list_paginated(self, test_client: AsyncClient, temp_storage, sample_experiment):
+        """Test stored experiments can be paged with limit and cursor."""
+        # Arrange
+        for index in range(3):
+            experiment = sample_experiment.copy()
+            experiment['id'] = f'paged-{index}'
+            experiment['created_at'] = f'2024-01-0{index + 1}T00:00:00'
+            temp_storage.save_experiment(experiment)
+        
+        # Act
+        first = (await test_client.get("/api/experiments", params={"limit": 2})).json()
+        second = (await test_client.get("/api/experiments", params={"limit": 2, "cursor": first["next_cursor"]})).json()
+        
+        # Assert
+        # Experiments still active from earlier tests are listed on the first page too
+        assert [exp["experiment_id"] for exp in first["experiments"] if exp["experiment_id"].startswith('paged-')] == ['paged-2', 'paged-1']
+        assert first["next_cursor"] == 'paged-1'
+        assert [exp["experiment_id"] for exp in second["experiments"]] == ['paged-0']
+        assert second["next_cursor"] is None
+    
+    async def test_get_experiments_list_streams_in_chunks(self, test_client: AsyncClient, temp_storage, sample_experiment, monkeypatch):
+        """Test a listing sent in several chunks still forms one JSON document."""
+        from app.api.routes import experiments as experiments_routes
+        
+        # Arrange
+        monkeypatch.setattr(experiments_routes, '_LIST_CHUNK_BYTES', 1)
+        for index in range(3):
+            experiment = sample_experiment.copy()
+            experiment['id'] = f'chunked-{index}'
+            experiment['created_at'] = f'2024-02-0{index + 1}T00:00:00'
+            temp_storage.save_experiment(experiment)
+        
+        # Act
+        response = await test_client.get("/api/experiments", params={"limit": 3})
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert [exp["experiment_id"] for exp in data["experiments"] if exp["experiment_id"].startswith('chunked-')] == ['chunked-2', 'chunked-1', 'chunked-0']
+        assert data["next_cursor"] == 'chunked-0'
+    
+    async def test_get_experiments_list_aborts_on_error_mid_stream(self, test_client: AsyncClient, temp_storage, sample_experiment, monkeypatch):
+        """Test a read failure after headers are sent aborts the stream rather than ending it."""
+        # Arrange
+        temp_storage.save_experiment(sample_experiment)
+        
+        def failing_read(experiment_ids):
+            raise OSError("disk read failed")
+        
+        monkeypatch.setattr(temp_storage, 'get_experiments_by_ids', failing_read)
+        
+        # Act & Assert
+        with pytest.raises(OSError, match="disk read failed"):
+            await test_client.get("/api/experiments")
+    
     async def test_delete_experiment_success(self, test_client: AsyncClient, sample_experiment_request, mock_autogen_service_patch):
         """Test successful experiment deletion via API."""
         # Arrange - start an experiment first
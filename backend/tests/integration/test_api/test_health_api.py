@@ -0,0 +1,38 @@
+"""
+Integration tests for the health check endpoint.
+"""
+import warnings
+
+import pytest
+from httpx import AsyncClient
+
+from app import create_app
+
+
+@pytest.mark.integration
+class TestHealthAPI:
+    """Integration tests for the health check endpoint."""
+    
+    async def test_health_check(self, test_client: AsyncClient):
+        """Test health check returns the static healthy payload."""
+        # Act
+        response = await test_client.get("/health")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["cache-control"] == "no-store"
+        assert response.json() == {"status": "healthy", "service": "llama-herd-backend"}
+    
+    def test_routes_are_registered_once(self):
+        """Test no router is included twice (duplicates surface as repeated operation IDs)."""
+        # Arrange
+        app = create_app()
+        
+        # Act
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            app.openapi()
+        
+        # Assert
+        assert not [w for w in caught if 'Duplicate Operation ID' in str(w.message)]
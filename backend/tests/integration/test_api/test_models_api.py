@@ -0,0 +1,262 @@
+"""
+Integration tests for the model management endpoints.
+"""
+import httpx
+import pytest
+from httpx import AsyncClient
+
+from app.services import ollama_client
+from app.services.model_catalog_service import model_catalog_service
+
+
+@pytest.mark.integration
+class TestModelCatalogAPI:
+    """Integration tests for the model catalog endpoint."""
+    
+    async def test_catalog_revalidates_with_etag(self, test_client: AsyncClient, monkeypatch):
+        """Test the catalog carries an ETag that changes when the catalog is replaced."""
+        # Arrange
+        monkeypatch.setattr(model_catalog_service, '_cached_catalog', [{'name': 'Llama', 'tag': 'llama2', 'pull_count': 1}])
+        first = await test_client.get("/api/models/catalog")
+        etag = first.headers["etag"]
+        
+        # Act
+        cached = await test_client.get("/api/models/catalog", headers={"If-None-Match": etag})
+        monkeypatch.setattr(model_catalog_service, '_cached_catalog', [{'name': 'Mistral', 'tag': 'mistral', 'pull_count': 2}])
+        changed = await test_client.get("/api/models/catalog", headers={"If-None-Match": etag})
+        
+        # Assert
+        assert first.status_code == 200
+        assert first.json() == {"models": [{'name': 'Llama', 'tag': 'llama2', 'pull_count': 1}]}
+        assert cached.status_code == 304
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["models"][0]["tag"] == 'mistral'
+
+
+@pytest.mark.integration
+class TestListModelsAPI:
+    """Integration tests for listing installed models."""
+    
+    async def test_list_relays_ollama_body(self, test_client: AsyncClient, monkeypatch):
+        """Test Ollama's tags payload is returned byte for byte."""
+        # Arrange
+        body = b'{"models":[{"name":"llama2:latest","size":3825819519,"digest":"sha256:abc","modified_at":"2024-01-15T10:30:00Z","details":{"family":"llama"}}]}'
+        
+        async def fake_request(method, path, timeout=None, **kwargs):
+            return httpx.Response(200, content=body)
+        
+        monkeypatch.setattr(ollama_client, 'request', fake_request)
+        
+        # Act
+        response = await test_client.get("/api/models/list")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == body
+    
+    async def test_list_revalidates_with_etag(self, test_client: AsyncClient, monkeypatch):
+        """Test an unchanged model list is answered with 304."""
+        # Arrange
+        async def fake_request(method, path, timeout=None, **kwargs):
+            return httpx.Response(200, content=b'{"models":[]}')
+        
+        monkeypatch.setattr(ollama_client, 'request', fake_request)
+        first = await test_client.get("/api/models/list")
+        
+        # Act
+        cached = await test_client.get("/api/models/list", headers={"If-None-Match": first.headers["etag"]})
+        
+        # Assert
+        assert first.headers["cache-control"] == "no-cache"
+        assert cached.status_code == 304
+
+
+@pytest.mark.integration
+class TestDeleteModelAPI:
+    """Integration tests for deleting models through Ollama."""
+    
+    @pytest.fixture
+    def ollama_delete(self, monkeypatch):
+        """Answer Ollama requests with a configurable status and record them."""
+        calls = {'status': 200, 'requests': []}
+        
+        async def fake_request(method, path, timeout=None, **kwargs):
+            calls['requests'].append((method, path))
+            return httpx.Response(calls['status'], text="model not found" if calls['status'] == 404 else "")
+        
+        async def reachable(timeout=None):
+            return True
+        
+        monkeypatch.setattr(ollama_client, 'request', fake_request)
+        monkeypatch.setattr(ollama_client, 'is_reachable', reachable)
+        return calls
+    
+    async def test_delete_is_a_single_ollama_call(self, test_client: AsyncClient, ollama_delete):
+        """Test a delete goes straight to Ollama without listing models first."""
+        # Act
+        response = await test_client.delete("/api/models/delete/llama2")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        assert ollama_delete['requests'] == [('DELETE', '/api/delete')]
+    
+    async def test_delete_unknown_model_returns_404(self, test_client: AsyncClient, ollama_delete):
+        """Test Ollama's 404 for an unknown model is relayed as not found."""
+        # Arrange
+        ollama_delete['status'] = 404
+        
+        # Act
+        response = await test_client.delete("/api/models/delete/missing")
+        
+        # Assert
+        assert response.status_code == 404
+
+
+@pytest.mark.integration
+class TestOllamaAvailability:
+    """Integration tests for requests made while Ollama is down."""
+    
+    async def test_unreachable_ollama_returns_503(self, test_client: AsyncClient, monkeypatch):
+        """Test the connection dependency rejects requests before they reach Ollama."""
+        # Arrange
+        async def unreachable(timeout=None):
+            return False
+        
+        async def fail_request(*args, **kwargs):
+            raise AssertionError("Ollama should not be called")
+        
+        monkeypatch.setattr(ollama_client, 'is_reachable', unreachable)
+        monkeypatch.setattr(ollama_client, 'request', fail_request)
+        
+        # Act
+        response = await test_client.delete("/api/models/delete/llama2")
+        
+        # Assert
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Ollama service is not available"}
+    
+    async def test_list_skips_probe_and_maps_connection_error_to_503(self, test_client: AsyncClient, monkeypatch):
+        """Test listing calls Ollama directly and reports a refused connection as 503."""
+        # Arrange
+        async def probe(timeout=None):
+            raise AssertionError("No reachability probe expected")
+        
+        async def refuse(*args, **kwargs):
+            raise httpx.ConnectError("Connection refused")
+        
+        monkeypatch.setattr(ollama_client, 'is_reachable', probe)
+        monkeypatch.setattr(ollama_client, 'request', refuse)
+        
+        # Act
+        response = await test_client.get("/api/models/list")
+        
+        # Assert
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Failed to connect to Ollama service"}
+
+
+@pytest.mark.integration
+class TestPullTasksAPI:
+    """Integration tests for listing model pull tasks."""
+    
+    async def test_list_pull_tasks_matches_status_schema(self, test_client: AsyncClient, monkeypatch):
+        """Test listed tasks keep the PullTaskStatus fields and ISO timestamps."""
+        from datetime import datetime
+        from app.api.routes import models as models_routes
+        from app.services.pull_task_manager import PullTask
+        
+        # Arrange
+        task = PullTask(task_id='task-1', model_name='llama2', status='running', created_at=datetime(2024, 1, 15, 10, 30))
+        monkeypatch.setattr(models_routes.pull_manager, 'get_pull_tasks_page', lambda limit, cursor, status: ([task], None))
+        
+        # Act
+        response = await test_client.get("/api/models/pull")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            'task-1': {
+                'task_id': 'task-1',
+                'model_name': 'llama2',
+                'status': 'running',
+                'progress': None,
+                'error': None,
+                'created_at': '2024-01-15T10:30:00',
+                'started_at': None,
+                'completed_at': None
+            }
+        }
+    
+    async def test_pull_task_page_is_capped_and_wrapped(self, test_client: AsyncClient, monkeypatch):
+        """Test the paged listing applies the default cap and returns the page shape."""
+        from datetime import datetime
+        from app.api.routes import models as models_routes
+        from app.services.pull_task_manager import PullTask
+        
+        # Arrange
+        task = PullTask(task_id='task-1', model_name='llama2', status='running', created_at=datetime(2024, 1, 15, 10, 30))
+        calls = []
+        
+        def fake_page(limit, cursor, status):
+            calls.append((limit, cursor, status))
+            return [task], 'task-1'
+        
+        monkeypatch.setattr(models_routes.pull_manager, 'get_pull_tasks_page', fake_page)
+        
+        # Act
+        response = await test_client.get("/api/models/pull/page", params={"status": "running"})
+        
+        # Assert
+        assert response.status_code == 200
+        assert calls == [(models_routes._PULL_TASKS_PAGE_SIZE, None, 'running')]
+        data = response.json()
+        assert list(data["tasks"]) == ['task-1']
+        assert data["next_cursor"] == 'task-1'
+    
+    async def test_get_pull_status_serializes_timestamps(self, test_client: AsyncClient, monkeypatch):
+        """Test a single task is returned with ISO timestamps."""
+        from datetime import datetime
+        from app.api.routes import models as models_routes
+        from app.services.pull_task_manager import PullTask
+        
+        # Arrange
+        task = PullTask(task_id='task-1', model_name='llama2', status='completed',
+                        created_at=datetime(2024, 1, 15, 10, 30), completed_at=datetime(2024, 1, 15, 10, 31, 5, 250000))
+        monkeypatch.setattr(models_routes.pull_manager, 'get_pull_task', lambda task_id: task)
+        
+        # Act
+        response = await test_client.get("/api/models/pull/task-1")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.json()['created_at'] == '2024-01-15T10:30:00'
+        assert response.json()['completed_at'] == '2024-01-15T10:31:05.250000'
+    
+    async def test_pull_events_stream_ends_with_done(self, test_client: AsyncClient, monkeypatch):
+        """Test the SSE stream sends the current status, then a done event once the task is finished."""
+        from app.api.routes import models as models_routes
+        from app.services.pull_task_manager import PullTask
+        
+        # Arrange
+        task = PullTask(task_id='task-1', model_name='llama2', status='completed')
+        monkeypatch.setattr(models_routes.pull_manager, 'get_pull_task', lambda task_id: task)
+        
+        # Act
+        response = await test_client.get("/api/models/pull/task-1/events")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [line for line in response.text.splitlines() if line.startswith("event: ")]
+        assert events == ["event: status", "event: done"]
+    
+    async def test_pull_events_unknown_task_returns_404(self, test_client: AsyncClient):
+        """Test streaming events for a missing task is rejected."""
+        # Act
+        response = await test_client.get("/api/models/pull/missing/events")
+        
+        # Assert
+        assert response.status_code == 404
@@ -0,0 +1,69 @@
+"""
+Unit tests for the response compression middleware.
+"""
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+
+from app.middleware import SelectiveGZipMiddleware
+
+
+@pytest.fixture
+def client():
+    """Create a test client for an app with selective gzip enabled."""
+    app = FastAPI()
+    app.add_middleware(
+        SelectiveGZipMiddleware,
+        minimum_size=1024,
+        exclude_paths=('/stream',),
+    )
+
+    @app.get("/large")
+    async def large():
+        return {"data": "x" * 4096}
+
+    @app.get("/small")
+    async def small():
+        return {"data": "x"}
+
+    @app.websocket("/ws")
+    async def ws(websocket: WebSocket):
+        await websocket.accept()
+        await websocket.send_text("x" * 4096)
+        await websocket.close()
+
+    @app.get("/stream")
+    async def stream():
+        return {"data": "x" * 4096}
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestSelectiveGZipMiddleware:
+    """Test cases for SelectiveGZipMiddleware."""
+
+    def test_large_response_is_compressed(self, client):
+        """Test responses above the minimum size are gzip encoded."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.json() == {"data": "x" * 4096}
+
+    def test_small_response_is_not_compressed(self, client):
+        """Test responses below the minimum size are sent as-is."""
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_excluded_path_is_not_compressed(self, client):
+        """Test excluded streaming paths bypass compression."""
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"data": "x" * 4096}
+
+    def test_websocket_scope_passes_through(self, client):
+        """Test WebSocket connections are never routed through gzip."""
+        with client.websocket_connect("/ws") as websocket:
+            assert websocket.receive_text() == "x" * 4096
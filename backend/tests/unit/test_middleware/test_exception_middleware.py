@@ -0,0 +1,168 @@
+"""
+Unit tests for the exception-handling ASGI middleware.
+"""
+import logging
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+
+from app.core.exceptions import (
+    AppException,
+    AuthError,
+    NotFoundError,
+    StorageError,
+    ValidationError
+)
+from app.middleware import ExceptionASGIMiddleware
+from app.middleware import exceptions as exceptions_module
+
+
+def _build_app(exc: Exception) -> FastAPI:
+    """Build a minimal app whose only route raises the given exception."""
+    app = FastAPI()
+    app.add_middleware(ExceptionASGIMiddleware)
+
+    @app.get("/boom")
+    async def boom():
+        raise exc
+
+    @app.get("/ok")
+    async def ok():
+        return {"status": "ok"}
+
+    @app.websocket("/ws")
+    async def ws(websocket: WebSocket):
+        await websocket.accept()
+        await websocket.send_text(await websocket.receive_text())
+        await websocket.close()
+
+    return app
+
+
+@pytest.mark.unit
+class TestExceptionASGIMiddleware:
+    """Test cases for ExceptionASGIMiddleware."""
+
+    @pytest.mark.parametrize("exc, status_code", [
+        (ValidationError("bad input", field="name"), 400),
+        (NotFoundError("missing", resource_type="experiment", resource_id="x"), 404),
+        (StorageError("disk full", operation="save"), 500),
+        (AppException("generic failure"), 500),
+    ])
+    def test_app_exceptions_map_to_status(self, exc, status_code):
+        """Test application exceptions are converted to their status and body."""
+        client = TestClient(_build_app(exc))
+
+        response = client.get("/boom")
+
+        assert response.status_code == status_code
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == exc.to_dict()
+
+    def test_auth_error_status_depends_on_auth_type(self):
+        """Test AuthError maps to 401 for authentication and 403 otherwise."""
+        authn = TestClient(_build_app(AuthError("no token", auth_type="authentication")))
+        authz = TestClient(_build_app(AuthError("forbidden", auth_type="authorization")))
+
+        assert authn.get("/boom").status_code == 401
+        assert authz.get("/boom").status_code == 403
+
+    def test_unlisted_subclass_uses_nearest_base(self):
+        """Test subclasses of mapped exceptions inherit their base mapping."""
+        class MissingModelError(NotFoundError):
+            pass
+
+        client = TestClient(_build_app(MissingModelError("no such model")))
+
+        assert client.get("/boom").status_code == 404
+
+    def test_unexpected_exception_returns_generic_body(self):
+        """Test unknown exceptions are hidden behind a generic 500 response."""
+        client = TestClient(_build_app(RuntimeError("secret detail")))
+
+        response = client.get("/boom")
+
+        assert response.status_code == 500
+        assert response.json() == {
+            'error': 'INTERNAL_ERROR',
+            'message': 'An unexpected error occurred',
+            'details': {}
+        }
+
+    def test_successful_response_passes_through(self):
+        """Test responses are untouched when no exception is raised."""
+        client = TestClient(_build_app(RuntimeError("unused")))
+
+        response = client.get("/ok")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    def test_websocket_scope_passes_through(self):
+        """Test WebSocket connections bypass the middleware untouched."""
+        client = TestClient(_build_app(RuntimeError("unused")))
+
+        with client.websocket_connect("/ws") as websocket:
+            websocket.send_text("ping")
+            assert websocket.receive_text() == "ping"
+
+    def test_repeated_unexpected_errors_are_logged_once_per_window(self, monkeypatch):
+        """Test a burst of identical unexpected errors produces one log line."""
+        monkeypatch.setattr(exceptions_module, '_unexpected_seen', {})
+        logged = []
+        monkeypatch.setattr(
+            exceptions_module,
+            'log_with_context',
+            lambda _logger, level, *args, **fields: logged.append((level, fields))
+        )
+        client = TestClient(_build_app(RuntimeError("flaky upstream")))
+
+        for _ in range(3):
+            assert client.get("/boom").status_code == 500
+
+        assert len(logged) == 1
+        assert logged[0][0] == 'critical'
+
+        # Once the window has passed the suppressed count is reported
+        monkeypatch.setattr(exceptions_module, '_UNEXPECTED_LOG_WINDOW', 0.0)
+        client.get("/boom")
+
+        assert len(logged) == 2
+        assert logged[1][1]['suppressed'] == 2
+
+    def test_distinct_unexpected_errors_of_one_type_are_each_logged(self, monkeypatch):
+        """Test coalescing only suppresses identical repeats, not the whole type."""
+        monkeypatch.setattr(exceptions_module, '_unexpected_seen', {})
+        logged = []
+        monkeypatch.setattr(
+            exceptions_module,
+            'log_with_context',
+            lambda _logger, level, message, exc, **fields: logged.append(str(exc))
+        )
+
+        for message in ("disk quota exceeded", "connection reset", "disk quota exceeded"):
+            TestClient(_build_app(RuntimeError(message))).get("/boom")
+
+        assert logged == ["disk quota exceeded", "connection reset"]
+
+    def test_unexpected_error_is_logged_with_traceback(self, monkeypatch):
+        """Test unexpected errors keep their traceback in the log."""
+        # Arrange
+        monkeypatch.setattr(exceptions_module, '_unexpected_seen', {})
+        records = []
+        handler = logging.Handler(level=logging.CRITICAL)
+        handler.emit = records.append
+        exceptions_module.logger.addHandler(handler)
+        client = TestClient(_build_app(RuntimeError("broken handler")))
+
+        # Act
+        try:
+            client.get("/boom")
+        finally:
+            exceptions_module.logger.removeHandler(handler)
+
+        # Assert
+        assert len(records) == 1
+        assert records[0].exc_info is not None
+        assert records[0].exc_info[1].args == ("broken handler",)
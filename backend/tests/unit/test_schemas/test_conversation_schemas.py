@@ -0,0 +1,77 @@
+"""
+Unit tests for conversation schemas serialization.
+"""
+import pytest
+from app.schemas.conversation import CONVERSATION_LIST, Conversation, ConversationAgent, ConversationUpdate, Message
+from app.utils.case_converter import normalize_dict_to_snake
+
+
+@pytest.mark.unit
+class TestConversationSchemas:
+    """Test cases for conversation schema serialization."""
+    
+    def _conversation(self):
+        return Conversation(
+            id="conv-1",
+            title="Test",
+            agents=[ConversationAgent(id="a1", name="Agent", color="#fff", originalName="Agent", model="llama2")],
+            messages=[Message(id="m1", agentId="a1", content="hi", timestamp="2024-01-01T00:00:00")],
+            createdAt="2024-01-01T00:00:00",
+            importedAt="2024-01-01T00:00:00"
+        )
+    
+    def test_conversation_dump_keeps_api_names(self):
+        """Test that a plain dump keeps the camelCase API field names."""
+        data = self._conversation().model_dump()
+        
+        assert data["createdAt"] == "2024-01-01T00:00:00"
+        assert data["messages"][0]["agentId"] == "a1"
+        assert data["agents"][0]["originalName"] == "Agent"
+        assert "experiment_id" in data
+    
+    def test_conversation_accepts_snake_case_input(self):
+        """Test stored snake_case data validates back into the model."""
+        stored = self._conversation().model_dump(by_alias=False)
+        
+        conversation = Conversation.model_validate(stored)
+        
+        assert conversation.messages[0].agent_id == "a1"
+        assert conversation.created_at == "2024-01-01T00:00:00"
+    
+    def test_conversation_dump_by_name_matches_storage_format(self):
+        """Test that dumping by field name yields the snake_case storage keys."""
+        data = self._conversation().model_dump(by_alias=False)
+        
+        assert data == normalize_dict_to_snake(self._conversation().model_dump())
+        assert data["created_at"] == "2024-01-01T00:00:00"
+        assert data["imported_at"] == "2024-01-01T00:00:00"
+        assert data["messages"][0]["agent_id"] == "a1"
+        assert data["agents"][0]["original_name"] == "Agent"
+    
+    def test_list_adapter_matches_per_item_dumps(self):
+        """Test the precompiled list serializer dumps like model_dump per item."""
+        conversations = [self._conversation(), self._conversation()]
+        
+        data = CONVERSATION_LIST.dump_python(conversations)
+        
+        assert data == [conversation.model_dump() for conversation in conversations]
+
+
+@pytest.mark.unit
+class TestConversationUpdateSchema:
+    """Test cases for the partial conversation update payload schema."""
+    
+    def test_conversation_update_normalizes_top_level_keys(self):
+        """Test conversation updates dump snake_case keys for set fields only."""
+        update = ConversationUpdate.model_validate({
+            "title": "New",
+            "importedAt": "2024-01-01T00:00:00",
+            "experiment_id": "exp-1",
+            "unknownField": 1
+        })
+        
+        assert update.model_dump(exclude_unset=True) == {
+            "title": "New",
+            "imported_at": "2024-01-01T00:00:00",
+            "experiment_id": "exp-1"
+        }
@@ -3,7 +3,7 @@ Unit tests for experiment schemas validation.
 """
 import pytest
 from pydantic import ValidationError as PydanticValidationError
-from app.schemas.experiment import ExperimentRequest
+from app.schemas.experiment import ExperimentRequest, ExperimentUpdate
 from app.schemas.agent import AgentModel
 from app.schemas.task import TaskModel
 
@@ -249,3 +249,33 @@ class TestExperimentSchemas:
         
         assert request2.iterations == 100
 
+
+@pytest.mark.unit
+class TestUpdateSchemas:
+    """Test cases for the partial update payload schemas."""
+    
+    def test_experiment_update_keeps_only_updatable_fields(self):
+        """Test camelCase input is accepted and system fields are dropped."""
+        update = ExperimentUpdate.model_validate({
+            "id": "exp-1",
+            "title": "Renamed",
+            "completedAt": "2024-01-01T00:00:00",
+            "createdAt": "2020-01-01T00:00:00",
+            "agents": []
+        })
+        
+        assert update.model_dump(exclude_unset=True) == {
+            "title": "Renamed",
+            "completed_at": "2024-01-01T00:00:00"
+        }
+    
+    def test_experiment_update_accepts_snake_case(self):
+        """Test snake_case keys populate the same fields."""
+        update = ExperimentUpdate.model_validate({"status": "completed", "completed_at": "now"})
+        
+        assert update.model_dump(exclude_unset=True) == {"status": "completed", "completed_at": "now"}
+    
+    def test_experiment_update_rejects_wrong_types(self):
+        """Test malformed values are rejected before reaching storage."""
+        with pytest.raises(PydanticValidationError):
+            ExperimentUpdate.model_validate({"title": {"nested": True}})
@@ -209,3 +209,19 @@ class TestExperimentService:
         assert experiment_id1 in experiment_ids
         assert experiment_id2 in experiment_ids
 
+    
+    def test_list_experiment_summaries(self, sample_experiment_request, reset_state_manager):
+        """Test summaries are plain dicts carrying the agents dumped once per experiment."""
+        # Arrange
+        experiment_id = ExperimentService.create_experiment(sample_experiment_request)
+        
+        # Act
+        first = ExperimentService.list_experiment_summaries()
+        second = ExperimentService.list_experiment_summaries()
+        
+        # Assert
+        assert [summary['experiment_id'] for summary in first] == [experiment_id]
+        summary = first[0]
+        assert summary['agent_count'] == len(sample_experiment_request.agents)
+        assert summary['agents'] == [agent.model_dump() for agent in sample_experiment_request.agents]
+        assert second[0]['agents'] is summary['agents']
@@ -0,0 +1,251 @@
+"""
+Unit tests for the async Ollama client cache.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import ollama_client
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Route the shared client to an in-memory transport and reset caches."""
+    calls = {'tags': 0, 'fail': False, 'delay': 0.01}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if calls['fail']:
+            raise httpx.ConnectError("connection refused", request=request)
+        calls['tags'] += 1
+        # Yield so concurrent callers overlap with the in-flight request
+        await asyncio.sleep(calls['delay'])
+        return httpx.Response(200, json={'models': [{'name': 'llama2'}]})
+
+    client = httpx.AsyncClient(base_url='http://ollama', transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ollama_client, '_client', client)
+    monkeypatch.setattr(ollama_client, '_cache', {'tags': (0.0, None), 'version': (0.0, None)})
+    monkeypatch.setattr(ollama_client, '_cache_locks', {'tags': asyncio.Lock(), 'version': asyncio.Lock()})
+    return calls
+
+
+@pytest.mark.unit
+class TestOllamaClientCache:
+    """Test cases for the tags/version TTL cache."""
+
+    async def test_concurrent_misses_share_one_request(self, upstream):
+        """Test concurrent callers trigger a single upstream refresh."""
+        results = await asyncio.gather(*(ollama_client.get_tags() for _ in range(5)))
+
+        assert upstream['tags'] == 1
+        assert all(r == [{'name': 'llama2'}] for r in results)
+
+    async def test_expired_entry_is_refreshed(self, upstream, monkeypatch):
+        """Test an entry older than the TTL is fetched again."""
+        await ollama_client.get_tags()
+        monkeypatch.setattr(ollama_client, '_tags_cache_ttl', 0.0)
+
+        await ollama_client.get_tags()
+
+        assert upstream['tags'] == 2
+
+    async def test_stale_value_returned_on_error(self, upstream, monkeypatch):
+        """Test the last good value is served when the upstream fails."""
+        await ollama_client.get_tags()
+        monkeypatch.setattr(ollama_client, '_tags_cache_ttl', 0.0)
+        upstream['fail'] = True
+
+        assert await ollama_client.get_tags() == [{'name': 'llama2'}]
+
+    async def test_slow_refresh_times_out_to_stale_value(self, upstream, monkeypatch):
+        """Test a hung upstream is abandoned after the refresh timeout."""
+        await ollama_client.get_tags()
+        monkeypatch.setattr(ollama_client, '_tags_cache_ttl', 0.0)
+        monkeypatch.setattr(ollama_client, '_cache_refresh_timeout', 0.05)
+        upstream['delay'] = 5
+
+        assert await ollama_client.get_tags() == [{'name': 'llama2'}]
+
+    async def test_refresh_waits_for_a_longer_caller_timeout(self, upstream, monkeypatch):
+        """Test the refresh bound never cuts a caller's own timeout short."""
+        monkeypatch.setattr(ollama_client, '_cache_refresh_timeout', 0.01)
+        upstream['delay'] = 0.1
+
+        assert await ollama_client.get_tags(timeout=1) == [{'name': 'llama2'}]
+
+    async def test_refresh_timeout_without_cache_raises_httpx_timeout(self, upstream, monkeypatch):
+        """Test a timed-out refresh surfaces as an httpx timeout, not a bare TimeoutError."""
+        monkeypatch.setattr(ollama_client, '_cache_refresh_timeout', 0.05)
+        upstream['delay'] = 5
+
+        with pytest.raises(httpx.TimeoutException):
+            await ollama_client.get_tags()
+
+    async def test_error_without_cache_raises(self, upstream):
+        """Test upstream errors propagate when nothing is cached."""
+        upstream['fail'] = True
+
+        with pytest.raises(httpx.ConnectError):
+            await ollama_client.get_tags()
+
+
+@pytest.mark.unit
+class TestOllamaClientLifecycle:
+    """Test cases for the shared client lifecycle."""
+
+    async def test_aclose_closes_and_resets_client(self, upstream):
+        """Test aclose() closes the shared client and allows a fresh one later."""
+        client = ollama_client._client
+
+        await ollama_client.aclose()
+
+        assert client.is_closed
+        assert ollama_client._client is None
+        # A second close is a no-op
+        await ollama_client.aclose()
+
+
+@pytest.mark.unit
+class TestOllamaClientRequest:
+    """Test cases for plain requests on the shared client."""
+
+    async def test_error_status_is_returned_not_raised(self, monkeypatch):
+        """Test an Ollama error response reaches the caller unchanged."""
+        # Arrange
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, text=f"model {request.url.params['name']} not found")
+
+        client = httpx.AsyncClient(base_url='http://ollama', transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(ollama_client, '_client', client)
+
+        # Act
+        response = await ollama_client.request('GET', '/api/show', params={'name': 'llama2'})
+
+        # Assert
+        assert response.status_code == 404
+        assert response.text == "model llama2 not found"
+
+
+@pytest.mark.unit
+class TestOllamaReachability:
+    """Test cases for the cached reachability check."""
+
+    @pytest.fixture
+    def version_upstream(self, monkeypatch):
+        """Count /api/version probes against an in-memory transport."""
+        calls = {'version': 0, 'fail': False, 'status': 200}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if calls['fail']:
+                raise httpx.ConnectError("connection refused", request=request)
+            if request.url.path != '/api/version':
+                return httpx.Response(calls['status'])
+            if request.url.path == '/api/version':
+                calls['version'] += 1
+            return httpx.Response(200, json={'version': '0.1.0'})
+
+        client = httpx.AsyncClient(base_url='http://ollama', transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(ollama_client, '_client', client)
+        monkeypatch.setattr(ollama_client, '_reachability', (0.0, False))
+        return calls
+
+    async def test_recent_answer_is_reused(self, version_upstream):
+        """Test repeated checks within the TTL probe Ollama once."""
+        # Act
+        results = [await ollama_client.is_reachable() for _ in range(3)]
+
+        # Assert
+        assert results == [True, True, True]
+        assert version_upstream['version'] == 1
+
+    async def test_concurrent_checks_share_one_probe(self, version_upstream):
+        """Test checks that miss the cache together probe Ollama once."""
+        # Act
+        results = await asyncio.gather(*(ollama_client.is_reachable() for _ in range(5)))
+
+        # Assert
+        assert results == [True] * 5
+        assert version_upstream['version'] == 1
+
+    async def test_server_error_forces_a_new_probe(self, version_upstream):
+        """Test a 5xx answer from Ollama makes the next check probe again."""
+        # Arrange
+        await ollama_client.is_reachable()
+        version_upstream['status'] = 500
+
+        # Act
+        response = await ollama_client.request('GET', '/api/tags')
+        await ollama_client.is_reachable()
+
+        # Assert
+        assert response.status_code == 500
+        assert version_upstream['version'] == 2
+
+    async def test_transport_error_forces_a_new_probe(self, version_upstream):
+        """Test a failed request makes the next check probe again."""
+        # Arrange
+        assert await ollama_client.is_reachable() is True
+        version_upstream['fail'] = True
+
+        # Act
+        with pytest.raises(httpx.ConnectError):
+            await ollama_client.request('GET', '/api/tags')
+        reachable = await ollama_client.is_reachable()
+
+        # Assert
+        assert reachable is False
+
+
+@pytest.mark.unit
+class TestOllamaClientStream:
+    """Test cases for streaming requests to Ollama."""
+
+    @pytest.fixture
+    def generate_upstream(self, monkeypatch):
+        """Answer /api/generate with a configurable status and a two-chunk body."""
+        state = {'status': 200}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(state['status'], content=b'{"response":"a"}\n{"response":"b"}\n')
+
+        client = httpx.AsyncClient(base_url='http://ollama', transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(ollama_client, '_client', client)
+        monkeypatch.setattr(ollama_client, '_SEMAPHORE', asyncio.Semaphore(1))
+        monkeypatch.setattr(ollama_client, '_STREAM_SEMAPHORE', asyncio.Semaphore(1))
+        return state
+
+    async def test_body_is_streamed_and_slot_released(self, generate_upstream):
+        """Test the body chunks are yielded and the concurrency slot freed afterwards."""
+        # Act
+        resp, chunks, _ = await ollama_client.open_stream('/api/generate', json_body={'model': 'llama2'})
+        body = b''.join([chunk async for chunk in chunks])
+
+        # Assert
+        assert resp.status_code == 200
+        assert body == b'{"response":"a"}\n{"response":"b"}\n'
+        assert not ollama_client._STREAM_SEMAPHORE.locked()
+
+    async def test_close_releases_slot_without_reading(self, generate_upstream):
+        """Test an error response can be closed early without leaking the slot."""
+        # Arrange
+        generate_upstream['status'] = 404
+
+        # Act
+        resp, _, close = await ollama_client.open_stream('/api/generate', json_body={'model': 'missing'})
+        await close()
+
+        # Assert
+        assert resp.status_code == 404
+        assert not ollama_client._STREAM_SEMAPHORE.locked()
+
+    async def test_open_streams_do_not_block_short_requests(self, generate_upstream):
+        """Test a request still goes through while every stream slot is taken."""
+        # Arrange
+        _, _, close = await ollama_client.open_stream('/api/generate', json_body={'model': 'llama2'})
+
+        # Act
+        response = await asyncio.wait_for(ollama_client.request('GET', '/api/tags'), timeout=1)
+        await close()
+
+        # Assert
+        assert response.status_code == 200
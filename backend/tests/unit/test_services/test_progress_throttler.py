@@ -0,0 +1,64 @@
+"""
+Unit tests for the pull progress throttler.
+"""
+import time
+
+import pytest
+
+from app.services.progress_throttler import ProgressThrottler
+
+
+@pytest.mark.unit
+class TestProgressThrottler:
+    """Test cases for deciding which pull progress updates are emitted."""
+
+    def test_byte_ticks_within_throttle_window_are_dropped(self):
+        """Test repeated updates for the same layer are rate limited."""
+        # Arrange
+        throttler = ProgressThrottler()
+        progress = {'status': 'pulling abc', 'total': 1000, 'completed': 10}
+
+        # Act
+        emit = throttler.should_emit_progress(progress, time.time(), None, 'pulling abc')
+
+        # Assert
+        assert emit is False
+
+    def test_status_transition_is_always_emitted(self):
+        """Test a new Ollama status is forwarded even right after an emission."""
+        # Arrange
+        throttler = ProgressThrottler()
+
+        # Act
+        emit = throttler.should_emit_progress(
+            {'status': 'verifying sha256 digest'}, time.time(), None, 'pulling abc'
+        )
+
+        # Assert
+        assert emit is True
+
+    def test_finished_layer_is_always_emitted(self):
+        """Test the update that completes a layer is forwarded."""
+        # Arrange
+        throttler = ProgressThrottler()
+        progress = {'status': 'pulling abc', 'total': 1000, 'completed': 1000}
+
+        # Act
+        emit = throttler.should_emit_progress(progress, time.time(), None, 'pulling abc')
+
+        # Assert
+        assert emit is True
+
+    def test_percent_delta_waits_for_minimum_interval(self):
+        """Test large percent jumps are still capped by the minimum interval."""
+        # Arrange
+        throttler = ProgressThrottler()
+        progress = {'status': 'pulling abc', 'percent': 50}
+
+        # Act
+        too_soon = throttler.should_emit_progress(progress, time.time(), 10.0, 'pulling abc')
+        later = throttler.should_emit_progress(progress, time.time() - 0.2, 10.0, 'pulling abc')
+
+        # Assert
+        assert too_soon is False
+        assert later is True
@@ -0,0 +1,160 @@
+"""
+Unit tests for the pull task manager.
+"""
+import asyncio
+
+import pytest
+
+from app.services.pull_task_manager import PullTaskManager
+
+
+@pytest.fixture
+def manager(monkeypatch, temp_dir):
+    """Create a manager that persists to a temporary directory and runs no cleanup thread."""
+    monkeypatch.setattr('app.services.pull_persistence.settings.data_directory', temp_dir)
+    return PullTaskManager(start_cleanup=False)
+
+
+@pytest.mark.unit
+class TestPullTasksForModel:
+    """Test cases for looking up pull tasks by model name."""
+
+    def test_returns_only_tasks_for_the_model(self, manager):
+        """Test tasks are found by model name."""
+        # Arrange
+        first = manager.create_pull_task('llama2')
+        second = manager.create_pull_task('llama2')
+        manager.create_pull_task('mistral')
+
+        # Act
+        tasks = manager.get_pull_tasks_for_model('llama2')
+
+        # Assert
+        assert sorted(task.task_id for task in tasks) == sorted([first, second])
+        assert manager.get_pull_tasks_for_model('unknown') == []
+
+    def test_latest_task_is_the_last_created(self, manager):
+        """Test the newest task for a model is found without comparing timestamps."""
+        # Arrange
+        manager.create_pull_task('llama2')
+        latest = manager.create_pull_task('llama2')
+
+        # Act
+        task = manager.get_latest_pull_task_for_model('llama2')
+
+        # Assert
+        assert task.task_id == latest
+        assert manager.get_latest_pull_task_for_model('unknown') is None
+
+    def test_removed_task_leaves_the_index(self, manager):
+        """Test a removed task is no longer returned for its model."""
+        # Arrange
+        task_id = manager.create_pull_task('llama2')
+
+        # Act
+        manager.remove_pull_task(task_id)
+
+        # Assert
+        assert manager.get_pull_tasks_for_model('llama2') == []
+
+
+@pytest.mark.unit
+class TestPullTasksPage:
+    """Test cases for paging through pull tasks."""
+
+    def test_pages_follow_creation_order(self, manager):
+        """Test limit and cursor walk the tasks without repeats."""
+        # Arrange
+        task_ids = [manager.create_pull_task(f'model-{i}') for i in range(5)]
+
+        # Act
+        first, cursor = manager.get_pull_tasks_page(limit=2)
+        second, next_cursor = manager.get_pull_tasks_page(limit=2, cursor=cursor)
+        last, end = manager.get_pull_tasks_page(limit=2, cursor=next_cursor)
+
+        # Assert
+        assert [t.task_id for t in first + second + last] == task_ids
+        assert end is None
+
+    def test_status_filter(self, manager):
+        """Test only tasks with the requested status are returned."""
+        # Arrange
+        stale = manager.create_pull_task('llama2')
+        manager.create_pull_task('mistral')
+        manager.mark_task_stale(stale)
+
+        # Act
+        tasks, _ = manager.get_pull_tasks_page(status='error')
+
+        # Assert
+        assert [t.task_id for t in tasks] == [stale]
+
+
+@pytest.mark.unit
+class TestProgressCallbacks:
+    """Test cases for progress listener registration."""
+
+    def test_unregistering_one_callback_keeps_the_others(self, manager):
+        """Test one listener leaving does not detach other listeners of the task."""
+        # Arrange
+        task_id = manager.create_pull_task('llama2')
+        received = []
+        first = lambda tid, progress: received.append('first')
+        second = lambda tid, progress: received.append('second')
+        manager.register_progress_callback(task_id, first)
+        manager.register_progress_callback(task_id, second)
+
+        # Act
+        manager.unregister_progress_callback(task_id, first)
+        manager.update_progress(task_id, {'status': 'pulling manifest'})
+
+        # Assert
+        assert received == ['second']
+
+
+@pytest.mark.unit
+class TestCompletionEvent:
+    """Test cases for waiting on a pull task to finish."""
+
+    async def test_event_is_set_when_task_stops_being_active(self, manager):
+        """Test the event wakes waiters once the task is marked finished."""
+        # Arrange
+        task_id = manager.create_pull_task('llama2')
+        event = manager.get_completion_event(task_id)
+
+        # Act
+        assert not event.is_set()
+        manager.mark_task_stale(task_id)
+        await asyncio.wait_for(event.wait(), timeout=1)
+
+        # Assert
+        assert event.is_set()
+
+    async def test_finished_or_unknown_task_returns_set_event(self, manager):
+        """Test no waiting is needed for a task that is already done."""
+        # Arrange
+        task_id = manager.create_pull_task('llama2')
+        manager.mark_task_stale(task_id)
+
+        # Act / Assert
+        assert manager.get_completion_event(task_id).is_set()
+        assert manager.get_completion_event('missing').is_set()
+
+
+@pytest.mark.unit
+class TestTaskHealth:
+    """Test cases for pull task health reporting."""
+
+    def test_progress_age_uses_monotonic_clock(self, manager, monkeypatch):
+        """Test the last-update age is measured from the monotonic timestamp."""
+        # Arrange
+        task_id = manager.create_pull_task('llama2')
+        manager.update_progress(task_id, {'status': 'pulling manifest'})
+        updated_at = manager.get_pull_task(task_id).last_progress_monotonic
+        monkeypatch.setattr('app.services.pull_task_manager.time.monotonic', lambda: updated_at + 90)
+
+        # Act
+        health = manager.get_task_health(task_id)
+
+        # Assert
+        assert health['last_progress_age_seconds'] == 90
@@ -0,0 +1,219 @@
+"""
+Unit tests for AsyncStorage.
+"""
+import asyncio
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+from app.storage import AsyncStorage, UnifiedStorage, get_async_storage
+
+
+@pytest.mark.unit
+class TestAsyncStorage:
+    """Test cases for the async storage facade."""
+    
+    async def test_round_trips_experiment(self, temp_storage, sample_experiment):
+        """Test experiments saved through the facade can be read back."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        
+        # Act
+        saved = await storage.save_experiment(sample_experiment)
+        loaded = await storage.get_experiment(sample_experiment['id'])
+        
+        # Assert
+        assert saved is True
+        assert loaded['id'] == sample_experiment['id']
+    
+    def test_get_async_storage_shares_one_facade(self, temp_storage, monkeypatch):
+        """Test repeated lookups for the same backend return the same facade."""
+        # Arrange
+        monkeypatch.setattr('app.storage.get_storage', lambda: temp_storage)
+        
+        # Act
+        first = get_async_storage()
+        second = get_async_storage()
+        
+        # Assert
+        assert first is second
+        assert first.storage is temp_storage
+    
+    async def test_unused_backend_is_not_kept_alive(self, temp_dir, sample_experiment, monkeypatch):
+        """Test the facade and write batcher caches do not pin a dropped backend."""
+        # Arrange
+        backend = UnifiedStorage(str(temp_dir))
+        backend_ref = weakref.ref(backend)
+        monkeypatch.setattr('app.storage.get_storage', lambda: backend_ref())
+        facade = get_async_storage()
+        await facade.save_experiment(sample_experiment)
+        
+        # Act
+        del facade, backend
+        gc.collect()
+        
+        # Assert
+        assert backend_ref() is None
+    
+    async def test_calls_run_off_the_event_loop_thread(self, temp_storage, monkeypatch):
+        """Test backend methods execute in a worker thread."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        calling_threads = []
+        
+        def fake_get_conversations(source=None):
+            calling_threads.append(threading.current_thread())
+            return []
+        
+        monkeypatch.setattr(temp_storage, 'get_conversations', fake_get_conversations)
+        
+        # Act
+        result = await storage.get_conversations()
+        
+        # Assert
+        assert result == []
+        assert calling_threads[0] is not threading.main_thread()
+    
+    async def test_delete_conversations_batch(self, temp_storage, sample_conversation):
+        """Test several imported conversations are deleted in one call."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        for conversation_id in ('conv-1', 'conv-2', 'conv-3'):
+            await storage.save_conversation(dict(sample_conversation, id=conversation_id))
+        
+        # Act
+        deleted = await storage.delete_conversations(['conv-1', 'conv-3', 'missing'])
+        
+        # Assert
+        assert deleted == 2
+        remaining = await storage.get_conversations()
+        assert [conversation['id'] for conversation in remaining] == ['conv-2']
+    
+    def test_delete_experiment_cascade_blocks_conversation_writes(self, temp_storage, sample_experiment, monkeypatch):
+        """Test conversation writes for the experiment wait until the cascade finishes."""
+        # Arrange
+        experiment_id = sample_experiment['id']
+        temp_storage.save_experiment(sample_experiment)
+        listing_started = threading.Event()
+        order = []
+        list_conversations = temp_storage.conversation_storage.get_experiment_conversations
+        
+        def slow_listing(exp_id):
+            listing_started.set()
+            time.sleep(0.2)
+            order.append('cascade')
+            return list_conversations(exp_id)
+        
+        monkeypatch.setattr(temp_storage.conversation_storage, 'get_experiment_conversations', slow_listing)
+        cascade = threading.Thread(target=temp_storage.delete_experiment_cascade, args=(experiment_id,))
+        
+        # Act
+        cascade.start()
+        listing_started.wait()
+        temp_storage.save_experiment_conversation(experiment_id, 1, 'Run 1', {'messages': []})
+        order.append('write')
+        cascade.join()
+        
+        # Assert
+        assert order == ['cascade', 'write']
+    
+    async def test_concurrent_get_experiment_shares_one_read(self, temp_storage, sample_experiment, monkeypatch):
+        """Test simultaneous reads of the same experiment hit the backend once."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        temp_storage.save_experiment(sample_experiment)
+        reads = []
+        read_experiment = temp_storage.experiment_storage.get_experiment
+        
+        def counting_get_experiment(experiment_id):
+            reads.append(experiment_id)
+            time.sleep(0.05)
+            return read_experiment(experiment_id)
+        
+        monkeypatch.setattr(temp_storage.experiment_storage, 'get_experiment', counting_get_experiment)
+        
+        # Act
+        results = await asyncio.gather(*[storage.get_experiment(sample_experiment['id']) for _ in range(5)])
+        
+        # Assert
+        assert len(reads) == 1
+        assert all(result['id'] == sample_experiment['id'] for result in results)
+    
+    async def test_concurrent_get_experiment_batches_different_ids(self, temp_storage, sample_experiment, monkeypatch):
+        """Test reads of different experiments in one window share a worker call."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        for index in range(3):
+            temp_storage.save_experiment({**sample_experiment, 'id': f'batched-{index}'})
+        batches = []
+        read_experiments = temp_storage.get_experiments_by_ids
+        
+        def counting_get_experiments_by_ids(experiment_ids):
+            batches.append(sorted(experiment_ids))
+            return read_experiments(experiment_ids)
+        
+        monkeypatch.setattr(temp_storage, 'get_experiments_by_ids', counting_get_experiments_by_ids)
+        
+        # Act
+        results = await asyncio.gather(*[
+            storage.get_experiment(experiment_id)
+            for experiment_id in ['batched-0', 'batched-1', 'batched-2', 'missing-id']
+        ])
+        
+        # Assert
+        assert batches == [['batched-0', 'batched-1', 'batched-2', 'missing-id']]
+        assert [result['id'] for result in results[:3]] == ['batched-0', 'batched-1', 'batched-2']
+        assert results[3] is None
+    
+    async def test_get_experiment_after_update_does_not_join_earlier_read(self, temp_storage, sample_experiment):
+        """Test a read issued after an update is not served by a read started before it."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        await storage.save_experiment(sample_experiment)
+        stale_read = asyncio.ensure_future(storage.get_experiment(sample_experiment['id']))
+        await asyncio.sleep(0)
+        
+        # Act
+        await storage.update_experiment(sample_experiment['id'], {'title': 'Renamed'})
+        fresh = await storage.get_experiment(sample_experiment['id'])
+        await stale_read
+        
+        # Assert
+        assert fresh['title'] == 'Renamed'
+    
+    async def test_get_experiment_with_conversations(self, temp_storage, sample_experiment):
+        """Test an experiment and its conversations are read in one call."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        experiment_id = sample_experiment['id']
+        await storage.save_experiment(sample_experiment)
+        temp_storage.save_experiment_conversation(experiment_id, 1, 'Run 1', {'messages': []})
+        
+        # Act
+        experiment, conversations = await storage.get_experiment_with_conversations(experiment_id)
+        missing = await storage.get_experiment_with_conversations('missing-id')
+        
+        # Assert
+        assert experiment['id'] == experiment_id
+        assert len(conversations) == 1
+        assert missing == (None, [])
+    
+    async def test_delete_experiment_cascade(self, temp_storage, sample_experiment):
+        """Test an experiment and its conversations are removed together."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        experiment_id = sample_experiment['id']
+        await storage.save_experiment(sample_experiment)
+        temp_storage.save_experiment_conversation(experiment_id, 1, 'Run 1', {'messages': []})
+        temp_storage.save_experiment_conversation(experiment_id, 2, 'Run 2', {'messages': []})
+        
+        # Act
+        deleted = await storage.delete_experiment_cascade(experiment_id)
+        
+        # Assert
+        assert deleted == 2
+        assert await storage.get_experiment(experiment_id) is None
+        assert await storage.get_experiment_conversations(experiment_id) == []
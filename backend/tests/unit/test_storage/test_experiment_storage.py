@@ -4,6 +4,7 @@ Unit tests for ExperimentStorage.
 import pytest
 import json
 from unittest.mock import patch, MagicMock
+from app.storage.base import ListOptions
 from app.storage.experiment_storage import ExperimentStorage
 from app.core.exceptions import StorageError
 
@@ -86,6 +87,46 @@ class TestExperimentStorage:
         assert sample_experiment['id'] in experiment_ids
         assert 'experiment-2' in experiment_ids
     
+    def test_get_experiments_with_list_options(self, temp_dir, sample_experiment):
+        """Test storage excludes, sorts newest first and pages by cursor."""
+        # Arrange
+        storage = ExperimentStorage(temp_dir)
+        for index in range(4):
+            experiment = sample_experiment.copy()
+            experiment['id'] = f'experiment-{index}'
+            experiment['created_at'] = f'2024-01-0{index + 1}T00:00:00'
+            storage.save_experiment(experiment)
+        
+        # Act
+        first_page = storage.get_experiments(ListOptions(exclude_ids=frozenset({'experiment-3'}), limit=2))
+        second_page = storage.get_experiments(ListOptions(
+            exclude_ids=frozenset({'experiment-3'}),
+            limit=2,
+            cursor=first_page[-1]['id']
+        ))
+        
+        # Assert
+        assert [exp['id'] for exp in first_page] == ['experiment-2', 'experiment-1']
+        assert [exp['id'] for exp in second_page] == ['experiment-0']
+    
+    def test_get_experiments_with_deleted_cursor_returns_empty_page(self, temp_dir, sample_experiment):
+        """Test a cursor whose experiment was deleted does not restart at the first page."""
+        # Arrange
+        storage = ExperimentStorage(temp_dir)
+        for index in range(3):
+            experiment = sample_experiment.copy()
+            experiment['id'] = f'experiment-{index}'
+            experiment['created_at'] = f'2024-01-0{index + 1}T00:00:00'
+            storage.save_experiment(experiment)
+        first_page = storage.get_experiments(ListOptions(limit=2))
+        storage.delete_experiment(first_page[-1]['id'])
+        
+        # Act
+        next_page = storage.get_experiments(ListOptions(limit=2, cursor=first_page[-1]['id']))
+        
+        # Assert
+        assert next_page == []
+    
     def test_update_experiment_success(self, temp_dir, sample_experiment):
         """Test successful experiment update."""
         # Arrange
@@ -0,0 +1,122 @@
+"""
+Unit tests for the storage read cache.
+"""
+import pytest
+
+from app.storage import AsyncStorage
+from app.storage.read_cache import MISS, ReadCache
+
+
+@pytest.mark.unit
+class TestReadCache:
+    """Test cases for ReadCache."""
+    
+    def test_get_returns_cached_value(self):
+        """Test a stored value is returned until it expires."""
+        cache = ReadCache(ttl=30, maxsize=10)
+        
+        cache.set(('conversation', 'c1'), {'id': 'c1'}, cache.generation)
+        
+        assert cache.get(('conversation', 'c1')) == {'id': 'c1'}
+        assert cache.get(('conversation', 'c2')) is MISS
+    
+    def test_expired_entries_miss(self, monkeypatch):
+        """Test entries older than the TTL are not served."""
+        cache = ReadCache(ttl=30, maxsize=10)
+        now = [1000.0]
+        monkeypatch.setattr('app.storage.read_cache.time.monotonic', lambda: now[0])
+        cache.set(('conversation', 'c1'), {'id': 'c1'}, cache.generation)
+        
+        now[0] += 31
+        
+        assert cache.get(('conversation', 'c1')) is MISS
+    
+    def test_evicts_least_recently_used(self):
+        """Test the cache never holds more than maxsize entries."""
+        cache = ReadCache(ttl=30, maxsize=2)
+        cache.set(('conversation', 'a'), 1, cache.generation)
+        cache.set(('conversation', 'b'), 2, cache.generation)
+        cache.get(('conversation', 'a'))
+        
+        cache.set(('conversation', 'c'), 3, cache.generation)
+        
+        assert cache.get(('conversation', 'a')) == 1
+        assert cache.get(('conversation', 'b')) is MISS
+    
+    def test_invalidate_by_key_and_kind(self):
+        """Test invalidation drops one entry or a whole kind."""
+        cache = ReadCache(ttl=30, maxsize=10)
+        cache.set(('conversation', 'a'), 1, cache.generation)
+        cache.set(('conversation', 'b'), 2, cache.generation)
+        cache.set(('conversations', None), [1, 2], cache.generation)
+        
+        cache.invalidate('conversation', 'a')
+        assert cache.get(('conversation', 'a')) is MISS
+        assert cache.get(('conversation', 'b')) == 2
+        
+        cache.invalidate('conversations')
+        assert cache.get(('conversations', None)) is MISS
+        assert cache.get(('conversation', 'b')) == 2
+    
+    def test_set_after_invalidation_is_discarded(self):
+        """Test a value loaded before a concurrent write is not cached."""
+        cache = ReadCache(ttl=30, maxsize=10)
+        generation = cache.generation
+        
+        cache.invalidate('conversation', 'a')
+        cache.set(('conversation', 'a'), 'stale', generation)
+        
+        assert cache.get(('conversation', 'a')) is MISS
+
+
+@pytest.mark.unit
+class TestCachedStorageReads:
+    """Test cases for read-through caching on the async facade."""
+    
+    async def test_cached_loads_once(self, temp_storage):
+        """Test repeated reads of the same key only load once."""
+        storage = AsyncStorage(temp_storage)
+        calls = []
+        
+        async def load():
+            calls.append(1)
+            return ['value']
+        
+        first = await storage.cached(('conversations', None), load)
+        second = await storage.cached(('conversations', None), load)
+        
+        assert first == second == ['value']
+        assert len(calls) == 1
+    
+    async def test_write_invalidates_cached_read(self, temp_storage, sample_conversation):
+        """Test saving a conversation drops cached reads of it and of the list."""
+        storage = AsyncStorage(temp_storage)
+        conversation = dict(sample_conversation, id='conv-1')
+        await storage.save_conversation(dict(conversation))
+        
+        async def load_one():
+            return await storage.get_conversation('conv-1')
+        
+        async def load_all():
+            return await storage.get_conversations()
+        
+        assert (await storage.cached(('conversation', 'conv-1'), load_one))['title'] == conversation['title']
+        assert len(await storage.cached(('conversations', None), load_all)) == 1
+        
+        await storage.update_conversation('conv-1', {'title': 'Renamed'})
+        
+        assert (await storage.cached(('conversation', 'conv-1'), load_one))['title'] == 'Renamed'
+        assert (await storage.cached(('conversations', None), load_all))[0]['title'] == 'Renamed'
+    
+    async def test_experiment_conversation_save_invalidates(self, temp_storage):
+        """Test saving an experiment conversation drops that experiment's cached list."""
+        storage = AsyncStorage(temp_storage)
+        
+        async def load():
+            return await storage.get_experiment_conversations('exp-1')
+        
+        assert await storage.cached(('experiment_conversations', 'exp-1'), load) == []
+        
+        temp_storage.save_experiment_conversation('exp-1', 1, 'Run 1', {'messages': []})
+        
+        assert len(await storage.cached(('experiment_conversations', 'exp-1'), load)) == 1
@@ -0,0 +1,102 @@
+"""
+Unit tests for coalesced experiment writes.
+"""
+import asyncio
+
+import pytest
+
+from app.storage import AsyncStorage
+from app.storage.write_batcher import ExperimentWriteBatcher
+
+
+@pytest.mark.unit
+class TestExperimentWriteBatcher:
+    """Test cases for ExperimentWriteBatcher."""
+    
+    async def test_concurrent_writes_share_one_batch(self):
+        """Test writes submitted together reach storage in a single call."""
+        # Arrange
+        calls = []
+        
+        async def write(operations):
+            calls.append(list(operations))
+            return [True] * len(operations)
+        
+        batcher = ExperimentWriteBatcher(write, window=0.05)
+        
+        # Act
+        results = await asyncio.gather(*(
+            batcher.submit(('update', f'exp-{i}', {'status': 'completed'})) for i in range(5)
+        ))
+        await batcher.aclose()
+        
+        # Assert
+        assert results == [True] * 5
+        assert len(calls) == 1
+        assert [operation[1] for operation in calls[0]] == [f'exp-{i}' for i in range(5)]
+    
+    async def test_batch_size_is_bounded(self):
+        """Test no single storage call receives more than max_batch operations."""
+        # Arrange
+        sizes = []
+        
+        async def write(operations):
+            sizes.append(len(operations))
+            return [True] * len(operations)
+        
+        batcher = ExperimentWriteBatcher(write, max_batch=2, window=0.05)
+        
+        # Act
+        await asyncio.gather(*(batcher.submit(('save', {'id': str(i)})) for i in range(5)))
+        await batcher.aclose()
+        
+        # Assert
+        assert sizes == [2, 2, 1]
+    
+    async def test_errors_are_raised_to_their_caller_only(self):
+        """Test a failing operation raises for its caller while others succeed."""
+        # Arrange
+        async def write(operations):
+            return [ValueError('bad') if op[1] == 'bad' else True for op in operations]
+        
+        batcher = ExperimentWriteBatcher(write, window=0.05)
+        
+        # Act
+        good, bad = await asyncio.gather(
+            batcher.submit(('update', 'good', {})),
+            batcher.submit(('update', 'bad', {})),
+            return_exceptions=True
+        )
+        await batcher.aclose()
+        
+        # Assert
+        assert good is True
+        assert isinstance(bad, ValueError)
+    
+    async def test_storage_batch_updates_index_once(self, temp_storage, sample_experiment, monkeypatch):
+        """Test batched saves through the facade are all indexed with one index write."""
+        # Arrange
+        storage = AsyncStorage(temp_storage)
+        index_writes = []
+        original_write_index = temp_storage.experiment_storage.index.write_index
+        
+        def counting_write_index(entries):
+            index_writes.append(len(entries))
+            original_write_index(entries)
+        
+        monkeypatch.setattr(temp_storage.experiment_storage.index, 'write_index', counting_write_index)
+        experiments = [dict(sample_experiment, id=f'exp-{i}') for i in range(3)]
+        
+        # Act
+        results = await asyncio.gather(*(storage.save_experiment(exp) for exp in experiments))
+        
+        # Assert
+        assert results == [True, True, True]
+        assert index_writes == [3]
+        assert {exp['id'] for exp in await storage.get_experiments()} == {'exp-0', 'exp-1', 'exp-2'}
+    
+    async def test_update_missing_experiment_returns_false(self, temp_storage):
+        """Test updating an unknown experiment still reports not found."""
+        storage = AsyncStorage(temp_storage)
+        
+        assert await storage.update_experiment('missing', {'status': 'completed'}) is False
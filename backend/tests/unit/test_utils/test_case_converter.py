@@ -2,7 +2,12 @@
 Unit tests for case conversion utilities.
 """
 import pytest
-from app.utils.case_converter import camel_to_snake, snake_to_camel
+from app.utils.case_converter import (
+    camel_to_snake,
+    snake_to_camel,
+    normalize_dict_to_snake,
+    normalize_dict_to_camel
+)
 
 
 @pytest.mark.unit
@@ -140,3 +145,67 @@ class TestCaseConverter:
             # Assert
             assert snake_version == original, f"Round trip failed for: {original}"
 
+
+@pytest.mark.unit
+class TestNormalizeDict:
+    """Test cases for nested key normalization."""
+    
+    def test_normalize_nested_to_snake(self):
+        """Test that keys are converted at every nesting level."""
+        data = {
+            "experimentId": "exp-1",
+            "messages": [{"agentId": "a1", "modelInfo": {"modelName": "llama"}}],
+            "tags": ["keepAsIs"]
+        }
+        
+        result = normalize_dict_to_snake(data)
+        
+        assert result == {
+            "experiment_id": "exp-1",
+            "messages": [{"agent_id": "a1", "model_info": {"model_name": "llama"}}],
+            "tags": ["keepAsIs"]
+        }
+    
+    def test_normalize_nested_to_camel(self):
+        """Test that snake_case keys are converted at every nesting level."""
+        data = [{"created_at": "now", "agents": [{"agent_name": "x"}]}]
+        
+        result = normalize_dict_to_camel(data)
+        
+        assert result == [{"createdAt": "now", "agents": [{"agentName": "x"}]}]
+    
+    def test_normalize_shallow(self):
+        """Test that deep=False only converts top-level keys."""
+        data = {"outerKey": {"innerKey": 1}}
+        
+        result = normalize_dict_to_snake(data, deep=False)
+        
+        assert result == {"outer_key": {"innerKey": 1}}
+    
+    def test_normalize_reuses_unchanged_containers(self):
+        """Test that containers already in the target case are not rebuilt."""
+        unchanged = {"agent_id": "a1", "content": "hi"}
+        data = {"messageList": [unchanged]}
+        
+        result = normalize_dict_to_snake(data)
+        
+        assert result == {"message_list": [unchanged]}
+        assert result["message_list"][0] is unchanged
+        assert normalize_dict_to_snake(unchanged) is unchanged
+    
+    def test_normalize_primitives(self):
+        """Test that primitive values are returned unchanged."""
+        assert normalize_dict_to_snake("someValue") == "someValue"
+        assert normalize_dict_to_camel(None) is None
+    
+    def test_normalize_deeply_nested(self):
+        """Test that very deep nesting does not hit the recursion limit."""
+        data = {"leafValue": 1}
+        for _ in range(5000):
+            data = {"childNode": data}
+        
+        result = normalize_dict_to_snake(data)
+        
+        for _ in range(5000):
+            result = result["child_node"]
+        assert result == {"leaf_value": 1}
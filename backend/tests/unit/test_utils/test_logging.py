@@ -0,0 +1,126 @@
+"""
+Unit tests for queue-based structured logging.
+"""
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from app.utils.logging import (
+    _DroppingQueueHandler,
+    StructuredFormatter,
+    log_with_context,
+    set_experiment_context
+)
+
+
+def _make_record(msg: str, *args, exc_info=None) -> logging.LogRecord:
+    """Build a log record as a logger call would."""
+    return logging.LogRecord('test', logging.ERROR, __file__, 1, msg, args, exc_info)
+
+
+@pytest.mark.unit
+class TestDroppingQueueHandler:
+    """Test cases for the non-blocking queue handler."""
+
+    def test_drops_records_when_queue_full(self):
+        """Test a full queue drops new records instead of blocking."""
+        log_queue = queue.Queue(maxsize=1)
+        handler = _DroppingQueueHandler(log_queue)
+
+        handler.handle(_make_record("first"))
+        handler.handle(_make_record("second"))
+
+        assert log_queue.qsize() == 1
+        assert log_queue.get_nowait().getMessage() == "first"
+
+    def test_prepare_keeps_structured_fields(self):
+        """Test queued records keep extra fields, context and traceback."""
+        log_queue = queue.Queue()
+        handler = _DroppingQueueHandler(log_queue)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _make_record("value=%s", 42, exc_info=sys.exc_info())
+        record.extra_fields = {'path': '/api'}
+
+        set_experiment_context("exp-1")
+        try:
+            handler.handle(record)
+        finally:
+            set_experiment_context(None)
+
+        # Format outside the original context, as the listener thread would
+        queued = log_queue.get_nowait()
+        data = json.loads(StructuredFormatter().format(queued))
+
+        assert data['message'] == "value=42"
+        assert data['experiment_id'] == "exp-1"
+        assert data['path'] == '/api'
+        assert "ValueError: boom" in data['exception']
+        assert queued.exc_info is None
+
+
+class _Unformattable:
+    """Object whose string conversion fails, to detect eager formatting."""
+
+    def __str__(self):
+        raise AssertionError("message was formatted for a disabled level")
+
+
+class _ListHandler(logging.Handler):
+    """Handler that collects emitted records."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def captured_logger():
+    """Provide an isolated logger that records what it emits."""
+    logger = logging.getLogger('test.log_with_context')
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    yield logger, handler.records
+    logger.removeHandler(handler)
+    logger.propagate = True
+
+
+@pytest.mark.unit
+class TestLogWithContext:
+    """Test cases for log_with_context."""
+
+    def test_formats_args_and_extra_fields(self, captured_logger):
+        """Test template args are merged and extra fields attached."""
+        logger, records = captured_logger
+
+        log_with_context(logger, 'info', "saved %s", "exp-1", path='/api')
+
+        assert records[-1].getMessage() == "saved exp-1"
+        assert records[-1].extra_fields == {'path': '/api'}
+        assert records[-1].module == 'test_logging'
+
+    def test_disabled_level_skips_formatting(self, captured_logger):
+        """Test nothing is formatted or emitted below the logger level."""
+        logger, records = captured_logger
+
+        log_with_context(logger, 'debug', "value %s", _Unformattable())
+
+        assert records == []
+
+    def test_level_names_are_case_insensitive(self, captured_logger):
+        """Test upper-case level names resolve like the lower-case ones."""
+        logger, records = captured_logger
+
+        log_with_context(logger, 'WARNING', "disk low")
+        log_with_context(logger, 'warning', "disk low")
+
+        assert [record.levelno for record in records] == [logging.WARNING, logging.WARNING]
@@ -0,0 +1,66 @@
+"""
+Unit tests for timestamp helpers.
+"""
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.utils.timestamps import as_utc, timestamp_sort_key, utc_now, utc_now_iso
+
+
+@pytest.mark.unit
+class TestUtcNowIso:
+    """Test cases for utc_now_iso."""
+    
+    def test_returns_utc_iso_with_milliseconds(self):
+        """Test the timestamp is timezone-aware UTC with millisecond precision."""
+        # Act
+        value = utc_now_iso()
+        
+        # Assert
+        parsed = datetime.fromisoformat(value)
+        assert parsed.utcoffset() == timedelta(0)
+        assert value.endswith('+00:00')
+        assert len(value.split('.')[1]) == len('123+00:00')
+    
+    def test_values_sort_chronologically_as_strings(self):
+        """Test successive timestamps never sort before earlier ones."""
+        # Act
+        values = [utc_now_iso() for _ in range(50)]
+        
+        # Assert
+        assert values == sorted(values)
+
+
+@pytest.mark.unit
+class TestLegacyTimestamps:
+    """Test cases for comparing naive legacy timestamps with UTC ones."""
+    
+    def test_sort_key_orders_naive_local_and_utc_values_by_instant(self):
+        """Test a naive local timestamp sorts by the instant it names, not as text."""
+        # Arrange
+        now = utc_now()
+        legacy = (now - timedelta(minutes=1)).astimezone().replace(tzinfo=None).isoformat()
+        current = utc_now_iso()
+        
+        # Act
+        ordered = sorted([current, legacy], key=timestamp_sort_key)
+        
+        # Assert
+        assert ordered == [legacy, current]
+    
+    def test_sort_key_puts_missing_values_first(self):
+        """Test missing or malformed timestamps sort as oldest."""
+        assert timestamp_sort_key(None) == timestamp_sort_key('') == timestamp_sort_key('not a date') == 0.0
+    
+    def test_as_utc_reads_naive_values_as_local_time(self):
+        """Test naive datetimes become the same instant in aware UTC."""
+        # Arrange
+        local = datetime(2024, 1, 15, 10, 30)
+        
+        # Act
+        converted = as_utc(local)
+        
+        # Assert
+        assert converted.tzinfo is UTC
+        assert converted.timestamp() == local.timestamp()